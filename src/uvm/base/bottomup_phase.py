@@ -21,6 +21,7 @@
 #   the License for the specific language governing
 #   permissions and limitations under the License.
 #----------------------------------------------------------------------
+from time import perf_counter_ns
 from uvm.base.phase import uvm_phase
 from uvm.base.object_globals import uvm_phase_type, uvm_phase_state
 
@@ -49,12 +50,13 @@ class uvm_bottomup_phase(uvm_phase):
 
     # @uvm-ieee 1800.2-2017 auto 9.5.2.2
     def traverse(self, comp, phase, state):
+        for c in comp.m_get_postorder():
+            self.m_traverse_comp(c, phase, state)
+
+    def m_traverse_comp(self, comp, phase, state):
         from uvm.base.domain import uvm_domain
         phase_domain =phase.get_domain()
         comp_domain = comp.get_domain()
-        
-        for cn in comp.m_children.keys():
-            self.traverse(comp.m_children[cn], phase, state)
 
         if self.m_phase_trace:
             print("TODO: `uvm_info")
@@ -66,16 +68,20 @@ class uvm_bottomup_phase(uvm_phase):
             if state == uvm_phase_state.UVM_PHASE_STARTED: 
                 comp.m_current_phase = phase
                 comp.m_apply_verbosity_settings(phase)
-                comp.phase_started(phase)
+                if not comp.m_is_noop_phase_method("phase_started"):
+                    comp.phase_started(phase)
             elif state == uvm_phase_state.UVM_PHASE_EXECUTING: 
                 ph = self
                 if self in comp.m_phase_imps.keys():
                     ph = comp.m_phase_imps[self]
-                ph.execute(comp, phase)
+                if not comp.m_is_noop_phase_method(ph.m_phase_method):
+                    ph.execute(comp, phase)
             elif state == uvm_phase_state.UVM_PHASE_READY_TO_END: 
-                comp.phase_ready_to_end(phase)
+                if not comp.m_is_noop_phase_method("phase_ready_to_end"):
+                    comp.phase_ready_to_end(phase)
             elif state == uvm_phase_state.UVM_PHASE_ENDED: 
-                comp.phase_ended(phase)
+                if not comp.m_is_noop_phase_method("phase_ended"):
+                    comp.phase_ended(phase)
                 comp.m_current_phase = None
             else:
                 print("TODO: `uvm_fatal")
@@ -91,5 +97,11 @@ class uvm_bottomup_phase(uvm_phase):
 #        proc.srandom(uvm_create_random_seed(phase.get_type_name(), comp.get_full_name()));
 
         comp.m_current_phase = phase
-        self.exec_func(comp,phase)
+        profiler = uvm_phase.m_profiler
+        if profiler is None:
+            self.exec_func(comp,phase)
+        else:
+            start = perf_counter_ns()
+            self.exec_func(comp,phase)
+            profiler.record_func(phase, comp, start, perf_counter_ns())
 
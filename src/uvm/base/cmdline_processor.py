@@ -73,6 +73,21 @@ class uvm_cmd_line_verb():
 #
 # @uvm-accellera The details of this API are specific to the Accellera implementation, and are not being considered for contribution to 1800.2
 
+# Variable: +UVM_FACTORY_STATS
+#
+# ~+UVM_FACTORY_STATS~ turns on factory creation statistics, which are reported
+# during the report phase. ~+UVM_FACTORY_STATS=json~ reports them as JSON.
+#
+# @uvm-accellera The details of this API are specific to this implementation
+
+# Variable: +UVM_FACTORY_OVERRIDE_FILE
+#
+# ~+UVM_FACTORY_OVERRIDE_FILE=<file>~ applies the factory overrides listed in a
+# JSON or CSV file. See <uvm_default_factory::load_overrides> for the format.
+# The argument may be given more than once.
+#
+# @uvm-accellera The details of this API are specific to this implementation
+
 
 # @uvm-ieee 1800.2-2017 auto G.1
 uvm_cmdline_proc = None
@@ -25,7 +25,6 @@
 #----------------------------------------------------------------------
 from uvm.base.topdown_phase import uvm_topdown_phase
 from uvm.base.bottomup_phase import uvm_bottomup_phase
-import cocotb
 from uvm.base.task_phase import uvm_task_phase
 
 # Title -- NODOCS -- UVM Common Phases
@@ -75,6 +74,7 @@ class uvm_build_phase(uvm_topdown_phase):
     def exec_func(self, comp, phase):
         comp.build_phase(phase)
    
+    m_phase_method = "build_phase"
     m_inst = None
     # TODO: uvm_type_name_decl
 #   `uvm_type_name_decl("uvm_build_phase")
@@ -119,6 +119,7 @@ class uvm_connect_phase (uvm_bottomup_phase):
     def exec_func(self, comp, phase):
         comp.connect_phase(phase)
 
+    m_phase_method = "connect_phase"
     m_inst = None
     # TODO: uvm_type_name_decl
 #   `uvm_type_name_decl("uvm_connect_phase")
@@ -162,6 +163,7 @@ class uvm_end_of_elaboration_phase (uvm_bottomup_phase):
     def exec_func(self, comp, phase):
         comp.end_of_elaboration_phase(phase)
 
+    m_phase_method = "end_of_elaboration_phase"
     m_inst = None
     # TODO: uvm_type_name_decl
 #   `uvm_type_name_decl("uvm_end_of_elaboration_phase")
@@ -207,6 +209,7 @@ class uvm_start_of_simulation_phase (uvm_bottomup_phase):
     def exec_func(self, comp, phase):
         comp.start_of_simulation_phase(phase)
 
+    m_phase_method = "start_of_simulation_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_start_of_simulation_phase")
 
@@ -224,10 +227,10 @@ class uvm_start_of_simulation_phase (uvm_bottomup_phase):
 
 # @uvm-ieee 1800.2-2017 auto 9.8.1.5
 class uvm_run_phase (uvm_task_phase):
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.run_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.run_phase(phase)
 
+    m_phase_method = "run_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_run_phase")
 
@@ -248,6 +251,7 @@ class uvm_extract_phase (uvm_bottomup_phase):
     def exec_func(self, comp, phase):
         comp.extract_phase(phase)
 
+    m_phase_method = "extract_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_extract_phase")
 
@@ -267,6 +271,7 @@ class uvm_check_phase (uvm_bottomup_phase):
     def exec_func(self, comp, phase):
         comp.check_phase(phase)
 
+    m_phase_method = "check_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_check_phase")
 
@@ -286,6 +291,7 @@ class uvm_report_phase (uvm_bottomup_phase):
     def exec_func(self, comp, phase):
         comp.report_phase(phase)
         
+    m_phase_method = "report_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_report_phase")
 
@@ -324,6 +330,7 @@ class uvm_final_phase (uvm_topdown_phase):
     def exec_func(self, comp, phase):
         comp.final_phase(phase)
 
+    m_phase_method = "final_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_final_phase")
 
@@ -84,6 +84,10 @@ class uvm_component(uvm_report_object):
             
     m_uvm_applied_cl_action = []
     m_uvm_applied_cl_sev = []
+
+    # Bumped whenever a child is added anywhere in the hierarchy. Cached
+    # traversal orders built at an older version are stale.
+    m_hier_version = 0
     
     # Function -- NODOCS -- new
     #
@@ -119,6 +123,10 @@ class uvm_component(uvm_report_object):
         self.m_parent = None # uvm_component
         self.m_children = {} # string,uvm_component
         self.m_children_by_handle = {} # uvm_component,uvm_component
+
+        self.m_order_version = -1 # hierarchy version of m_preorder/m_postorder
+        self.m_preorder = None # uvm_component[$]
+        self.m_postorder = None # uvm_component[$]
         
 
         # If uvm_top, reset name to "" so it doesn't show in full paths then return
@@ -173,11 +181,11 @@ class uvm_component(uvm_report_object):
 #                          "which already has a child by that name."))
                 return
 
-        m_parent = parent;
+        self.m_parent = parent
 
         self.set_name(name); # *** VIRTUAL
 
-        if not m_parent.m_add_child(self):
+        if not self.m_parent.m_add_child(self):
             self.m_parent = None;
 
 #TODO:        self.event_pool = new("event_pool");
@@ -278,7 +286,7 @@ class uvm_component(uvm_report_object):
 
     # @uvm-ieee 1800.2-2017 auto 13.1.3.5
     def get_num_children(self):
-        return self.m_children.size()
+        return len(self.m_children)
 
     # Function -- NODOCS -- has_child
     #
@@ -296,7 +304,7 @@ class uvm_component(uvm_report_object):
         if self.m_name != "":
 #TODO:            `uvm_error("INVSTNM", $sformatf("It is illegal to change the name of a component. The component name will not be changed to \"%s\"", name))
             return
-#TODO:        super().set_name(name)
+        super().set_name(name)
         self.m_set_full_name()
 
   
@@ -321,423 +329,486 @@ class uvm_component(uvm_report_object):
 #   extern function int unsigned get_depth();
 # 
 # 
-#     #----------------------------------------------------------------------------
-#     # Group -- NODOCS -- Phasing Interface
-#     #----------------------------------------------------------------------------
-#     #
-#     # These methods implement an interface which allows all components to step
-#     # through a standard schedule of phases, or a customized schedule, and
-#     # also an API to allow independent phase domains which can jump like state
-#     # machines to reflect behavior e.g. power domains on the DUT in different
-#     # portions of the testbench. The phase tasks and functions are the phase
-#     # name with the _phase suffix. For example, the build phase function is
-#     # <build_phase>.
-#     #
-#     # All processes associated with a task-based phase are killed when the phase
-#     # ends. See <uvm_task_phase> for more details.
-#     #----------------------------------------------------------------------------
-# 
-# 
-#     # Function -- NODOCS -- build_phase
-#     #
-#     # The <uvm_build_phase> phase implementation method.
-#     #
-#     # Any override should call super.build_phase(phase) to execute the automatic
-#     # configuration of fields registered in the component by calling 
-#     # <apply_config_settings>.
-#     # To turn off automatic configuration for a component, 
-#     # do not call super.build_phase(phase).
-#     #
-#     # This method should never be called directly. 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.1.1
-#   extern virtual function void build_phase(uvm_phase phase);
-# 
-#     # Function -- NODOCS -- connect_phase
-#     #
-#     # The <uvm_connect_phase> phase implementation method.
-#     #
-#     # This method should never be called directly. 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.1.2
-#   extern virtual function void connect_phase(uvm_phase phase);
-# 
-#     # Function -- NODOCS -- end_of_elaboration_phase
-#     #
-#     # The <uvm_end_of_elaboration_phase> phase implementation method.
-#     #
-#     # This method should never be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.1.3
-#   extern virtual function void end_of_elaboration_phase(uvm_phase phase);
-# 
-#     # Function -- NODOCS -- start_of_simulation_phase
-#     #
-#     # The <uvm_start_of_simulation_phase> phase implementation method.
-#     #
-#     # This method should never be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.1.4
-#   extern virtual function void start_of_simulation_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- run_phase
-#     #
-#     # The <uvm_run_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # Thus the phase will automatically
-#     # end once all objections are dropped using ~phase.drop_objection()~.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # The run_phase task should never be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.1.5
-#   extern virtual task run_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- pre_reset_phase
-#     #
-#     # The <uvm_pre_reset_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # It is necessary to raise an objection
-#     # using ~phase.raise_objection()~ to cause the phase to persist.
-#     # Once all components have dropped their respective objection
-#     # using ~phase.drop_objection()~, or if no components raises an
-#     # objection, the phase is ended.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # This method should not be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.2.1
-#   extern virtual task pre_reset_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- reset_phase
-#     #
-#     # The <uvm_reset_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # It is necessary to raise an objection
-#     # using ~phase.raise_objection()~ to cause the phase to persist.
-#     # Once all components have dropped their respective objection
-#     # using ~phase.drop_objection()~, or if no components raises an
-#     # objection, the phase is ended.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # This method should not be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.2.2
-#   extern virtual task reset_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- post_reset_phase
-#     #
-#     # The <uvm_post_reset_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # It is necessary to raise an objection
-#     # using ~phase.raise_objection()~ to cause the phase to persist.
-#     # Once all components have dropped their respective objection
-#     # using ~phase.drop_objection()~, or if no components raises an
-#     # objection, the phase is ended.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # This method should not be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.2.3
-#   extern virtual task post_reset_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- pre_configure_phase
-#     #
-#     # The <uvm_pre_configure_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # It is necessary to raise an objection
-#     # using ~phase.raise_objection()~ to cause the phase to persist.
-#     # Once all components have dropped their respective objection
-#     # using ~phase.drop_objection()~, or if no components raises an
-#     # objection, the phase is ended.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # This method should not be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.2.4
-#   extern virtual task pre_configure_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- configure_phase
-#     #
-#     # The <uvm_configure_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # It is necessary to raise an objection
-#     # using ~phase.raise_objection()~ to cause the phase to persist.
-#     # Once all components have dropped their respective objection
-#     # using ~phase.drop_objection()~, or if no components raises an
-#     # objection, the phase is ended.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # This method should not be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.2.5
-#   extern virtual task configure_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- post_configure_phase
-#     #
-#     # The <uvm_post_configure_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # It is necessary to raise an objection
-#     # using ~phase.raise_objection()~ to cause the phase to persist.
-#     # Once all components have dropped their respective objection
-#     # using ~phase.drop_objection()~, or if no components raises an
-#     # objection, the phase is ended.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # This method should not be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.2.6
-#   extern virtual task post_configure_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- pre_main_phase
-#     #
-#     # The <uvm_pre_main_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # It is necessary to raise an objection
-#     # using ~phase.raise_objection()~ to cause the phase to persist.
-#     # Once all components have dropped their respective objection
-#     # using ~phase.drop_objection()~, or if no components raises an
-#     # objection, the phase is ended.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # This method should not be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.2.7
-#   extern virtual task pre_main_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- main_phase
-#     #
-#     # The <uvm_main_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # It is necessary to raise an objection
-#     # using ~phase.raise_objection()~ to cause the phase to persist.
-#     # Once all components have dropped their respective objection
-#     # using ~phase.drop_objection()~, or if no components raises an
-#     # objection, the phase is ended.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # This method should not be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.2.8
-#   extern virtual task main_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- post_main_phase
-#     #
-#     # The <uvm_post_main_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # It is necessary to raise an objection
-#     # using ~phase.raise_objection()~ to cause the phase to persist.
-#     # Once all components have dropped their respective objection
-#     # using ~phase.drop_objection()~, or if no components raises an
-#     # objection, the phase is ended.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # This method should not be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.2.9
-#   extern virtual task post_main_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- pre_shutdown_phase
-#     #
-#     # The <uvm_pre_shutdown_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # It is necessary to raise an objection
-#     # using ~phase.raise_objection()~ to cause the phase to persist.
-#     # Once all components have dropped their respective objection
-#     # using ~phase.drop_objection()~, or if no components raises an
-#     # objection, the phase is ended.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # This method should not be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.2.10
-#   extern virtual task pre_shutdown_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- shutdown_phase
-#     #
-#     # The <uvm_shutdown_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # It is necessary to raise an objection
-#     # using ~phase.raise_objection()~ to cause the phase to persist.
-#     # Once all components have dropped their respective objection
-#     # using ~phase.drop_objection()~, or if no components raises an
-#     # objection, the phase is ended.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # This method should not be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.2.11
-#   extern virtual task shutdown_phase(uvm_phase phase);
-# 
-#     # Task -- NODOCS -- post_shutdown_phase
-#     #
-#     # The <uvm_post_shutdown_phase> phase implementation method.
-#     #
-#     # This task returning or not does not indicate the end
-#     # or persistence of this phase.
-#     # It is necessary to raise an objection
-#     # using ~phase.raise_objection()~ to cause the phase to persist.
-#     # Once all components have dropped their respective objection
-#     # using ~phase.drop_objection()~, or if no components raises an
-#     # objection, the phase is ended.
-#     # 
-#     # Any processes forked by this task continue to run
-#     # after the task returns,
-#     # but they will be killed once the phase ends.
-#     #
-#     # This method should not be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.2.12
-#   extern virtual task post_shutdown_phase(uvm_phase phase);
-# 
-#     # Function -- NODOCS -- extract_phase
-#     #
-#     # The <uvm_extract_phase> phase implementation method.
-#     #
-#     # This method should never be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.1.6
-#   extern virtual function void extract_phase(uvm_phase phase);
-# 
-# 
-# 
-#     # Function -- NODOCS -- check_phase
-#     #
-#     # The <uvm_check_phase> phase implementation method.
-#     #
-#     # This method should never be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.1.7
-#   extern virtual function void check_phase(uvm_phase phase);
-# 
-#     # Function -- NODOCS -- report_phase
-#     #
-#     # The <uvm_report_phase> phase implementation method.
-#     #
-#     # This method should never be called directly.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.1.8
-#   extern virtual function void report_phase(uvm_phase phase);
-# 
-#     # Function -- NODOCS -- final_phase
-#     #
-#     # The <uvm_final_phase> phase implementation method.
-#     #
-#     # This method should never be called directly.
-#   
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.1.9
-#   extern virtual function void final_phase(uvm_phase phase);
-# 
-#     # Function -- NODOCS -- phase_started
-#     #
-#     # Invoked at the start of each phase. The ~phase~ argument specifies
-#     # the phase being started. Any threads spawned in this callback are
-#     # not affected when the phase ends.
-# 
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.3.1
-#   extern virtual function void phase_started (uvm_phase phase);
-# 
-#     # Function -- NODOCS -- phase_ready_to_end
-#     #
-#     # Invoked when all objections to ending the given ~phase~ and all
-#     # sibling phases have been dropped, thus indicating that ~phase~ is 
-#     # ready to begin a clean exit. Sibling phases are any phases that 
-#     # have a common successor phase in the schedule plus any phases that
-#     # sync'd to the current phase. Components needing to consume delta
-#     # cycles or advance time to perform a clean exit from the phase
-#     # may raise the phase's objection. 
-#     #
-#     # |phase.raise_objection(this,"Reason");
-#     #
-#     # It is the responsibility of this component to drop the objection 
-#     # once it is ready for this phase to end (and processes killed).
-#     # If no objection to the given ~phase~ or sibling phases are raised,
-#     # then phase_ended() is called after a delta cycle.  If any objection
-#     # is raised, then when all objections to ending the given ~phase~
-#     # and siblings are dropped, another iteration of phase_ready_to_end
-#     # is called.  To prevent endless iterations due to coding error,
-#     # after 20 iterations, phase_ended() is called regardless of whether
-#     # previous iteration had any objections raised.
-#   
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.3.2
-#   extern virtual function void phase_ready_to_end (uvm_phase phase);
-# 
-# 
-#     # Function -- NODOCS -- phase_ended
-#     #
-#     # Invoked at the end of each phase. The ~phase~ argument specifies
-#     # the phase that is ending.  Any threads spawned in this callback are
-#     # not affected when the phase ends.
-#   
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.3.3
-#   extern virtual function void phase_ended (uvm_phase phase);
-# 
-#   
-#     #--------------------------------------------------------------------
-#     # phase / schedule / domain API
-#     #--------------------------------------------------------------------
-# 
-#   
+    #----------------------------------------------------------------------------
+    # Group -- NODOCS -- Phasing Interface
+    #----------------------------------------------------------------------------
+    #
+    # These methods implement an interface which allows all components to step
+    # through a standard schedule of phases, or a customized schedule, and
+    # also an API to allow independent phase domains which can jump like state
+    # machines to reflect behavior e.g. power domains on the DUT in different
+    # portions of the testbench. The phase tasks and functions are the phase
+    # name with the _phase suffix. For example, the build phase function is
+    # <build_phase>.
+    #
+    # All processes associated with a task-based phase are killed when the phase
+    # ends. See <uvm_task_phase> for more details.
+    #----------------------------------------------------------------------------
+
+
+    # Function -- NODOCS -- build_phase
+    #
+    # The <uvm_build_phase> phase implementation method.
+    #
+    # Any override should call super.build_phase(phase) to execute the automatic
+    # configuration of fields registered in the component by calling
+    # <apply_config_settings>.
+    # To turn off automatic configuration for a component,
+    # do not call super.build_phase(phase).
+    #
+    # This method should never be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.1.1
+    def build_phase(self, phase):
+        self.m_build_done = True
+        # TODO: apply_config_settings() when use_automatic_config()
+
+    # Function -- NODOCS -- connect_phase
+    #
+    # The <uvm_connect_phase> phase implementation method.
+    #
+    # This method should never be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.1.2
+    def connect_phase(self, phase):
+        pass
+
+    # Function -- NODOCS -- end_of_elaboration_phase
+    #
+    # The <uvm_end_of_elaboration_phase> phase implementation method.
+    #
+    # This method should never be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.1.3
+    def end_of_elaboration_phase(self, phase):
+        pass
+
+    # Function -- NODOCS -- start_of_simulation_phase
+    #
+    # The <uvm_start_of_simulation_phase> phase implementation method.
+    #
+    # This method should never be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.1.4
+    def start_of_simulation_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- run_phase
+    #
+    # The <uvm_run_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # Thus the phase will automatically
+    # end once all objections are dropped using ~phase.drop_objection()~.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # The run_phase task should never be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.1.5
+    async def run_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- pre_reset_phase
+    #
+    # The <uvm_pre_reset_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # It is necessary to raise an objection
+    # using ~phase.raise_objection()~ to cause the phase to persist.
+    # Once all components have dropped their respective objection
+    # using ~phase.drop_objection()~, or if no components raises an
+    # objection, the phase is ended.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # This method should not be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.2.1
+    async def pre_reset_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- reset_phase
+    #
+    # The <uvm_reset_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # It is necessary to raise an objection
+    # using ~phase.raise_objection()~ to cause the phase to persist.
+    # Once all components have dropped their respective objection
+    # using ~phase.drop_objection()~, or if no components raises an
+    # objection, the phase is ended.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # This method should not be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.2.2
+    async def reset_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- post_reset_phase
+    #
+    # The <uvm_post_reset_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # It is necessary to raise an objection
+    # using ~phase.raise_objection()~ to cause the phase to persist.
+    # Once all components have dropped their respective objection
+    # using ~phase.drop_objection()~, or if no components raises an
+    # objection, the phase is ended.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # This method should not be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.2.3
+    async def post_reset_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- pre_configure_phase
+    #
+    # The <uvm_pre_configure_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # It is necessary to raise an objection
+    # using ~phase.raise_objection()~ to cause the phase to persist.
+    # Once all components have dropped their respective objection
+    # using ~phase.drop_objection()~, or if no components raises an
+    # objection, the phase is ended.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # This method should not be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.2.4
+    async def pre_configure_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- configure_phase
+    #
+    # The <uvm_configure_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # It is necessary to raise an objection
+    # using ~phase.raise_objection()~ to cause the phase to persist.
+    # Once all components have dropped their respective objection
+    # using ~phase.drop_objection()~, or if no components raises an
+    # objection, the phase is ended.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # This method should not be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.2.5
+    async def configure_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- post_configure_phase
+    #
+    # The <uvm_post_configure_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # It is necessary to raise an objection
+    # using ~phase.raise_objection()~ to cause the phase to persist.
+    # Once all components have dropped their respective objection
+    # using ~phase.drop_objection()~, or if no components raises an
+    # objection, the phase is ended.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # This method should not be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.2.6
+    async def post_configure_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- pre_main_phase
+    #
+    # The <uvm_pre_main_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # It is necessary to raise an objection
+    # using ~phase.raise_objection()~ to cause the phase to persist.
+    # Once all components have dropped their respective objection
+    # using ~phase.drop_objection()~, or if no components raises an
+    # objection, the phase is ended.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # This method should not be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.2.7
+    async def pre_main_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- main_phase
+    #
+    # The <uvm_main_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # It is necessary to raise an objection
+    # using ~phase.raise_objection()~ to cause the phase to persist.
+    # Once all components have dropped their respective objection
+    # using ~phase.drop_objection()~, or if no components raises an
+    # objection, the phase is ended.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # This method should not be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.2.8
+    async def main_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- post_main_phase
+    #
+    # The <uvm_post_main_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # It is necessary to raise an objection
+    # using ~phase.raise_objection()~ to cause the phase to persist.
+    # Once all components have dropped their respective objection
+    # using ~phase.drop_objection()~, or if no components raises an
+    # objection, the phase is ended.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # This method should not be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.2.9
+    async def post_main_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- pre_shutdown_phase
+    #
+    # The <uvm_pre_shutdown_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # It is necessary to raise an objection
+    # using ~phase.raise_objection()~ to cause the phase to persist.
+    # Once all components have dropped their respective objection
+    # using ~phase.drop_objection()~, or if no components raises an
+    # objection, the phase is ended.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # This method should not be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.2.10
+    async def pre_shutdown_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- shutdown_phase
+    #
+    # The <uvm_shutdown_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # It is necessary to raise an objection
+    # using ~phase.raise_objection()~ to cause the phase to persist.
+    # Once all components have dropped their respective objection
+    # using ~phase.drop_objection()~, or if no components raises an
+    # objection, the phase is ended.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # This method should not be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.2.11
+    async def shutdown_phase(self, phase):
+        pass
+
+    # Task -- NODOCS -- post_shutdown_phase
+    #
+    # The <uvm_post_shutdown_phase> phase implementation method.
+    #
+    # This task returning or not does not indicate the end
+    # or persistence of this phase.
+    # It is necessary to raise an objection
+    # using ~phase.raise_objection()~ to cause the phase to persist.
+    # Once all components have dropped their respective objection
+    # using ~phase.drop_objection()~, or if no components raises an
+    # objection, the phase is ended.
+    #
+    # Any processes forked by this task continue to run
+    # after the task returns,
+    # but they will be killed once the phase ends.
+    #
+    # This method should not be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.2.12
+    async def post_shutdown_phase(self, phase):
+        pass
+
+    # Function -- NODOCS -- extract_phase
+    #
+    # The <uvm_extract_phase> phase implementation method.
+    #
+    # This method should never be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.1.6
+    def extract_phase(self, phase):
+        pass
+
+
+
+    # Function -- NODOCS -- check_phase
+    #
+    # The <uvm_check_phase> phase implementation method.
+    #
+    # This method should never be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.1.7
+    def check_phase(self, phase):
+        pass
+
+    # Function -- NODOCS -- report_phase
+    #
+    # The <uvm_report_phase> phase implementation method.
+    #
+    # This method should never be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.1.8
+    def report_phase(self, phase):
+        pass
+
+    # Function -- NODOCS -- final_phase
+    #
+    # The <uvm_final_phase> phase implementation method.
+    #
+    # This method should never be called directly.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.1.9
+    def final_phase(self, phase):
+        pass
+
+    # Function -- NODOCS -- phase_started
+    #
+    # Invoked at the start of each phase. The ~phase~ argument specifies
+    # the phase being started. Any threads spawned in this callback are
+    # not affected when the phase ends.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.3.1
+    def phase_started(self, phase):
+        pass
+
+    # Function -- NODOCS -- phase_ready_to_end
+    #
+    # Invoked when all objections to ending the given ~phase~ and all
+    # sibling phases have been dropped, thus indicating that ~phase~ is
+    # ready to begin a clean exit. Sibling phases are any phases that
+    # have a common successor phase in the schedule plus any phases that
+    # sync'd to the current phase. Components needing to consume delta
+    # cycles or advance time to perform a clean exit from the phase
+    # may raise the phase's objection.
+    #
+    # |phase.raise_objection(this,"Reason");
+    #
+    # It is the responsibility of this component to drop the objection
+    # once it is ready for this phase to end (and processes killed).
+    # If no objection to the given ~phase~ or sibling phases are raised,
+    # then phase_ended() is called after a delta cycle.  If any objection
+    # is raised, then when all objections to ending the given ~phase~
+    # and siblings are dropped, another iteration of phase_ready_to_end
+    # is called.  To prevent endless iterations due to coding error,
+    # after 20 iterations, phase_ended() is called regardless of whether
+    # previous iteration had any objections raised.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.3.2
+    def phase_ready_to_end(self, phase):
+        pass
+
+
+    # Function -- NODOCS -- phase_ended
+    #
+    # Invoked at the end of each phase. The ~phase~ argument specifies
+    # the phase that is ending.  Any threads spawned in this callback are
+    # not affected when the phase ends.
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.3.3
+    def phase_ended(self, phase):
+        pass
+
+    # Phase methods whose uvm_component implementation does nothing. Phase
+    # traversals do not call these on a component whose class leaves them
+    # at the default, and task phases do not fork a process for them.
+    m_noop_phase_methods = frozenset([
+        "connect_phase", "end_of_elaboration_phase", "start_of_simulation_phase",
+        "run_phase",
+        "pre_reset_phase", "reset_phase", "post_reset_phase",
+        "pre_configure_phase", "configure_phase", "post_configure_phase",
+        "pre_main_phase", "main_phase", "post_main_phase",
+        "pre_shutdown_phase", "shutdown_phase", "post_shutdown_phase",
+        "extract_phase", "check_phase", "report_phase", "final_phase",
+        "phase_started", "phase_ready_to_end", "phase_ended"])
+
+    # Function- m_register_phase_methods
+    #
+    # Records which of the <m_noop_phase_methods> class ~T~ does not
+    # override. Called by `uvm_component_utils; unregistered classes are
+    # examined the first time they are phased.
+    @staticmethod
+    def m_register_phase_methods(T):
+        noops = set()
+        for name in uvm_component.m_noop_phase_methods:
+            if getattr(T, name) is getattr(uvm_component, name):
+                noops.add(name)
+        T.m_uvm_noop_phases = frozenset(noops)
+        return T.m_uvm_noop_phases
+
+    # Function- m_is_noop_phase_method
+    #
+    # Returns True if calling phase method ~name~ on this component is known
+    # to have no effect. Unknown names, such as the methods of custom phases,
+    # are never considered no-ops.
+    def m_is_noop_phase_method(self, name):
+        noops = type(self).__dict__.get("m_uvm_noop_phases")
+        if noops is None:
+            noops = uvm_component.m_register_phase_methods(type(self))
+        return name in noops
+
+
+    #--------------------------------------------------------------------
+    # phase / schedule / domain API
+    #--------------------------------------------------------------------
+
+
 #     # Function -- NODOCS -- set_domain
 #     #
 #     # Apply a phase domain to this component and, if ~hier~ is set, 
@@ -749,14 +820,15 @@ class uvm_component(uvm_report_object):
 # 
 #     # @uvm-ieee 1800.2-2017 auto 13.1.4.4.1
 #   extern function void set_domain(uvm_domain domain, int hier=1);
-# 
-# 
-#     # Function -- NODOCS -- get_domain
-#     #
-#     # Return handle to the phase domain set on this component
-#   
-#     # @uvm-ieee 1800.2-2017 auto 13.1.4.4.2
-#   extern function uvm_domain get_domain();
+
+
+    # Function -- NODOCS -- get_domain
+    #
+    # Return handle to the phase domain set on this component
+
+    # @uvm-ieee 1800.2-2017 auto 13.1.4.4.2
+    def get_domain(self):
+        return self.m_domain
 # 
 # 
 #     # Function -- NODOCS -- define_domain
@@ -1539,11 +1611,63 @@ class uvm_component(uvm_report_object):
 
         self.m_children[child.get_name()] = child
         self.m_children_by_handle[child] = child
+        uvm_component.m_hier_version += 1
         return True
   
     def m_set_full_name(self):
-        print("TODO: m_set_full_name")
-        pass
+        # Parents are always renamed before their children are visited
+        stack = [self]
+        while len(stack) > 0:
+            comp = stack.pop()
+            parent = comp.m_parent
+            if parent is None or parent.get_full_name() == "":
+                comp.m_name = comp.get_name()
+            else:
+                comp.m_name = parent.get_full_name() + "." + comp.get_name()
+            stack.extend(comp.m_children.values())
+
+    # Function- m_get_preorder
+    #
+    # Returns this component followed by all of its descendants, in the order
+    # a recursive topdown walk visits them (parent before children). The list
+    # is built once per hierarchy version and shared by all phase traversals;
+    # callers must not modify it.
+    def m_get_preorder(self):
+        if self.m_order_version != uvm_component.m_hier_version:
+            self.m_build_traversal_orders()
+        return self.m_preorder
+
+    # Function- m_get_postorder
+    #
+    # Returns all descendants of this component followed by the component
+    # itself, in the order a recursive bottomup walk visits them (children
+    # before parent). Shares the caching rules of <m_get_preorder>.
+    def m_get_postorder(self):
+        if self.m_order_version != uvm_component.m_hier_version:
+            self.m_build_traversal_orders()
+        return self.m_postorder
+
+    def m_build_traversal_orders(self):
+        # Explicit-stack depth-first walk. Each stack entry holds a component
+        # and an iterator over its remaining children, so deep hierarchies
+        # do not run into the interpreter recursion limit.
+        preorder = [self]
+        postorder = []
+        stack = [(self, iter(self.m_children.values()))]
+        while len(stack) > 0:
+            comp, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                postorder.append(comp)
+            else:
+                preorder.append(child)
+                stack.append((child, iter(child.m_children.values())))
+
+        self.m_preorder = preorder
+        self.m_postorder = postorder
+        self.m_order_version = uvm_component.m_hier_version
+
 # 
 #   extern                   function void do_resolve_bindings();
 #   extern                   function void do_flush();
@@ -1581,6 +1705,33 @@ class uvm_component(uvm_report_object):
 #   extern function void m_set_cl_action;
 #   extern function void m_set_cl_sev;
 #   extern function void m_apply_verbosity_settings(uvm_phase phase);
+    def m_apply_verbosity_settings(self, phase):
+        i = 0
+        while i < len(self.m_verbosity_settings):
+            setting = self.m_verbosity_settings[i]
+            if phase.get_name() == setting.phase:
+                if setting.offset == 0:
+                    if setting.id == "_ALL_":
+                        self.set_report_verbosity_level(setting.verbosity)
+                    else:
+                        self.set_report_id_verbosity(setting.id, setting.verbosity)
+                else:
+                    # TODO: delayed settings need report verbosity, which is
+                    # not implemented yet. They are dropped for now.
+                    pass
+#                  fork begin
+#                    m_verbosity_setting setting = m_verbosity_settings[i];
+#                    #setting.offset;
+#                    if(setting.id == "_ALL_")
+#                      set_report_verbosity_level(setting.verbosity);
+#                    else 
+#                      set_report_id_verbosity(setting.id, setting.verbosity);
+#                  end join_none;
+                # Remove after use
+                del self.m_verbosity_settings[i]
+                continue
+            i += 1
+
 # 
 #     # The verbosity settings may have a specific phase to start at. 
 #     # We will do this work in the phase_started callback. 
@@ -27,11 +27,47 @@
 #   permissions and limitations under the License.
 #------------------------------------------------------------------------------
 from uvm.base.factory import uvm_factory
-from uvm.base.factory_override import uvm_factory_override
+from uvm.base.factory_override import uvm_factory_override, m_inst_typename_alias_t,\
+    m_uvm_factory_type_pair_t
+from uvm.base.factory_stats import uvm_factory_stats
+from uvm.base.inst_path_matcher import uvm_inst_path_matcher
+from uvm.base.object_pool import uvm_object_pool
 from uvm.base.globals import uvm_report_fatal, uvm_report_warning,\
     uvm_report_info, uvm_report_error, uvm_is_match
 from uvm.base.object_globals import UVM_NONE, UVM_MEDIUM, UVM_HIGH
 from uvm.util.format import strcat, sformatf
+from time import perf_counter_ns
+from collections import deque
+import functools
+import threading
+import csv
+import json
+
+# Runs the decorated <uvm_default_factory> method holding the factory's
+# writer lock. Methods that change registrations, aliases or overrides use it.
+def m_uvm_factory_locked(method):
+
+    @functools.wraps(method)
+    def locked(self, *args, **kwargs):
+        with self.m_lock:
+            return method(self, *args, **kwargs)
+
+    return locked
+
+#------------------------------------------------------------------------------
+#
+# CLASS- m_uvm_factory_snapshot
+#
+# Internal class. The registration, alias and override state of a
+# <uvm_default_factory>, as returned by <uvm_default_factory::snapshot>.
+# The containers are shared with the factory until either side changes.
+#------------------------------------------------------------------------------
+
+class m_uvm_factory_snapshot():
+
+    def __init__(self, factory, state):
+        self.m_factory = factory
+        self.m_state = state # map<string,container>
 
 
 #------------------------------------------------------------------------------
@@ -48,12 +84,59 @@ class uvm_default_factory (uvm_factory):
     def __init__(self):
         super().__init__()
         self.m_types = {} # map<uvm_object_wrapper,bit> TODO: really a set
+        # Dense integer IDs: one per registered wrapper, and one per interned
+        # type or alias name. Override matching and the override index work
+        # on these IDs rather than on strings.
+        self.m_type_ids = {} # map<uvm_object_wrapper,int>
+        self.m_id_types = [] # list of uvm_object_wrapper, by type ID
+        self.m_name_ids = {} # map<string,int>
+        self.m_id_names = [] # list of string, by name ID
+        # Override type pairs by name ID, updated when that name is registered
+        self.m_pairs_by_name_id = {} # map<int,list of m_uvm_factory_type_pair_t>
         self.m_lookup_strs = {} # map<uvm_object_wrapper,bit> TODO: really a set
         self.m_type_names = {} # map<string,uvm_object_wrapper> 
         self.m_inst_aliases = [] # list of m_inst_typename_alias_t
+        # Instance aliases by alias name, each with its paths compiled into a
+        # matcher. m_inst_alias_matcher holds the paths of every alias.
+        self.m_inst_alias_index = {} # map<string,uvm_inst_path_matcher>
+        self.m_inst_alias_matcher = uvm_inst_path_matcher()
+        self.m_inst_alias_types = {} # map<string,list of uvm_object_wrapper>
         self.m_type_overrides = [] # list of uvm_factory_override
         self.m_inst_overrides = [] # list of uvm_factory_override
-        self.m_override_info = [] # list of uvm_factory_override
+        # Writers serialize on m_lock. Readers take no lock: the state they
+        # depend on (override index, resolve cache, frozen tables, path
+        # matcher snapshots) is rebuilt aside and published by swapping a
+        # single attribute.
+        self.m_lock = threading.RLock()
+        # Per-thread m_override_info (see find_override_by_type)
+        self.m_tls = threading.local()
+        # Memoized override resolution: (requested wrapper, full_inst_path) -> wrapper.
+        # Flushed whenever m_generation is bumped by a mutating call.
+        self.m_resolve_cache = {}
+        self.m_generation = 0
+        # Override index: (generation, type override index, instance override
+        # index, candidate cache). Each index is a pair of arrays indexed by
+        # type ID and by name ID holding the overrides that may apply to it,
+        # in priority order. Rebuilt lazily once m_generation moves on.
+        self.m_override_index = (-1, ([], []), ([], []), {})
+        # Instance override paths, compiled as overrides are added
+        self.m_inst_matcher = uvm_inst_path_matcher()
+        # Compiled lookup tables, valid while m_frozen is set (see freeze)
+        self.m_frozen = False
+        self.m_frozen_types = {} # map<uvm_object_wrapper,resolution>
+        self.m_frozen_names = {} # map<string,resolution>
+        # Object recycling pools, created on first acquire
+        self.m_pools = {} # map<uvm_object_wrapper,uvm_object_pool>
+        self.m_pools_by_class = {} # map<class,uvm_object_pool>
+        self.m_pool_max_size = 64
+        # Creation statistics, None unless enabled (see set_stats_enabled)
+        self.m_stats = None
+        # Resolution trace: the most recent creates as
+        # (requested type or name, parent_inst_path, name, resolution)
+        self.m_trace = deque(maxlen=256)
+        # Set while the state containers are shared with a snapshot. The
+        # next change copies them first (see m_unshare).
+        self.m_shared = False
         
     # Group --NODOCS-- Registering Types
 
@@ -61,45 +144,50 @@ class uvm_default_factory (uvm_factory):
     #
     # Registers the given proxy object, ~obj~, with the factory.
    
+    @m_uvm_factory_locked
     def register(self, obj):
         if obj == None:
             uvm_report_fatal ("NULLWR", "Attempting to register a null object with the factory", UVM_NONE)
             pass
         
-        if obj.get_type_name() != "" and obj.get_type_name() != "<unknown>":
-            if obj in self.m_type_names.keys():
-                uvm_report_warning("TPRGED", strcat("Type name '",obj.get_type_name(),
+        self.m_bump_generation()
+        type_name = obj.get_type_name()
+
+        if type_name != "" and type_name != "<unknown>":
+            if type_name in self.m_type_names.keys():
+                uvm_report_warning("TPRGED", strcat("Type name '",type_name,
                     "' already registered with factory. No string-based lookup ",
                     "support for multiple types with the same type name."), UVM_NONE)
             else:
-                self.m_type_names[obj.get_type_name()] = obj
+                self.m_type_names[type_name] = obj
 
         if obj in self.m_types.keys():
-            if obj.get_type_name() != "" and obj.get_type_name() != "<unknown>":
-                uvm_report_warning("TPRGED", strcat("Object type '",obj.get_type_name(),
+            if type_name != "" and type_name != "<unknown>":
+                uvm_report_warning("TPRGED", strcat("Object type '",type_name,
                          "' already registered with factory. "), UVM_NONE)
-            else:
-                self.m_types[obj] = True;
+        else:
+            self.m_types[obj] = True;
+            self.m_type_ids[obj] = len(self.m_id_types)
+            self.m_id_types.append(obj)
 
-                # If a named override happens before the type is registered, need to update
-                # the override type
-                # Note:Registration occurs via static initialization, which occurs ahead of
-                # procedural (e.g. initial) blocks. There should not be any preexisting overrides.
-                overrides = self.m_type_overrides + self.m_inst_overrides
-                
-                for override in overrides:
-                    if self.m_matches_type_pair(override.orig, None, obj.get_type_name()):
-                        override.orig.m_type = obj; 
-                        
-                    if self.m_matches_type_pair(override.ovrd, None, obj.get_type_name()):
-                        override.ovrd.m_type = obj; 
+            # If a named override happens before the type is registered, need to update
+            # the override type
+            # Note:Registration occurs via static initialization, which occurs ahead of
+            # procedural (e.g. initial) blocks. There should not be any preexisting overrides.
+            name_id = self.m_name_ids.get(type_name, -1)
+            if name_id >= 0:
+                for pair in self.m_pairs_by_name_id.get(name_id, []):
+                    pair.m_type = obj
 
 
     # Group --NODOCS-- Type & Instance Overrides
 
     # Function --NODOCS-- set_inst_override_by_type
 
+    @m_uvm_factory_locked
     def set_inst_override_by_type (self, original_type, override_type, full_inst_path):
+        self.m_bump_generation()
+
         # register the types if not already done so
         if not original_type in self.m_types.keys():
             self.register(original_type)
@@ -121,7 +209,7 @@ class uvm_default_factory (uvm_factory):
             ovrd_type=override_type,
             ovrd_type_name=override_type.get_type_name())
 
-        self.m_inst_overrides.append(override)
+        self.m_add_inst_override(override)
         
 
     # Function --NODOCS-- set_inst_override_by_name
@@ -132,7 +220,13 @@ class uvm_default_factory (uvm_factory):
     # 
     # ~original_type_name~ may be the factory-registered type name or an aliased name
     # specified with <set_inst_alias> in the context of ~full_inst_path~.
+    @m_uvm_factory_locked
     def set_inst_override_by_name(self, original_type_name, override_type_name, full_inst_path):
+        self.m_bump_generation()
+
+        original_type = None
+        override_type = None
+
         if original_type_name in self.m_type_names.keys():
             original_type = self.m_type_names[original_type_name]
 
@@ -167,14 +261,15 @@ class uvm_default_factory (uvm_factory):
                                  full_inst_path):
             return
         
-        self.m_inst_overrides.append(override)
+        self.m_add_inst_override(override)
 
 
     # Function --NODOCS-- set_type_override_by_type
 
+    @m_uvm_factory_locked
     def set_type_override_by_type(self, original_type, override_type, replace=True):
         replaced = False
-       
+        self.m_bump_generation()
 
         # check that old and new are not the same
         if original_type == override_type:
@@ -212,10 +307,10 @@ class uvm_default_factory (uvm_factory):
                 uvm_report_info("TPREGR", msg, UVM_MEDIUM)
                 
                 replaced = True
-                override.orig.m_type = original_type
-                override.orig.m_type_name = original_type.get_type_name()
-                override.ovrd.m_type = override_type
-                override.ovrd.m_type_name = override_type.get_type_name()
+                self.m_retarget_type_pair(override.orig, original_type,
+                    original_type.get_type_name())
+                self.m_retarget_type_pair(override.ovrd, override_type,
+                    override_type.get_type_name())
                 override.replace = replace
             elif override.orig.m_type == None:
                 # due to aliasing, optimizing around type override when the type is unknown could
@@ -233,7 +328,7 @@ class uvm_default_factory (uvm_factory):
                     override_type.get_type_name(),
                     replace)
 
-            self.m_type_overrides.insert(0, override)        
+            self.m_add_type_override(override)
 
     # Function --NODOCS-- set_type_override_by_name
     #
@@ -244,9 +339,9 @@ class uvm_default_factory (uvm_factory):
     # ~original_type_name~ may be the factory-registered type name or an aliased name
     # specified with <set_type_alias>.
    
+    @m_uvm_factory_locked
     def set_type_override_by_name(self, original_type_name, override_type_name, replace=True):
-        replaced = False
-  
+        self.m_bump_generation()
         original_type = None
         override_type = None
 
@@ -268,29 +363,32 @@ class uvm_default_factory (uvm_factory):
 #    return;
 #  end
 
+        self.m_set_type_override_by_name(original_type, original_type_name,
+            override_type, override_type_name, replace)
+
+    # Function- m_set_type_override_by_name
+    #
+    # Adds a type override by name, or retargets the existing ones for the
+    # original type, by scanning the type overrides newest first. Returns
+    # the new override, or None when none was added.
+    def m_set_type_override_by_name(self, original_type, original_type_name,
+            override_type, override_type_name, replace):
+        replaced = False
+
         # check that old and new are not the same
         if original_type_name == override_type_name:
             uvm_report_warning("TYPDUP", strcat("Requested and actual type name ",
                 " arguments are identical: ",original_type_name,". Ignoring this override."), UVM_NONE)
-            return
+            return None
 
         for override_t in self.m_type_overrides:
             if self.m_matches_type_override(override=override_t,
                                    requested_type=original_type,
                                    requested_type_name=original_type_name):
-                if not replace:
-                    uvm_report_info("TPREGD", strcat("Original type '",original_type_name, "'/'", override_t.orig.m_type_name,
-                        "' already registered to produce '",override_t.ovrd.m_type_name,
-                        "'.  Set 'replace' argument to replace the existing entry."), UVM_MEDIUM)
-                    return
-                
-                uvm_report_info("TPREGR", strcat("Original object type '",original_type_name, "'/'", override_t.orig.m_type_name,
-                    "' already registered to produce '", override_t.ovrd.m_type_name,
-                    "'.  Replacing with override to produce type '",override_type_name,"'."), UVM_MEDIUM)
+                if not self.m_replace_type_override(override_t, original_type_name,
+                        override_type, override_type_name, replace):
+                    return None
                 replaced = True
-                override_t.ovrd.m_type = override_type
-                override_t.ovrd.m_type_name = override_type_name
-                override_t.replace = replace
                
             elif override_t.orig.m_type == None or original_type == None:
                 # due to aliasing, optimizing around type override when the type is unknown could
@@ -301,16 +399,36 @@ class uvm_default_factory (uvm_factory):
         if original_type == None:
             self.m_lookup_strs[original_type_name] = True
     
-        if not replaced:
-            override = uvm_factory_override(
-                full_inst_path="",
-                orig_type=original_type,
-                orig_type_name=original_type_name,
-                ovrd_type=override_type,
-                ovrd_type_name=override_type_name,
-                replace=replace)
+        if replaced:
+            return None
+
+        override = uvm_factory_override(
+            full_inst_path="",
+            orig_type=original_type,
+            orig_type_name=original_type_name,
+            ovrd_type=override_type,
+            ovrd_type_name=override_type_name,
+            replace=replace)
     
-            self.m_type_overrides.insert(override)
+        self.m_add_type_override(override)
+        return override
+
+    # Retargets ~override_t~, which matches the original type of a new type
+    # override, when ~replace~ is set. Returns False when it is not.
+    def m_replace_type_override(self, override_t, original_type_name,
+            override_type, override_type_name, replace):
+        if not replace:
+            uvm_report_info("TPREGD", strcat("Original type '",original_type_name, "'/'", override_t.orig.m_type_name,
+                "' already registered to produce '",override_t.ovrd.m_type_name,
+                "'.  Set 'replace' argument to replace the existing entry."), UVM_MEDIUM)
+            return False
+
+        uvm_report_info("TPREGR", strcat("Original object type '",original_type_name, "'/'", override_t.orig.m_type_name,
+            "' already registered to produce '", override_t.ovrd.m_type_name,
+            "'.  Replacing with override to produce type '",override_type_name,"'."), UVM_MEDIUM)
+        self.m_retarget_type_pair(override_t.ovrd, override_type, override_type_name)
+        override_t.replace = replace
+        return True
         
 
     # Function --NODOCS-- set_type_alias
@@ -318,7 +436,10 @@ class uvm_default_factory (uvm_factory):
     # Intended to allow overrides by type to use the alias_type_name as an additional name to refer to
     # original_type 
   
+    @m_uvm_factory_locked
     def set_type_alias(self, alias_type_name, original_type):
+        self.m_bump_generation()
+
         if not self.is_type_registered(original_type):
             uvm_report_warning("BDTYP", strcat("Cannot define alias of type '",
                 original_type.get_type_name(),"' because it is not registered with the factory."), UVM_NONE)
@@ -328,19 +449,17 @@ class uvm_default_factory (uvm_factory):
                 self.m_type_names[alias_type_name] = original_type
                 # If a named override happens before the type alias is set, need to update
                 # the override type
-                overrides = self.m_type_overrides + self.m_inst_overrides
-                
-                for override in overrides:
-                    if self.m_matches_type_pair(match_type_pair=override.orig, requested_type=None, requested_type_name=alias_type_name):
-                        override.orig.m_type = original_type
-                    if self.m_matches_type_pair( match_type_pair=override.ovrd, requested_type=None, requested_type_name=alias_type_name):
-                        override.ovrd.m_type = original_type        
+                name_id = self.m_name_ids.get(alias_type_name, -1)
+                if name_id >= 0:
+                    for pair in self.m_pairs_by_name_id.get(name_id, []):
+                        pair.m_type = original_type
   
     # Function --NODOCS-- set_inst_alias
     #
     # Intended to allow overrides by name to use the alias_type_name as an additional name to refer to
     # original_type in the context referred to by full_inst_path.  
 
+    @m_uvm_factory_locked
     def set_inst_alias(self, alias_type_name, original_type, full_inst_path):
         original_type_name = original_type.get_type_name()
     
@@ -348,13 +467,18 @@ class uvm_default_factory (uvm_factory):
             uvm_report_warning("BDTYP", strcat("Cannot define alias of type '",
                 original_type_name,"' because it is not registered with the factory."), UVM_NONE)
         else:
-            print("TODO: add aliases to factory")
-#             orig_type_alias_per_inst.alias_type_name = alias_type_name
-#             orig_type_alias_per_inst.full_inst_path = full_inst_path
-#             orig_type_alias_per_inst.orig.m_type_name = original_type_name
-#             orig_type_alias_per_inst.orig.m_type = original_type
-#             self.m_inst_aliases.append(orig_type_alias_per_inst)      
-            pass
+            self.m_bump_generation()
+            orig_type_alias_per_inst = m_inst_typename_alias_t(
+                alias_type_name,
+                original_type,
+                original_type_name,
+                full_inst_path)
+
+            if alias_type_name not in self.m_inst_alias_types.keys():
+                self.m_inst_alias_types[alias_type_name] = []
+            if original_type not in self.m_inst_alias_types[alias_type_name]:
+                self.m_inst_alias_types[alias_type_name].append(original_type)
+            self.m_add_inst_alias(orig_type_alias_per_inst)
 
 
     # Group --NODOCS-- Creation
@@ -362,19 +486,28 @@ class uvm_default_factory (uvm_factory):
     # Function --NODOCS-- create_object_by_type
 
     def create_object_by_type(self, requested_type, parent_inst_path="", name=""):
+        stats = self.m_stats
+        if stats is not None:
+            start = perf_counter_ns()
+
+        resolution = None
+        if self.m_frozen:
+            resolution = self.m_frozen_types.get(requested_type)
+        if resolution is None:
+            if parent_inst_path == "":
+                full_inst_path = name
+            elif name != "":
+                full_inst_path = parent_inst_path+"."+name
+            else:
+                full_inst_path = parent_inst_path
+            resolution = self.m_resolve_by_type_cached(requested_type, full_inst_path)
 
-        if parent_inst_path == "":
-            full_inst_path = name
-        elif name != "":
-            full_inst_path = parent_inst_path+"."+name
-        else:
-            full_inst_path = parent_inst_path
-
-        self.m_override_info.clear()
-
-        requested_type = self.find_override_by_type(requested_type, full_inst_path)
+        self.m_trace.append((requested_type, parent_inst_path, name, resolution))
+        obj = resolution[0].create_object(name)
 
-        return requested_type.create_object(name)
+        if stats is not None:
+            stats.record(requested_type, resolution[0], perf_counter_ns() - start)
+        return obj
 
     # Function --NODOCS-- create_component_by_type
     def create_component_by_type(self, 
@@ -382,44 +515,67 @@ class uvm_default_factory (uvm_factory):
             parent_inst_path, # ="",
             name, 
             parent):
+        stats = self.m_stats
+        if stats is not None:
+            start = perf_counter_ns()
+
+        resolution = None
+        if self.m_frozen:
+            resolution = self.m_frozen_types.get(requested_type)
+        if resolution is None:
+            if parent_inst_path == "":
+                full_inst_path = name
+            elif name != "":
+                full_inst_path = parent_inst_path+"."+name
+            else:
+                full_inst_path = parent_inst_path
+            resolution = self.m_resolve_by_type_cached(requested_type, full_inst_path)
 
-        if parent_inst_path == "":
-            full_inst_path = name
-        elif name != "":
-            full_inst_path = parent_inst_path+"."+name
-        else:
-            full_inst_path = parent_inst_path
-
-        self.m_override_info.clear()
-
-        requested_type = self.find_override_by_type(requested_type, full_inst_path)
+        self.m_trace.append((requested_type, parent_inst_path, name, resolution))
+        obj = resolution[0].create_component(name, parent)
 
-        return requested_type.create_component(name, parent)
+        if stats is not None:
+            stats.record(requested_type, resolution[0], perf_counter_ns() - start)
+        return obj
         
 
     # Function --NODOCS-- create_object_by_name
 
     def create_object_by_name(self, requested_type_name, parent_inst_path="", name=""):
-        if parent_inst_path == "":
-            inst_path = name
-        elif name != "":
-            inst_path = parent_inst_path+"."+name
-        else:
-            inst_path = parent_inst_path
+        stats = self.m_stats
+        if stats is not None:
+            start = perf_counter_ns()
+
+        resolution = None
+        if self.m_frozen:
+            resolution = self.m_frozen_names.get(requested_type_name)
+        if resolution is None:
+            if parent_inst_path == "":
+                inst_path = name
+            elif name != "":
+                inst_path = parent_inst_path+"."+name
+            else:
+                inst_path = parent_inst_path
 
-        self.m_override_info.clear()
+            override_info = []
+            wrapper = self.find_override_by_name(requested_type_name, inst_path, override_info)
 
-        wrapper = self.find_override_by_name(requested_type_name, inst_path)
+            # if no override exists, try to use requested_type_name directly
+            if wrapper is None:
+                wrapper = self.m_resolve_type_name_by_inst(requested_type_name,inst_path)
+            if wrapper is None:
+                uvm_report_warning("BDTYP", "Cannot create an object of type '"+
+                        requested_type_name+"' because it is not registered with the factory.", UVM_NONE)
+                return None
+            resolution = self.m_make_resolution(wrapper, override_info)
 
-        # if no override exists, try to use requested_type_name directly
-        if wrapper is None:
-            wrapper = self.m_resolve_type_name_by_inst(requested_type_name,inst_path)
-        if wrapper is None:
-            uvm_report_warning("BDTYP", "Cannot create an object of type '"+
-                    requested_type_name+"' because it is not registered with the factory.", UVM_NONE)
-            return None
+        self.m_trace.append((requested_type_name, parent_inst_path, name, resolution))
+        obj = resolution[0].create_object(name)
 
-        return wrapper.create_object(name)        
+        if stats is not None:
+            stats.record(self.m_stats_requested(requested_type_name), resolution[0],
+                perf_counter_ns() - start)
+        return obj
 
     # Function --NODOCS-- create_component_by_name
     #
@@ -431,27 +587,135 @@ class uvm_default_factory (uvm_factory):
             parent_inst_path, # ="",
             name, 
             parent):
+        stats = self.m_stats
+        if stats is not None:
+            start = perf_counter_ns()
+
+        resolution = None
+        if self.m_frozen:
+            resolution = self.m_frozen_names.get(requested_type_name)
+        if resolution is None:
+            if (parent_inst_path == ""):
+                inst_path = name
+            elif name != "":
+                inst_path = strcat(parent_inst_path,".",name)
+            else:
+                inst_path = parent_inst_path
 
-        if (parent_inst_path == ""):
-            inst_path = name
-        elif name != "":
-            inst_path = strcat(parent_inst_path,".",name)
-        else:
-            inst_path = parent_inst_path
-
-        self.m_override_info.clear()
-
-        wrapper = self.find_override_by_name(requested_type_name, inst_path)
+            override_info = []
+            wrapper = self.find_override_by_name(requested_type_name, inst_path, override_info)
 
-        # if no override exists, try to use requested_type_name directly
-        if wrapper is None:
-            if requested_type_name not in self.m_type_names.keys():
+            # if no override exists, try to use requested_type_name directly
+            if wrapper is None:
+                wrapper = self.m_resolve_type_name_by_inst(requested_type_name, inst_path)
+            if wrapper is None:
                 uvm_report_warning("BDTYP", "Cannot create a component of type '"+
                     requested_type_name+"' because it is not registered with the factory.", UVM_NONE)
                 return None
-            wrapper = self.m_type_names[requested_type_name]
+            resolution = self.m_make_resolution(wrapper, override_info)
+
+        self.m_trace.append((requested_type_name, parent_inst_path, name, resolution))
+        obj = resolution[0].create_component(name, parent)
 
-        return wrapper.create_component(name, parent)
+        if stats is not None:
+            stats.record(self.m_stats_requested(requested_type_name), resolution[0],
+                perf_counter_ns() - start)
+        return obj
+
+    # Function: create_components_by_type
+    #
+    # Creates one component per leaf name in ~names~. Instance paths that
+    # match the same set of instance overrides and instance aliases resolve to
+    # the same wrapper, so override resolution runs once per distinct set
+    # rather than once per name.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def create_components_by_type(self, requested_type, parent_inst_path, names, parent):
+        stats = self.m_stats
+        frozen = None
+        if self.m_frozen:
+            frozen = self.m_frozen_types.get(requested_type)
+
+        ret = []
+        resolved = {} # map<m_resolution_key,resolution>
+
+        for name in names:
+            if stats is not None:
+                start = perf_counter_ns()
+            resolution = frozen
+            if resolution is None:
+                full_inst_path = name if parent_inst_path == "" else parent_inst_path+"."+name
+                key = self.m_resolution_key(full_inst_path)
+                resolution = resolved.get(key)
+                if resolution is None:
+                    override_info = []
+                    resolution = self.m_make_resolution(
+                        self.find_override_by_type(requested_type, full_inst_path, override_info),
+                        override_info)
+                    resolved[key] = resolution
+            self.m_trace.append((requested_type, parent_inst_path, name, resolution))
+            obj = resolution[0].create_component(name, parent)
+            ret.append(obj)
+            if stats is not None:
+                stats.record(requested_type, resolution[0], perf_counter_ns() - start)
+
+        return ret
+
+    # Function: create_components_by_name
+    #
+    # Name-based equivalent of <create_components_by_type>. When
+    # ~requested_type_name~ cannot be resolved for one of the names, no
+    # component is created and an empty list is returned.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def create_components_by_name(self, requested_type_name, parent_inst_path, names, parent):
+        stats = self.m_stats
+        if stats is not None:
+            requested = self.m_stats_requested(requested_type_name)
+        frozen = None
+        if self.m_frozen:
+            frozen = self.m_frozen_names.get(requested_type_name)
+
+        # Every name is resolved before any component is created, so that
+        # a type that cannot be resolved for one of them creates none
+        resolutions = []
+        resolved = {} # map<m_resolution_key,resolution>
+        elapsed = 0
+
+        for name in names:
+            if stats is not None:
+                start = perf_counter_ns()
+            resolution = frozen
+            if resolution is None:
+                full_inst_path = name if parent_inst_path == "" else parent_inst_path+"."+name
+                key = self.m_resolution_key(full_inst_path)
+                resolution = resolved.get(key)
+                if resolution is None:
+                    override_info = []
+                    wrapper = self.find_override_by_name(requested_type_name, full_inst_path, override_info)
+                    if wrapper is None:
+                        wrapper = self.m_resolve_type_name_by_inst(requested_type_name, full_inst_path)
+                    if wrapper is None:
+                        uvm_report_warning("BDTYP", "Cannot create a component of type '"+
+                            requested_type_name+"' because it is not registered with the factory.", UVM_NONE)
+                        return []
+                    resolution = self.m_make_resolution(wrapper, override_info)
+                    resolved[key] = resolution
+            if stats is not None:
+                elapsed = perf_counter_ns() - start
+            resolutions.append((name, resolution, elapsed))
+
+        ret = []
+        for (name, resolution, elapsed) in resolutions:
+            if stats is not None:
+                start = perf_counter_ns()
+            self.m_trace.append((requested_type_name, parent_inst_path, name, resolution))
+            obj = resolution[0].create_component(name, parent)
+            ret.append(obj)
+            if stats is not None:
+                stats.record(requested, resolution[0], elapsed + perf_counter_ns() - start)
+
+        return ret
 
     # Function --NODOCS-- is_type_name_registered
     #
@@ -468,6 +732,16 @@ class uvm_default_factory (uvm_factory):
     def is_type_registered(self, obj):
         return obj in self.m_types.keys()
 
+    # Function: get_type_id
+    #
+    # Returns the integer ID assigned to ~obj~ when it was registered, or -1
+    # if it is not registered. IDs are dense, starting at 0 in registration
+    # order, and are specific to this factory.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def get_type_id(self, obj):
+        return self.m_type_ids.get(obj, -1)
+
 
     # Function: debug_create_by_type
     # Debug traces for ~create_*_by_type~ methods.
@@ -495,39 +769,56 @@ class uvm_default_factory (uvm_factory):
 
                    
     # Function --NODOCS-- find_override_by_type
-    def find_override_by_type(self, requested_type, full_inst_path):
+    #
+    # ~override_info~ receives the overrides applied while resolving. The
+    # create methods pass a list of their own, so that concurrent creates do
+    # not share resolution state. When omitted, a list private to the calling
+    # thread is cleared and used (see m_override_info).
+    def find_override_by_type(self, requested_type, full_inst_path, override_info=None):
+        if override_info is None:
+            override_info = self.m_override_info
+            override_info.clear()
         lindex = None
+        requested_type_name = requested_type.get_type_name()
+        requested_name_id = self.m_name_ids.get(requested_type_name, -1)
+        (inst_overrides, type_overrides) = self.m_get_override_candidates(
+            self.m_type_ids.get(requested_type, -1), requested_name_id)
   
-        for override in self.m_override_info:
+        for override in override_info:
             if override.orig.m_type == requested_type:
                 uvm_report_error("OVRDLOOP", "Recursive loop detected while finding override.", UVM_NONE)
                 override.used += 1
                 if not self.m_debug_pass:
                     self.debug_create_by_type (requested_type, full_inst_path)
                 return requested_type
-            if full_inst_path != "":
-                for override_i in self.m_inst_overrides:
-                    if self.m_matches_inst_override(
-                                override=override_i,
-                                requested_type=requested_type,
-                                requested_type_name=requested_type.get_type_name(),
-                                full_inst_path=full_inst_path):
-                        self.m_override_info.append(override_i)
-                        
-                        if lindex is None:
-                            lindex = override_i
-                            if not self.m_debug_pass:
-                                break
 
+        if full_inst_path != "" and len(inst_overrides) > 0:
+            path_matches = self.m_inst_matcher.match_set(full_inst_path)
+            for override_i in inst_overrides:
+                if override_i in path_matches and self.m_matches_inst_override(
+                            override=override_i,
+                            requested_type=requested_type,
+                            requested_type_name=requested_type_name,
+                            requested_name_id=requested_name_id,
+                            full_inst_path=full_inst_path,
+                            match_inst_path=False):
+                    override_info.append(override_i)
+                    
+                    if lindex is None:
+                        lindex = override_i
+                        if not self.m_debug_pass:
+                            break
+
+        matched_overrides = []
         if lindex is None or self.m_debug_pass:
-            matched_overrides = []
             
             # type override - exact match
-            for override_t in self.m_type_overrides:
+            for override_t in type_overrides:
                 if self.m_matches_type_override(
                     override=override_t,
                     requested_type=requested_type,
-                    requested_type_name=requested_type.get_type_name(),
+                    requested_type_name=requested_type_name,
+                    requested_name_id=requested_name_id,
                     full_inst_path=full_inst_path,
                     resolve_null_type_by_inst=True):
                     
@@ -546,16 +837,15 @@ class uvm_default_factory (uvm_factory):
         if len(matched_overrides) != 0:
             if self.m_debug_pass:
                 # TODO: join semantics
-                self.m_override_info += matched_overrides
+                override_info.extend(matched_overrides)
             else:
-                # TODO: append-all semantics
-                print("TODO: append-all semantics")
-#                self.m_override_info.append(matched_overrides[$])
+                override_info.append(matched_overrides[-1])
   
         if lindex is not None:
             override = lindex.ovrd.m_type
     
-            lindex.used += 1
+            if not self.m_tls_uncounted:
+                lindex.used += 1
             
             if self.m_debug_pass:
                 lindex.selected = True
@@ -563,15 +853,16 @@ class uvm_default_factory (uvm_factory):
             if not self.m_matches_type_override(
                 override=lindex,
                 requested_type=requested_type,
-                requested_type_name=requested_type.get_type_name(),
+                requested_type_name=requested_type_name,
+                requested_name_id=requested_name_id,
                 full_inst_path=full_inst_path,
                 match_original_type=False,
                 resolve_null_type_by_inst=True):
                 
                 if override is None:
-                    override = self.find_override_by_name(lindex.ovrd.m_type_name,full_inst_path)
+                    override = self.find_override_by_name(lindex.ovrd.m_type_name,full_inst_path,override_info)
                 else:
-                    override = self.find_override_by_type(override,full_inst_path);
+                    override = self.find_override_by_type(override,full_inst_path,override_info);
                     
             elif override is None:
                 override = self.m_resolve_type_name_by_inst(lindex.ovrd.m_type_name,full_inst_path)
@@ -591,19 +882,28 @@ class uvm_default_factory (uvm_factory):
     # These methods return the proxy to the object that would be created given
     # the arguments.
    
-    def find_override_by_name (self, requested_type_name, full_inst_path):
+    def find_override_by_name (self, requested_type_name, full_inst_path, override_info=None):
+        if override_info is None:
+            override_info = self.m_override_info
+            override_info.clear()
         lindex = None
       
         rtype = self.m_resolve_type_name_by_inst(requested_type_name,full_inst_path)
-
-        if full_inst_path != "":
-            for override_i in self.m_inst_overrides:
-                if self.m_matches_inst_override(
+        requested_name_id = self.m_name_ids.get(requested_type_name, -1)
+        (inst_overrides, type_overrides) = self.m_get_override_candidates(
+            self.m_type_ids.get(rtype, -1), requested_name_id)
+
+        if full_inst_path != "" and len(inst_overrides) > 0:
+            path_matches = self.m_inst_matcher.match_set(full_inst_path)
+            for override_i in inst_overrides:
+                if override_i in path_matches and self.m_matches_inst_override(
                     override=override_i,
                     requested_type=rtype,
                     requested_type_name=requested_type_name,
-                    full_inst_path=full_inst_path):
-                    self.m_override_info.append(override_i)
+                    requested_name_id=requested_name_id,
+                    full_inst_path=full_inst_path,
+                    match_inst_path=False):
+                    override_info.append(override_i)
                     
                     if lindex is None:
                         lindex = override_i
@@ -615,40 +915,39 @@ class uvm_default_factory (uvm_factory):
             matched_overrides = []
             
             # type override - exact match
-            for override_t in self.m_type_overrides:
+            for override_t in type_overrides:
                 if self.m_matches_type_override(
                     override=override_t,
                     requested_type=rtype,
                     requested_type_name=requested_type_name,
+                    requested_name_id=requested_name_id,
                     full_inst_path=full_inst_path,
                     resolve_null_type_by_inst=True):
                     matched_overrides.append(override_t)
                 
-                if lindex is None or not lindex.replace:
-                    lindex = override_t
-                    
-                    # if override was done with replace == 1, then
-                    # it has priority over overrides added before it.
-                    # if override was done with replace == 0, then
-                    # must continue to looked for an override added before
-                    # it that would have higher priority
-                    if not self.m_debug_pass and lindex.replace:
-                        break
+                    if lindex is None or not lindex.replace:
+                        lindex = override_t
+                        
+                        # if override was done with replace == 1, then
+                        # it has priority over overrides added before it.
+                        # if override was done with replace == 0, then
+                        # must continue to looked for an override added before
+                        # it that would have higher priority
+                        if not self.m_debug_pass and lindex.replace:
+                            break
                     
             if len(matched_overrides) > 0:
                 if self.m_debug_pass:
                     # TODO: join semantics
-                    self.m_override_info += matched_overrides
+                    override_info.extend(matched_overrides)
                 else:
-                    # TODO: join semantics
-                    print("TODO: join semantics")
-#                    self.m_override_info.append(matched_overrides[$])
-                    pass
+                    override_info.append(matched_overrides[-1])
   
         if lindex is not None:
             override = lindex.ovrd.m_type
     
-            lindex.used += 1
+            if not self.m_tls_uncounted:
+                lindex.used += 1
             
             if self.m_debug_pass:
                 lindex.selected = True
@@ -657,14 +956,15 @@ class uvm_default_factory (uvm_factory):
                 override=lindex,
                 requested_type=rtype,
                 requested_type_name=requested_type_name,
+                requested_name_id=requested_name_id,
                 full_inst_path=full_inst_path,
                 match_original_type=False,
                 resolve_null_type_by_inst=True):
                 
                 if override is None:
-                    override = self.find_override_by_name(lindex.ovrd.m_type_name,full_inst_path)
+                    override = self.find_override_by_name(lindex.ovrd.m_type_name,full_inst_path,override_info)
                 else:
-                    override = self.find_override_by_type(override,full_inst_path)
+                    override = self.find_override_by_type(override,full_inst_path,override_info)
                     
             elif override is None:
                 override = self.m_resolve_type_name_by_inst(lindex.ovrd.m_type_name,full_inst_path)
@@ -803,6 +1103,530 @@ class uvm_default_factory (uvm_factory):
             # TODO: report
     #        `uvm_info("UVM/FACTORY/PRINT",`UVM_STRING_QUEUE_STREAMING_PACK(qs),UVM_NONE)
         
+    # Group: Compiled Mode
+
+    # Function: freeze
+    #
+    # Compiles the current override configuration into lookup tables mapping
+    # each registered wrapper and type name to the wrapper it resolves to.
+    # Types that are the target of an instance override or of an instance
+    # alias keep using the dynamic lookup, since their result depends on the
+    # instance path. While frozen, creating any other type costs one dictionary lookup.
+    # Any call that changes registrations, aliases or overrides thaws the
+    # factory again.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    @m_uvm_factory_locked
+    def freeze(self):
+        if self.m_frozen:
+            return
+
+        frozen_types = {}
+        frozen_names = {}
+
+        # Compiling is not a use of the overrides
+        self.m_tls.uncounted = True
+        try:
+            self.m_compile_frozen(frozen_types, frozen_names)
+        finally:
+            self.m_tls.uncounted = False
+
+        self.m_frozen_types = frozen_types
+        self.m_frozen_names = frozen_names
+        self.m_frozen = True
+
+    # Fills the <freeze> tables
+    def m_compile_frozen(self, frozen_types, frozen_names):
+        for wrapper in self.m_types.keys():
+            override_info = []
+            resolved = self.find_override_by_type(wrapper, "", override_info)
+            if resolved is not None and not self.m_chain_has_inst_overrides(
+                    wrapper, wrapper.get_type_name(), override_info):
+                frozen_types[wrapper] = self.m_make_resolution(resolved, override_info)
+
+        for type_name,wrapper in self.m_type_names.items():
+            if type_name in self.m_inst_alias_index.keys():
+                # resolves differently depending on the instance path
+                continue
+            override_info = []
+            resolved = self.find_override_by_name(type_name, "", override_info)
+            if resolved is None:
+                resolved = wrapper
+            if not self.m_chain_has_inst_overrides(wrapper, type_name, override_info):
+                frozen_names[type_name] = self.m_make_resolution(resolved, override_info)
+
+    # Returns True if an instance override or an instance alias could apply to
+    # the requested type or to any type visited, as recorded in
+    # ~override_info~, while resolving it
+    def m_chain_has_inst_overrides(self, requested_type, requested_type_name, override_info):
+        pairs = [(requested_type, requested_type_name)]
+        for override in override_info:
+            pairs.append((override.ovrd.m_type, override.ovrd.m_type_name))
+
+        for (wrapper, type_name) in pairs:
+            if wrapper is not None and type_name == "":
+                type_name = wrapper.get_type_name()
+            if type_name in self.m_inst_alias_index.keys():
+                return True
+            (inst_overrides, type_overrides) = self.m_get_override_candidates(
+                self.m_type_ids.get(wrapper, -1), self.m_name_ids.get(type_name, -1))
+            if len(inst_overrides) > 0:
+                return True
+            # A type override of an instance alias name only applies where
+            # the alias does
+            for override in type_overrides:
+                if override.orig.m_type is None and \
+                        override.orig.m_type_name in self.m_inst_alias_index.keys():
+                    return True
+        return False
+
+    # Function: thaw
+    #
+    # Discards the tables built by <freeze>. Creation falls back to the
+    # dynamic (memoized) override resolution.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    @m_uvm_factory_locked
+    def thaw(self):
+        self.m_frozen = False
+        self.m_frozen_types = {}
+        self.m_frozen_names = {}
+
+    # Function: is_frozen
+    #
+    # Returns True while the factory is frozen.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def is_frozen(self):
+        return self.m_frozen
+
+    # Group: Object Pools
+
+    # Function: acquire_object_by_type
+    #
+    # Same as <create_object_by_type>, except that an object previously handed
+    # back with <release_object> is reused when one is available. Reused
+    # objects are renamed to ~name~ and reset through <uvm_object::recycle>.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def acquire_object_by_type(self, requested_type, parent_inst_path="", name=""):
+        stats = self.m_stats
+        if stats is not None:
+            start = perf_counter_ns()
+
+        resolution = None
+        if self.m_frozen:
+            resolution = self.m_frozen_types.get(requested_type)
+        if resolution is None:
+            if parent_inst_path == "":
+                full_inst_path = name
+            elif name != "":
+                full_inst_path = parent_inst_path+"."+name
+            else:
+                full_inst_path = parent_inst_path
+            resolution = self.m_resolve_by_type_cached(requested_type, full_inst_path)
+
+        self.m_trace.append((requested_type, parent_inst_path, name, resolution))
+        pool = self.get_pool(resolution[0])
+        obj = pool.acquire(name)
+
+        if type(obj) not in self.m_pools_by_class.keys():
+            self.m_pools_by_class[type(obj)] = pool
+
+        if stats is not None:
+            stats.record(requested_type, resolution[0], perf_counter_ns() - start)
+        return obj
+
+    # Function: release_object
+    #
+    # Hands ~obj~, obtained from <acquire_object_by_type>, back to its pool.
+    # Objects of a type that was never acquired are ignored.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def release_object(self, obj):
+        pool = self.m_pools_by_class.get(type(obj))
+        if pool is not None:
+            pool.release(obj)
+
+    # Function: get_pool
+    #
+    # Returns the <uvm_object_pool> for objects produced by ~wrapper~, creating
+    # it if needed. Note that pools are kept per produced type, so ~wrapper~
+    # is the override type when overrides apply.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def get_pool(self, wrapper):
+        pool = self.m_pools.get(wrapper)
+        if pool is None:
+            pool = uvm_object_pool(wrapper, self.m_pool_max_size)
+            self.m_pools[wrapper] = pool
+        return pool
+
+    # Function: set_pool_max_size
+    #
+    # Bounds the number of idle objects kept for ~wrapper~. When ~wrapper~ is
+    # None, sets the bound used for pools created from now on.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def set_pool_max_size(self, max_size, wrapper=None):
+        if wrapper is None:
+            self.m_pool_max_size = max_size
+        else:
+            self.get_pool(wrapper).set_max_size(max_size)
+
+    # Group: Statistics
+
+    # Function: set_stats_enabled
+    #
+    # Turns creation statistics on or off. While enabled, every create
+    # through the create_*_by_type, create_*_by_name, create_components_by_*
+    # and <acquire_object_by_type> methods records the produced type, whether
+    # an override was taken, and the latency of the call. While disabled, the
+    # cost is one attribute test per create. Re-enabling keeps the
+    # statistics already collected.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    @m_uvm_factory_locked
+    def set_stats_enabled(self, enable=True, max_samples=1024):
+        if enable:
+            if self.m_stats is None:
+                self.m_stats = uvm_factory_stats(max_samples)
+        else:
+            self.m_stats = None
+
+    # Returns the wrapper registered as ~requested_type_name~ for the creation
+    # statistics, or the name itself when there is none
+    def m_stats_requested(self, requested_type_name):
+        return self.m_type_names.get(requested_type_name, requested_type_name)
+
+    # Function: get_stats
+    #
+    # Returns the <uvm_factory_stats> collected so far, or None when disabled.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def get_stats(self):
+        return self.m_stats
+
+    # Function: report_stats
+    #
+    # Returns the collected statistics, including the resolution count of
+    # every registered override, formatted as a table or, when ~fmt~ is
+    # "json", as JSON.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def report_stats(self, fmt="table"):
+        if self.m_stats is None:
+            return ""
+        return self.m_stats.convert2string(fmt,
+            self.m_inst_overrides + self.m_type_overrides)
+
+    # Group: Resolution Trace
+
+    # Function: set_trace_depth
+    #
+    # Sets how many of the most recent creates are kept in the resolution
+    # trace (256 by default). A depth of 0 turns tracing off. Resizing keeps
+    # the newest entries.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def set_trace_depth(self, depth):
+        self.m_trace = deque(self.m_trace, maxlen=depth)
+
+    def get_trace_depth(self):
+        return self.m_trace.maxlen
+
+    # Function: get_trace
+    #
+    # Returns the resolution trace, oldest create first, as a list of
+    # (requested_type_name, full_inst_path, override, chain_length,
+    # produced_type_name) tuples. ~override~ is the first
+    # <uvm_factory_override> applied, or None, and ~chain_length~ the number
+    # of overrides applied.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def get_trace(self):
+        ret = []
+        for (requested, parent_inst_path, name, resolution) in self.m_trace:
+            if not isinstance(requested, str):
+                requested = requested.get_type_name()
+            if parent_inst_path == "":
+                full_inst_path = name
+            elif name != "":
+                full_inst_path = parent_inst_path+"."+name
+            else:
+                full_inst_path = parent_inst_path
+            (wrapper, override, chain_length) = resolution
+            ret.append((requested, full_inst_path, override, chain_length,
+                wrapper.get_type_name()))
+        return ret
+
+    def clear_trace(self):
+        self.m_trace.clear()
+
+    # Function: print_trace
+    #
+    # Reports the resolution trace. Called by <uvm_root::die> so that the
+    # trace of the creates leading up to a fatal error is not lost.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def print_trace(self):
+        qs = []
+        qs.append("\n#### Factory Resolution Trace (last %d creates)\n\n" % len(self.m_trace))
+        qs.append("  %-24s %-40s %-32s %5s  %s\n" % (
+            "Requested Type", "Instance Path", "Override", "Chain", "Produced Type"))
+        for (requested, full_inst_path, override, chain_length, produced) in self.get_trace():
+            if override is None:
+                override_desc = "-"
+            elif override.full_inst_path == "":
+                override_desc = override.orig.m_type_name + " (type)"
+            else:
+                override_desc = override.orig.m_type_name + " @ " + override.full_inst_path
+            qs.append("  %-24s %-40s %-32s %5d  %s\n" % (
+                requested, full_inst_path, override_desc, chain_length, produced))
+        qs.append("\n####\n\n")
+        uvm_report_info("UVM/FACTORY/TRACE", "".join(qs), UVM_NONE)
+
+    # Group: Bulk Overrides
+
+    # Function: set_overrides_by_name
+    #
+    # Applies many name-based overrides at once. ~type_overrides~ is a list of
+    # (original_type_name, override_type_name, replace) tuples and
+    # ~inst_overrides~ a list of (original_type_name, override_type_name,
+    # full_inst_path) tuples. The result is the same as calling
+    # <set_type_override_by_name> and <set_inst_override_by_name> for each
+    # entry in order, but the resolution cache is dropped once for the whole
+    # set, and duplicates are found with one lookup per entry rather than a
+    # scan of every existing override.
+    #
+    # The lookup is exact as long as every type override involved has a
+    # registered original type. Otherwise aliasing may change which existing
+    # override an entry matches, and the entry goes through the same scan as
+    # <set_type_override_by_name>.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    @m_uvm_factory_locked
+    def set_overrides_by_name(self, type_overrides=None, inst_overrides=None):
+        if type_overrides is None:
+            type_overrides = []
+        if inst_overrides is None:
+            inst_overrides = []
+        self.m_bump_generation()
+
+        # Type overrides for each original type and original type name
+        by_type = {}
+        by_name = {}
+        untyped = 0
+        for override in self.m_type_overrides:
+            if override.orig.m_type is None:
+                untyped += 1
+            else:
+                by_type.setdefault(override.orig.m_type, []).append(override)
+            by_name.setdefault(override.orig.m_type_name, []).append(override)
+
+        for (original_type_name, override_type_name, replace) in type_overrides:
+            original_type = self.m_type_names.get(original_type_name)
+            override_type = self.m_type_names.get(override_type_name)
+
+            if original_type is None or untyped > 0:
+                override = self.m_set_type_override_by_name(original_type, original_type_name,
+                    override_type, override_type_name, replace)
+            elif original_type_name == override_type_name:
+                uvm_report_warning("TYPDUP", strcat("Requested and actual type name ",
+                    " arguments are identical: ",original_type_name,". Ignoring this override."), UVM_NONE)
+                continue
+            else:
+                # All overrides have a registered original type, so the scan
+                # would visit all of them and match by type or name
+                matches = list(by_type.get(original_type, []))
+                for override_t in by_name.get(original_type_name, []):
+                    if override_t.orig.m_type is not original_type:
+                        matches.append(override_t)
+                for override_t in matches:
+                    if not self.m_replace_type_override(override_t, original_type_name,
+                            override_type, override_type_name, replace):
+                        break
+                if len(matches) > 0:
+                    continue
+
+                override = uvm_factory_override(
+                    full_inst_path="",
+                    orig_type=original_type,
+                    orig_type_name=original_type_name,
+                    ovrd_type=override_type,
+                    ovrd_type_name=override_type_name,
+                    replace=replace)
+                self.m_add_type_override(override)
+
+            if override is not None:
+                if override.orig.m_type is None:
+                    untyped += 1
+                else:
+                    by_type.setdefault(override.orig.m_type, []).insert(0, override)
+                by_name.setdefault(override.orig.m_type_name, []).insert(0, override)
+
+        seen = set()
+        for override in self.m_inst_overrides:
+            seen.add(self.m_inst_override_key(override))
+
+        for (original_type_name, override_type_name, full_inst_path) in inst_overrides:
+            original_type = self.m_type_names.get(original_type_name)
+            override_type = self.m_type_names.get(override_type_name)
+
+            override = uvm_factory_override(
+                full_inst_path,
+                original_type_name,
+                original_type,
+                override_type,
+                override_type_name)
+
+            key = self.m_inst_override_key(override)
+            if key in seen:
+                uvm_report_info("DUPOVRD",strcat("Instance override for '",
+                    original_type_name,"' already exists: override type '",
+                    override_type_name,"' with full_inst_path '",
+                    full_inst_path,"'"),UVM_HIGH)
+                continue
+            seen.add(key)
+
+            if original_type is None:
+                self.m_lookup_strs[original_type_name] = True
+
+            self.m_add_inst_override(override)
+
+    # Function: load_overrides
+    #
+    # Reads overrides from ~filename~ and applies them with
+    # <set_overrides_by_name>. Files ending in ".json" hold an object with
+    # optional "type_overrides" and "inst_overrides" lists, whose entries
+    # have "original" and "override" keys plus "replace" (type overrides,
+    # default true) or "path" (instance overrides):
+    #
+    #| {"type_overrides": [{"original": "a", "override": "b"}],
+    #|  "inst_overrides": [{"original": "a", "override": "c", "path": "env.*"}]}
+    #
+    # Any other file is read as CSV with one override per row, using the same
+    # fields as the +uvm_set_type_override and +uvm_set_inst_override
+    # plusargs. Blank rows and rows starting with '#' are skipped:
+    #
+    #| type,a,b[,0|1]
+    #| inst,a,c,env.*
+    #
+    # Every entry is validated before any is applied. Invalid entries are
+    # reported and skipped. Returns the number of valid entries.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def load_overrides(self, filename):
+        type_overrides = []
+        inst_overrides = []
+
+        try:
+            with open(filename, "r", newline="") as fp:
+                if filename.endswith(".json"):
+                    self.m_parse_override_json(filename, json.load(fp),
+                        type_overrides, inst_overrides)
+                else:
+                    self.m_parse_override_csv(filename, csv.reader(fp),
+                        type_overrides, inst_overrides)
+        except (OSError, ValueError) as e:
+            uvm_report_error("FCTOVRFILE", sformatf("Cannot read factory override file '%s': %s",
+                filename, str(e)), UVM_NONE)
+            return 0
+
+        self.set_overrides_by_name(type_overrides, inst_overrides)
+        return len(type_overrides) + len(inst_overrides)
+
+    def m_parse_override_json(self, filename, data, type_overrides, inst_overrides):
+        if not isinstance(data, dict):
+            uvm_report_error("FCTOVRFILE", filename + ": expected a JSON object", UVM_NONE)
+            return
+
+        for i,entry in enumerate(data.get("type_overrides", [])):
+            if (not isinstance(entry, dict) or not isinstance(entry.get("original"), str) or
+                    not isinstance(entry.get("override"), str) or
+                    not isinstance(entry.get("replace", True), (bool,int))):
+                uvm_report_error("FCTOVRFILE", "%s: invalid type_overrides[%d], entry must specify "
+                    "\"original\", \"override\" and optionally \"replace\"" % (filename, i), UVM_NONE)
+                continue
+            type_overrides.append((entry["original"], entry["override"],
+                bool(entry.get("replace", True))))
+
+        for i,entry in enumerate(data.get("inst_overrides", [])):
+            if (not isinstance(entry, dict) or not isinstance(entry.get("original"), str) or
+                    not isinstance(entry.get("override"), str) or
+                    not isinstance(entry.get("path"), str)):
+                uvm_report_error("FCTOVRFILE", "%s: invalid inst_overrides[%d], entry must specify "
+                    "\"original\", \"override\" and \"path\"" % (filename, i), UVM_NONE)
+                continue
+            inst_overrides.append((entry["original"], entry["override"], entry["path"]))
+
+    def m_parse_override_csv(self, filename, reader, type_overrides, inst_overrides):
+        for row in reader:
+            fields = [f.strip() for f in row]
+            if len(fields) == 0 or fields[0] == "" or fields[0].startswith("#"):
+                continue
+
+            where = "%s:%d" % (filename, reader.line_num)
+            if fields[0] == "type":
+                if len(fields) < 3 or len(fields) > 4 or (len(fields) == 4 and fields[3] not in ("0", "1")):
+                    uvm_report_error("FCTOVRFILE", where + ": invalid type override, row must specify "
+                        "type,<requested_type>,<override_type>[,<replace>]", UVM_NONE)
+                    continue
+                type_overrides.append((fields[1], fields[2], len(fields) == 3 or fields[3] == "1"))
+            elif fields[0] == "inst":
+                if len(fields) != 4:
+                    uvm_report_error("FCTOVRFILE", where + ": invalid instance override, row must specify "
+                        "inst,<requested_type>,<override_type>,<instance_path>", UVM_NONE)
+                    continue
+                inst_overrides.append((fields[1], fields[2], fields[3]))
+            else:
+                uvm_report_error("FCTOVRFILE", where + ": unknown override kind '" + fields[0] +
+                    "', expected 'type' or 'inst'", UVM_NONE)
+
+    # Group: Snapshots
+
+    # Function: snapshot
+    #
+    # Captures the registered types, aliases and overrides, returning a
+    # handle for <restore>. Taking a snapshot does not copy anything: the
+    # factory and the snapshot share their state until the next change to
+    # the factory, which copies it first. Usage counters of the overrides are
+    # not part of the captured state.
+    #
+    #| snap = factory.snapshot()
+    #| for test in tests:
+    #|     apply_overrides(test)
+    #|     run(test)
+    #|     factory.restore(snap)
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    @m_uvm_factory_locked
+    def snapshot(self):
+        self.m_shared = True
+        return m_uvm_factory_snapshot(self, self.m_get_state())
+
+    # Function: restore
+    #
+    # Returns the factory to the state captured by ~snap~, which must have
+    # been taken from this factory. A snapshot may be restored any number of
+    # times. Memoized results and compiled tables are discarded.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    @m_uvm_factory_locked
+    def restore(self, snap):
+        if snap.m_factory is not self:
+            uvm_report_error("FCTSNAP", "Cannot restore a snapshot taken from another factory", UVM_NONE)
+            return
+
+        for (field, value) in snap.m_state.items():
+            setattr(self, field, value)
+        self.m_shared = True
+
+        if self.m_frozen:
+            self.thaw()
+        self.m_generation += 1
+        self.m_resolve_cache = {}
+
     #----------------------------------------------------------------------------
     # PRIVATE MEMBERS
   
@@ -820,61 +1644,377 @@ class uvm_default_factory (uvm_factory):
         else:
             return None
    
+    # Function- m_resolve_type_name_by_inst
+    #
+    # Returns the wrapper named ~requested_type_name~ in the context of
+    # ~full_inst_path~. The first instance alias of that name whose path
+    # matches wins; otherwise the name is looked up globally.
     def m_resolve_type_name_by_inst(self, requested_type_name, full_inst_path):
-        wrapper = None
-
-        # TODO: find with
-        print("TODO: find with")
-#        type_alias_inst = m_inst_aliases.find(i) with ((i.alias_type_name == requested_type_name) && uvm_is_match(i.full_inst_path,full_inst_path))
-#         
-#         if len(type_alias_inst) > 0:
-#             wrapper = type_alias_inst[0].orig.m_type
-#         else:
-#             wrapper = self.m_resolve_type_name(requested_type_name)
-  
-        return wrapper
+        matcher = self.m_inst_alias_index.get(requested_type_name)
+
+        if matcher is not None:
+            type_alias_inst = matcher.match(full_inst_path)
+            if len(type_alias_inst) > 0:
+                return type_alias_inst[0].orig.m_type
+
+        return self.m_resolve_type_name(requested_type_name)
+
+    # Function- m_resolution_key
+    #
+    # Returns a key shared by all instance paths that resolve any request
+    # the same way: paths matching the same instance overrides and the same
+    # instance aliases.
+    def m_resolution_key(self, full_inst_path):
+        if len(self.m_inst_aliases) == 0:
+            return self.m_inst_matcher.match_set(full_inst_path)
+        return (self.m_inst_matcher.match_set(full_inst_path),
+                self.m_inst_alias_matcher.match_set(full_inst_path))
+
+    # Function- m_resolve_by_type_cached
+    #
+    # Memoized front-end to <find_override_by_type> used by the create methods.
+    # Returns a resolution record (see <m_make_resolution>). When no instance
+    # override or instance alias can apply while resolving the type, the
+    # result is keyed by requested_type alone. Otherwise it is keyed by
+    # (requested_type, <m_resolution_key>), so that the cache grows with the
+    # number of distinct override matches rather than with the number of
+    # instance paths. Results remain valid until the next call that bumps
+    # the factory generation.
+    def m_resolve_by_type_cached(self, requested_type, full_inst_path):
+        # A writer swaps in a new cache, so a result computed against an
+        # older configuration lands in the discarded one
+        cache = self.m_resolve_cache
+        resolution = cache.get(requested_type)
+
+        if resolution is None:
+            key = (requested_type, self.m_resolution_key(full_inst_path))
+            resolution = cache.get(key)
+
+            if resolution is None:
+                override_info = []
+                resolution = self.m_make_resolution(
+                    self.find_override_by_type(requested_type, full_inst_path, override_info),
+                    override_info)
+                if resolution[0] is not None:
+                    if self.m_chain_has_inst_overrides(requested_type,
+                            requested_type.get_type_name(), override_info):
+                        cache[key] = resolution
+                    else:
+                        cache[requested_type] = resolution
+
+        return resolution
+
+    # Function- m_make_resolution
+    #
+    # Returns the resolution record of the search that produced ~wrapper~:
+    # (wrapper, first override applied or None, number of overrides
+    # applied), taken from the search's ~override_info~.
+    def m_make_resolution(self, wrapper, override_info):
+        if len(override_info) == 0:
+            return (wrapper, None, 0)
+        return (wrapper, override_info[0], len(override_info))
+
+    # Function- m_rebuild_override_index
+    #
+    # Buckets every type and instance override under its original type name,
+    # under the wrapper that name currently resolves to and under every type
+    # the name is an instance alias of. Each bucket keeps
+    # the order of the source list, which is the priority order: newest first
+    # for type overrides, oldest first for instance overrides.
+    def m_rebuild_override_index(self):
+        with self.m_lock:
+            index = self.m_override_index
+            if index[0] != self.m_generation:
+                index = (self.m_generation,
+                    self.m_build_override_index(self.m_type_overrides),
+                    self.m_build_override_index(self.m_inst_overrides),
+                    {})
+                self.m_override_index = index
+            return index
+
+    # Returns a pair of arrays, indexed by type ID and by name ID, holding
+    # the bucket of overrides for each ID or None
+    def m_build_override_index(self, overrides):
+        by_type = [None] * len(self.m_id_types)
+        by_name = [None] * len(self.m_id_names)
+
+        for i,override in enumerate(overrides):
+            override.m_index = i
+            type_ids = []
+            orig = override.orig
+            if orig.m_type is not None:
+                type_ids.append(self.m_type_ids.get(orig.m_type, -1))
+            if orig.m_name_id >= 0:
+                bucket = by_name[orig.m_name_id]
+                if bucket is None:
+                    by_name[orig.m_name_id] = [override]
+                else:
+                    bucket.append(override)
+                wrapper = self.m_resolve_type_name(orig.m_type_name)
+                if wrapper is not None:
+                    type_ids.append(self.m_type_ids.get(wrapper, -1))
+                # The name may also be an instance alias of other types
+                for alias_type in self.m_inst_alias_types.get(orig.m_type_name, []):
+                    type_ids.append(self.m_type_ids.get(alias_type, -1))
+            seen = set()
+            for type_id in type_ids:
+                if type_id < 0 or type_id in seen:
+                    continue
+                seen.add(type_id)
+                bucket = by_type[type_id]
+                if bucket is None:
+                    by_type[type_id] = [override]
+                else:
+                    bucket.append(override)
+
+        return (by_type, by_name)
+
+    # Function- m_get_override_candidates
+    #
+    # Returns the (instance, type) overrides that could apply to a request
+    # for the type with ID ~type_id~ / the name with ID ~name_id~ (-1 when
+    # unknown), each in priority order.
+    def m_get_override_candidates(self, type_id, name_id):
+        index = self.m_override_index
+        if index[0] != self.m_generation:
+            index = self.m_rebuild_override_index()
+        (generation, type_index, inst_index, candidates) = index
+
+        key = (type_id, name_id)
+        ret = candidates.get(key)
+
+        if ret is None:
+            ret = (self.m_merge_override_buckets(inst_index, type_id, name_id),
+                   self.m_merge_override_buckets(type_index, type_id, name_id))
+            candidates[key] = ret
+
+        return ret
+
+    def m_merge_override_buckets(self, index, type_id, name_id):
+        (by_type_ids, by_name_ids) = index
+        by_type = None
+        by_name = None
+        if type_id >= 0 and type_id < len(by_type_ids):
+            by_type = by_type_ids[type_id]
+        if name_id >= 0 and name_id < len(by_name_ids):
+            by_name = by_name_ids[name_id]
+
+        if by_name is None:
+            return by_type if by_type is not None else []
+        if by_type is None:
+            return by_name
+
+        merged = {}
+        for override in by_type + by_name:
+            merged[override.m_index] = override
+        return [merged[i] for i in sorted(merged.keys())]
+
+    # Function- m_add_inst_override
+    #
+    # Appends ~override~ to the instance overrides and compiles its path into
+    # m_inst_matcher. Priority follows insertion order: first match wins.
+    def m_add_inst_override(self, override):
+        self.m_track_override(override)
+        self.m_inst_matcher.add(override.full_inst_path, override,
+            len(self.m_inst_overrides))
+        self.m_inst_overrides.append(override)
 
+    # Function- m_add_inst_alias
+    #
+    # Appends ~alias~ to the instance aliases and compiles its path into the
+    # matcher of its alias name and into m_inst_alias_matcher.
+    def m_add_inst_alias(self, alias):
+        matcher = self.m_inst_alias_index.get(alias.alias_type_name)
+        if matcher is None:
+            matcher = uvm_inst_path_matcher()
+            self.m_inst_alias_index[alias.alias_type_name] = matcher
+        matcher.add(alias.full_inst_path, alias, len(self.m_inst_aliases))
+        self.m_inst_alias_matcher.add(alias.full_inst_path, alias,
+            len(self.m_inst_aliases))
+        self.m_inst_aliases.append(alias)
+
+    # Function- m_add_type_override
+    #
+    # Prepends ~override~ to the type overrides, which are kept newest first.
+    def m_add_type_override(self, override):
+        self.m_track_override(override)
+        self.m_type_overrides.insert(0, override)
+
+    # Function- m_intern_name
+    #
+    # Returns the name ID of ~type_name~, allocating one if needed. The empty
+    # and "<unknown>" names never match and get no ID.
+    def m_intern_name(self, type_name):
+        if type_name == "" or type_name == "<unknown>":
+            return -1
+
+        name_id = self.m_name_ids.get(type_name)
+        if name_id is None:
+            name_id = len(self.m_id_names)
+            self.m_name_ids[type_name] = name_id
+            self.m_id_names.append(type_name)
+        return name_id
+
+    # Interns the names of both type pairs of a new override
+    def m_track_override(self, override):
+        self.m_track_type_pair(override.orig)
+        self.m_track_type_pair(override.ovrd)
+
+    def m_track_type_pair(self, pair):
+        pair.m_name_id = self.m_intern_name(pair.m_type_name)
+        if pair.m_name_id >= 0:
+            if pair.m_name_id in self.m_pairs_by_name_id.keys():
+                self.m_pairs_by_name_id[pair.m_name_id].append(pair)
+            else:
+                self.m_pairs_by_name_id[pair.m_name_id] = [pair]
+
+    # Points an existing type pair at another type
+    def m_retarget_type_pair(self, pair, m_type, m_type_name):
+        if pair.m_name_id >= 0:
+            self.m_pairs_by_name_id[pair.m_name_id].remove(pair)
+        pair.m_type = m_type
+        pair.m_type_name = m_type_name
+        self.m_track_type_pair(pair)
+
+    m_snapshot_fields = ("m_types", "m_type_ids", "m_id_types", "m_name_ids",
+        "m_id_names", "m_pairs_by_name_id", "m_lookup_strs", "m_type_names",
+        "m_inst_aliases", "m_inst_alias_index", "m_inst_alias_matcher",
+        "m_inst_alias_types", "m_type_overrides", "m_inst_overrides",
+        "m_inst_matcher")
+
+    def m_get_state(self):
+        return {field : getattr(self, field) for field in self.m_snapshot_fields}
+
+    # Function- m_unshare
+    #
+    # Gives the factory private copies of the containers it shares with one
+    # or more snapshots. Overrides are copied since the factory changes them
+    # in place, and the matchers are rebuilt around the copies.
+    def m_unshare(self):
+        self.m_shared = False
+
+        self.m_types = dict(self.m_types)
+        self.m_type_ids = dict(self.m_type_ids)
+        self.m_id_types = list(self.m_id_types)
+        self.m_name_ids = dict(self.m_name_ids)
+        self.m_id_names = list(self.m_id_names)
+        self.m_lookup_strs = dict(self.m_lookup_strs)
+        self.m_type_names = dict(self.m_type_names)
+        self.m_inst_alias_types = {name : list(types)
+            for (name, types) in self.m_inst_alias_types.items()}
+
+        self.m_pairs_by_name_id = {}
+        self.m_type_overrides = [o.m_copy() for o in self.m_type_overrides]
+        inst_overrides = [o.m_copy() for o in self.m_inst_overrides]
+        self.m_inst_overrides = []
+        self.m_inst_matcher = uvm_inst_path_matcher()
+        for override in self.m_type_overrides:
+            self.m_track_override(override)
+        for override in inst_overrides:
+            self.m_add_inst_override(override)
+
+        # Alias entries do not change once added, only the matchers do
+        inst_aliases = self.m_inst_aliases
+        self.m_inst_aliases = []
+        self.m_inst_alias_index = {}
+        self.m_inst_alias_matcher = uvm_inst_path_matcher()
+        for alias in inst_aliases:
+            self.m_add_inst_alias(alias)
+
+    # Function- m_override_info
+    #
+    # The resolution state used by find_override_by_type/find_override_by_name
+    # when the caller passes none. It is kept per thread.
+    @property
+    def m_override_info(self):
+        override_info = getattr(self.m_tls, "override_info", None)
+        if override_info is None:
+            override_info = []
+            self.m_tls.override_info = override_info
+        return override_info
+
+    # Set while the calling thread resolves without counting the overrides
+    # used (see freeze)
+    @property
+    def m_tls_uncounted(self):
+        return getattr(self.m_tls, "uncounted", False)
+
+    # Function- m_bump_generation
+    #
+    # Invalidates all memoized resolution results and thaws a frozen factory.
+    # Called by every method that changes the set of registered types, aliases
+    # or overrides.
+    def m_bump_generation(self):
+        if self.m_shared:
+            self.m_unshare()
+        if self.m_frozen:
+            self.thaw()
+        self.m_generation += 1
+        self.m_resolve_cache = {}
+
+    # Type pairs match by wrapper or by interned name. ~requested_name_id~
+    # may be passed by callers that already interned ~requested_type_name~.
     def m_matches_type_pair(self, 
                             match_type_pair, 
                             requested_type, 
-                            requested_type_name):
-        return (match_type_pair.m_type is not None and match_type_pair.m_type == requested_type) or (match_type_pair.m_type_name != "<unknown>" and match_type_pair.m_type_name != "" and match_type_pair.m_type_name == requested_type_name)
+                            requested_type_name,
+                            requested_name_id=None):
+        if match_type_pair.m_type is not None and match_type_pair.m_type is requested_type:
+            return True
+        if requested_name_id is None:
+            requested_name_id = self.m_name_ids.get(requested_type_name, -1)
+        return requested_name_id >= 0 and match_type_pair.m_name_id == requested_name_id
    
     def m_matches_type_override(self, override, requested_type,
                                 requested_type_name,
                                 full_inst_path="",
                                 match_original_type=True,
-                                resolve_null_type_by_inst=False):
+                                resolve_null_type_by_inst=False,
+                                requested_name_id=None):
 
         if match_original_type:
             match_type_pair = override.orig
         else:
             match_type_pair = override.ovrd
             
+        # Resolve into a copy: with instance aliases, the resolution of a
+        # name depends on full_inst_path and must not stick to the override
         if match_type_pair.m_type is None:
             if resolve_null_type_by_inst:
-                match_type_pair.m_type = self.m_resolve_type_name_by_inst(match_type_pair.m_type_name,full_inst_path)
+                match_type_pair = m_uvm_factory_type_pair_t(
+                    self.m_resolve_type_name_by_inst(match_type_pair.m_type_name,full_inst_path),
+                    match_type_pair.m_type_name, match_type_pair.m_name_id)
             else:
-                match_type_pair.m_type = self.m_resolve_type_name(match_type_pair.m_type_name)
+                match_type_pair = m_uvm_factory_type_pair_t(
+                    self.m_resolve_type_name(match_type_pair.m_type_name),
+                    match_type_pair.m_type_name, match_type_pair.m_name_id)
                 
         return self.m_matches_type_pair(
             match_type_pair=match_type_pair,
             requested_type=requested_type,
-            requested_type_name=requested_type_name)
+            requested_type_name=requested_type_name,
+            requested_name_id=requested_name_id)
                                            
-    def m_matches_inst_override(self, override, requested_type, requested_type_name, full_inst_path=""):
+    # When ~match_inst_path~ is False, the caller has already matched
+    # ~full_inst_path~ through m_inst_matcher and only the type is checked.
+    def m_matches_inst_override(self, override, requested_type, requested_type_name, full_inst_path="",
+                                match_inst_path=True, requested_name_id=None):
         match_type_pair = override.orig
         
         if match_type_pair.m_type is None:
-            match_type_pair.m_type = self.m_resolve_type_name_by_inst(
-                match_type_pair.m_type_name, full_inst_path)
+            match_type_pair = m_uvm_factory_type_pair_t(
+                self.m_resolve_type_name_by_inst(match_type_pair.m_type_name, full_inst_path),
+                match_type_pair.m_type_name, match_type_pair.m_name_id)
             
         if self.m_matches_type_pair(
             match_type_pair=match_type_pair,
             requested_type=requested_type,
-            requested_type_name=requested_type_name):
+            requested_type_name=requested_type_name,
+            requested_name_id=requested_name_id):
             
-            if override.has_wildcard:
+            if not match_inst_path:
+                return True
+            elif override.has_wildcard:
                 if override.full_inst_path == "*" or uvm_is_match(override.full_inst_path,full_inst_path):
                     return True
                 else:
@@ -898,6 +2038,11 @@ class uvm_default_factory (uvm_factory):
     m_debug_pass = False
 
 
+    def m_inst_override_key(self, override):
+        return (override.full_inst_path,
+                override.orig.m_type, override.orig.m_type_name,
+                override.ovrd.m_type, override.ovrd.m_type_name)
+
     def check_inst_override_exists(self, original_type, original_type_name, 
             override_type, override_type_name, full_inst_path):
 
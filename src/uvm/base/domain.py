@@ -23,7 +23,7 @@
 #   permissions and limitations under the License.
 #----------------------------------------------------------------------
 from uvm.base.phase import uvm_phase
-from uvm.base.object_globals import uvm_phase_type
+from uvm.base.object_globals import uvm_phase_type, uvm_phase_state
 from uvm.base.common_phases import uvm_build_phase, uvm_connect_phase,\
     uvm_end_of_elaboration_phase, uvm_start_of_simulation_phase, uvm_run_phase,\
     uvm_extract_phase, uvm_check_phase, uvm_report_phase, uvm_final_phase
@@ -65,7 +65,7 @@ class uvm_domain (uvm_phase):
     @staticmethod
     def get_domains(domains):
         domains.clear()
-        domains.extend(uvm_domain.m_domains)
+        domains.update(uvm_domain.m_domains)
 
 
     # Function -- NODOCS -- get_uvm_schedule
@@ -167,16 +167,14 @@ class uvm_domain (uvm_phase):
 
     # @uvm-ieee 1800.2-2017 auto 9.4.2.4
     def jump(self, phase):
-        print("TODO: uvm_domain.jump")
-#         phases = []
-#         
-#         m_get_transitive_children(phases);
-#     
-#         phases = phases.find(item) with (item.get_state() inside {[UVM_PHASE_STARTED:UVM_PHASE_CLEANUP]}); 
-#     
-#         for ph in phases:
-#             if ph.is_before(phase) or ph.is_after(phase):
-#                 ph.jump(phase)
+        # The successors of the domain node are precomputed by the compiled
+        # phase graph, see <uvm_phase_topology::get_successors>
+        for ph in self.m_get_topology().get_successors(self):
+            state = ph.get_state().value
+            if (state >= uvm_phase_state.UVM_PHASE_STARTED.value and
+                    state <= uvm_phase_state.UVM_PHASE_CLEANUP.value):
+                if ph.is_before(phase) or ph.is_after(phase):
+                    ph.jump(phase)
 
 # jump_all
 # --------
@@ -186,5 +184,5 @@ class uvm_domain (uvm_phase):
         
         uvm_domain.get_domains(domains)
            
-        for domain in domains:
+        for domain in domains.values():
             domain.jump(phase)
@@ -259,11 +259,33 @@ class uvm_factory():
     def create_component_by_name(self, 
             requested_type_name,  
             parent_inst_path, # =""
-            name, 
+            name,
             parent):
         # Pure virtual
         pass
 
+    # Function: create_components_by_type
+    #
+    # Creates one component of the requested type under ~parent~ for each
+    # leaf name in ~names~, and returns them as a list in the same order. The
+    # result is the same as calling <create_component_by_type> once per name,
+    # but overrides are resolved once per group of instance paths that match
+    # the same instance overrides.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def create_components_by_type(self, requested_type, parent_inst_path, names, parent):
+        # Pure virtual
+        pass
+
+    # Function: create_components_by_name
+    #
+    # Name-based equivalent of <create_components_by_type>.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def create_components_by_name(self, requested_type_name, parent_inst_path, names, parent):
+        # Pure virtual
+        pass
+
     # Group -- NODOCS -- Name Aliases
   
     # Function -- NODOCS -- set_type_alias
@@ -345,7 +367,117 @@ class uvm_factory():
     def print(self, all_types=True):
         # Pure virtual
         pass
-    
+
+    # Group: Compiled Mode
+
+    # Function: freeze
+    #
+    # Signals that the override configuration is not expected to change, so
+    # the factory may precompute its lookups. Called by <uvm_root> at the end
+    # of elaboration. Implementations that do not support it ignore the call.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def freeze(self):
+        pass
+
+    # Function: thaw
+    #
+    # Discards any state computed by <freeze>.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def thaw(self):
+        pass
+
+    # Function: is_frozen
+    #
+    # Returns True while the factory is frozen.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def is_frozen(self):
+        return False
+
+    # Group: Bulk Overrides
+
+    # Function: set_overrides_by_name
+    #
+    # Applies a list of (original_type_name, override_type_name, replace) type
+    # overrides and a list of (original_type_name, override_type_name,
+    # full_inst_path) instance overrides in one operation.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def set_overrides_by_name(self, type_overrides=[], inst_overrides=[]):
+        for (original_type_name, override_type_name, replace) in type_overrides:
+            self.set_type_override_by_name(original_type_name, override_type_name, replace)
+        for (original_type_name, override_type_name, full_inst_path) in inst_overrides:
+            self.set_inst_override_by_name(original_type_name, override_type_name, full_inst_path)
+
+    # Function: load_overrides
+    #
+    # Reads overrides from a JSON or CSV file and applies them. Returns the
+    # number of overrides read.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def load_overrides(self, filename):
+        return 0
+
+    # Group: Snapshots
+
+    # Function: snapshot
+    #
+    # Captures the registered types, aliases and overrides. Returns a handle
+    # for <restore>, or None if the factory does not support snapshots.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def snapshot(self):
+        return None
+
+    # Function: restore
+    #
+    # Returns the factory to the state captured by <snapshot>.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def restore(self, snap):
+        pass
+
+    # Group: Resolution Trace
+
+    # Function: print_trace
+    #
+    # Reports the most recent creates and the overrides that determined the
+    # type each one produced.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def print_trace(self):
+        pass
+
+    # Group: Statistics
+
+    # Function: set_stats_enabled
+    #
+    # Turns creation statistics on or off. Implementations that do not
+    # collect statistics ignore the call.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def set_stats_enabled(self, enable=True):
+        pass
+
+    # Function: get_stats
+    #
+    # Returns the statistics collected so far, or None when disabled.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def get_stats(self):
+        return None
+
+    # Function: report_stats
+    #
+    # Returns the collected statistics formatted as a table, or as JSON when
+    # ~fmt~ is "json".
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def report_stats(self, fmt="table"):
+        return ""
+
 
 
 
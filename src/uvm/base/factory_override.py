@@ -27,6 +27,36 @@
 #   permissions and limitations under the License.
 #------------------------------------------------------------------------------
 
+#------------------------------------------------------------------------------
+#
+# CLASS- m_uvm_factory_type_pair_t
+#
+# Internal class. Pairs a (possibly unresolved) wrapper with its type name.
+# ~m_name_id~ is the name as interned by the owning factory, or -1.
+#------------------------------------------------------------------------------
+
+class m_uvm_factory_type_pair_t():
+
+    def __init__(self, m_type=None, m_type_name="", m_name_id=-1):
+        self.m_type = m_type
+        self.m_type_name = m_type_name
+        self.m_name_id = m_name_id
+
+#------------------------------------------------------------------------------
+#
+# CLASS- m_inst_typename_alias_t
+#
+# Internal class. An alias name for ~orig~, valid in the instances matching
+# ~full_inst_path~ (see <uvm_default_factory::set_inst_alias>).
+#------------------------------------------------------------------------------
+
+class m_inst_typename_alias_t():
+
+    def __init__(self, alias_type_name, orig_type, orig_type_name, full_inst_path):
+        self.orig = m_uvm_factory_type_pair_t(orig_type, orig_type_name)
+        self.alias_type_name = alias_type_name
+        self.full_inst_path = full_inst_path
+
 #------------------------------------------------------------------------------
 #
 # CLASS- uvm_factory_override
@@ -45,12 +75,30 @@ class uvm_factory_override():
                 replace=False):
       
         self.full_inst_path   = full_inst_path
-        self.orig = (orig_type, orig_type_name)
-        self.ovrd = (ovrd_type, ovrd_type_name)
+        self.orig = m_uvm_factory_type_pair_t(orig_type, orig_type_name)
+        self.ovrd = m_uvm_factory_type_pair_t(ovrd_type, ovrd_type_name)
         self.replace          = replace
         self.has_wildcard     = self.m_has_wildcard(full_inst_path)
         self.used             = 0
         self.selected         = False
+        self.m_index          = -1 # position in the owning factory list
+
+    # Returns an independent copy, including the interned name IDs and the
+    # usage counters
+    def m_copy(self):
+        ret = uvm_factory_override(
+            self.full_inst_path,
+            self.orig.m_type_name,
+            self.orig.m_type,
+            self.ovrd.m_type,
+            self.ovrd.m_type_name,
+            self.replace)
+        ret.orig.m_name_id = self.orig.m_name_id
+        ret.ovrd.m_name_id = self.ovrd.m_name_id
+        ret.used = self.used
+        ret.selected = self.selected
+        ret.m_index = self.m_index
+        return ret
         
     def m_has_wildcard(self, nm):
         for c in nm:
@@ -0,0 +1,185 @@
+#------------------------------------------------------------------------------
+# Copyright 2019 Matthew Ballance
+#   All Rights Reserved Worldwide
+#
+#   Licensed under the Apache License, Version 2.0 (the
+#   "License"); you may not use this file except in
+#   compliance with the License.  You may obtain a copy of
+#   the License at
+#
+#       http:#www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in
+#   writing, software distributed under the License is
+#   distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+#   CONDITIONS OF ANY KIND, either express or implied.  See
+#   the License for the specific language governing
+#   permissions and limitations under the License.
+#------------------------------------------------------------------------------
+import json
+
+#------------------------------------------------------------------------------
+#
+# CLASS: uvm_factory_stats
+#
+# Creation telemetry collected by <uvm_default_factory> while
+# <uvm_default_factory::set_stats_enabled> is on. For every wrapper that
+# produced objects it records the number of creates and the creation
+# latency, and for every (requested, produced) pair that differ it records
+# how often the override was taken. Wrappers are told apart by identity, so
+# two types that share a name get separate entries; the type name is only
+# used when formatting.
+#
+# Latency percentiles are computed over the most recent ~max_samples~
+# creates of each type.
+#
+# The library implements this class beyond what is documented in IEEE 1800.2.
+#------------------------------------------------------------------------------
+
+# Internal class. Counters and latency samples for one produced type.
+class uvm_factory_type_stats():
+
+    def __init__(self, wrapper, max_samples):
+        self.wrapper = wrapper
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.samples = []
+        self.m_max_samples = max_samples
+
+    def get_type_name(self):
+        return self.wrapper.get_type_name()
+
+    def record(self, elapsed_ns):
+        if len(self.samples) < self.m_max_samples:
+            self.samples.append(elapsed_ns)
+        else:
+            self.samples[self.count % self.m_max_samples] = elapsed_ns
+        self.count += 1
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    # Returns the latency at each of the percentiles ~ps~, sorting the
+    # samples once for all of them.
+    def percentiles(self, *ps):
+        if len(self.samples) == 0:
+            return [0] * len(ps)
+        ordered = sorted(self.samples)
+        last = len(ordered) - 1
+        return [ordered[int(round((p / 100.0) * last))] for p in ps]
+
+
+class uvm_factory_stats():
+
+    def __init__(self, max_samples=1024):
+        self.m_max_samples = max_samples
+        self.m_types = {}     # map<uvm_object_wrapper,uvm_factory_type_stats>
+        self.m_overrides = {} # map<(requested,uvm_object_wrapper),int>
+
+    # Function: record
+    #
+    # Records one create by the ~produced~ wrapper, requested as ~requested~,
+    # that took ~elapsed_ns~ nanoseconds. ~requested~ is the requested
+    # wrapper, or the requested type name when no wrapper is registered
+    # under it, such as an instance alias.
+    def record(self, requested, produced, elapsed_ns):
+        stats = self.m_types.get(produced)
+        if stats is None:
+            stats = uvm_factory_type_stats(produced, self.m_max_samples)
+            self.m_types[produced] = stats
+        stats.record(elapsed_ns)
+
+        if requested is not produced:
+            key = (requested, produced)
+            self.m_overrides[key] = self.m_overrides.get(key, 0) + 1
+
+    def get_type_stats(self, wrapper):
+        return self.m_types.get(wrapper)
+
+    def get_override_count(self, requested, produced):
+        return self.m_overrides.get((requested, produced), 0)
+
+    def clear(self):
+        self.m_types.clear()
+        self.m_overrides.clear()
+
+    @staticmethod
+    def m_get_type_name(requested):
+        if isinstance(requested, str):
+            return requested
+        return requested.get_type_name()
+
+    # Function: to_dict
+    #
+    # Returns the statistics as plain Python data. ~overrides~ is the list of
+    # <uvm_factory_override> entries whose resolution counts are included.
+    def to_dict(self, overrides=None):
+        if overrides is None:
+            overrides = []
+
+        types = []
+        for stats in sorted(self.m_types.values(), key=lambda s: s.total_ns, reverse=True):
+            (p50, p90, p99) = stats.percentiles(50, 90, 99)
+            types.append({
+                "type": stats.get_type_name(),
+                "count": stats.count,
+                "total_ns": stats.total_ns,
+                "mean_ns": stats.total_ns // stats.count if stats.count > 0 else 0,
+                "p50_ns": p50,
+                "p90_ns": p90,
+                "p99_ns": p99,
+                "max_ns": stats.max_ns})
+
+        hits = []
+        for (key, count) in sorted(self.m_overrides.items(), key=lambda e: e[1], reverse=True):
+            hits.append({
+                "requested": uvm_factory_stats.m_get_type_name(key[0]),
+                "produced": key[1].get_type_name(),
+                "count": count})
+
+        resolutions = []
+        for override in overrides:
+            resolutions.append({
+                "original": override.orig.m_type_name,
+                "path": override.full_inst_path,
+                "override": override.ovrd.m_type_name,
+                "used": override.used})
+
+        return {"types": types, "override_hits": hits, "override_resolutions": resolutions}
+
+    # Function: convert2string
+    #
+    # Formats the statistics as a table, or as JSON when ~fmt~ is "json".
+    def convert2string(self, fmt="table", overrides=None):
+        data = self.to_dict(overrides)
+
+        if fmt == "json":
+            return json.dumps(data, indent=2)
+
+        qs = []
+        qs.append("\n#### Factory Creation Statistics\n\n")
+        qs.append("  %-32s %10s %12s %10s %10s %10s %10s\n" % (
+            "Type", "Count", "Total(us)", "Mean(us)", "p50(us)", "p90(us)", "p99(us)"))
+        for t in data["types"]:
+            qs.append("  %-32s %10d %12.1f %10.2f %10.2f %10.2f %10.2f\n" % (
+                t["type"], t["count"], t["total_ns"]/1000.0, t["mean_ns"]/1000.0,
+                t["p50_ns"]/1000.0, t["p90_ns"]/1000.0, t["p99_ns"]/1000.0))
+
+        if len(data["override_hits"]) > 0:
+            qs.append("\nOverride Hits:\n\n")
+            qs.append("  %-32s %-32s %10s\n" % ("Requested Type", "Produced Type", "Count"))
+            for h in data["override_hits"]:
+                qs.append("  %-32s %-32s %10d\n" % (h["requested"], h["produced"], h["count"]))
+
+        if len(data["override_resolutions"]) > 0:
+            qs.append("\nOverride Resolutions:\n\n")
+            qs.append("  %-32s %-32s %-32s %10s\n" % (
+                "Requested Type", "Override Path", "Override Type", "Used"))
+            for r in data["override_resolutions"]:
+                qs.append("  %-32s %-32s %-32s %10d\n" % (r["original"],
+                    r["path"] if r["path"] != "" else "<type override>", r["override"], r["used"]))
+
+        qs.append("\n####\n\n")
+        return "".join(qs)
+
@@ -27,6 +27,7 @@
 from uvm.base.coreservice import uvm_coreservice_t, uvm_default_coreservice_t
 from uvm.base.object_globals import UVM_INFO, UVM_ERROR, UVM_LOW, UVM_FATAL,\
     UVM_NONE, UVM_MEDIUM, m_uvm_core_state, uvm_core_state, uvm_deferred_init
+import functools
 import re
 import cocotb
 
@@ -249,7 +250,32 @@ def uvm_report_fatal(id,
  
 # @uvm-ieee 1800.2-2017 auto F.3.3.1
 def uvm_is_match(expr, str):
-    return re.match(expr, str)
+    return m_uvm_glob_re(expr).search(str) is not None
+
+# Compiled expressions of the most recently matched globs. Bounded like the
+# caches of <uvm_inst_path_matcher>.
+@functools.lru_cache(maxsize=4096)
+def m_uvm_glob_re(expr):
+    return re.compile(uvm_glob_to_re(expr))
+
+# Function: uvm_glob_to_re
+#
+# Converts a glob expression using '*' and '?' into an anchored regular
+# expression. An expression enclosed in '/' characters is already a regular
+# expression and is returned without the delimiters.
+def uvm_glob_to_re(glob):
+    if len(glob) > 1 and glob[0] == "/" and glob[-1] == "/":
+        return glob[1:-1]
+
+    ret = "^"
+    for c in glob:
+        if c == "*":
+            ret += ".*"
+        elif c == "?":
+            ret += "."
+        else:
+            ret += re.escape(c)
+    return ret + "$"
 
 # 
 # parameter UVM_LINE_WIDTH = `UVM_LINE_WIDTH;
@@ -351,10 +377,7 @@ def uvm_init(cs=None):
     # really anything that can be done about that.
     m_uvm_core_state = uvm_core_state.INITIALIZING
    
-    for i in uvm_deferred_init:
-        i.initialize()
-   
-    uvm_deferred_init.clear()
+    m_uvm_flush_deferred_init()
 
     print("--> uvm_init -- get_root")   
     from uvm.base.root import uvm_root
@@ -372,6 +395,19 @@ def uvm_init(cs=None):
      
     m_uvm_core_state = uvm_core_state.INITIALIZED
 
+# Function- m_uvm_flush_deferred_init
+#
+# Initializes, in one pass, everything queued on uvm_deferred_init. In
+# particular this registers with the factory the type_id wrappers recorded by
+# the uvm_component_utils/uvm_object_utils decorators before the core
+# services existed. Called from uvm_init and again at the start of run_test.
+def m_uvm_flush_deferred_init():
+    while len(uvm_deferred_init) > 0:
+        pending = list(uvm_deferred_init)
+        uvm_deferred_init.clear()
+        for i in pending:
+            i.initialize()
+
 # 
 # #----------------------------------------------------------------------------
 # #
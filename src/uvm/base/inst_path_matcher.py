@@ -0,0 +1,209 @@
+#------------------------------------------------------------------------------
+# Copyright 2019 Matthew Ballance
+#   All Rights Reserved Worldwide
+#
+#   Licensed under the Apache License, Version 2.0 (the
+#   "License"); you may not use this file except in
+#   compliance with the License.  You may obtain a copy of
+#   the License at
+#
+#       http:#www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in
+#   writing, software distributed under the License is
+#   distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+#   CONDITIONS OF ANY KIND, either express or implied.  See
+#   the License for the specific language governing
+#   permissions and limitations under the License.
+#------------------------------------------------------------------------------
+import re
+import threading
+
+from uvm.base.globals import uvm_glob_to_re
+
+#------------------------------------------------------------------------------
+#
+# CLASS- uvm_inst_path_matcher
+#
+# Internal class. Matches an instance path against a set of patterns in a
+# single pass and returns the payloads of every matching pattern, ordered by
+# the priority given when the pattern was added (lowest first).
+#
+# Exact paths are kept in a dictionary. Glob patterns using '*' and '?' are
+# compiled into a character trie with wildcard edges that is walked as an
+# NFA. Patterns of the form "/regex/" are kept as compiled expressions.
+#
+# The patterns and the per-path result caches form an immutable snapshot.
+# Readers take no lock: they work on the snapshot current when they start,
+# and cache their result in that snapshot. <add> and <clear> build a new
+# snapshot under the writer lock and publish it by swapping a single
+# attribute, so neither a result computed against older patterns nor a
+# half-made change is ever seen by a later match.
+#------------------------------------------------------------------------------
+
+class m_uvm_path_trie_node():
+
+    def __init__(self, loop=False):
+        self.children = {} # map<char,m_uvm_path_trie_node>
+        self.qmark = None  # edge matching any single character
+        self.star = None   # edge matching any sequence of characters
+        self.loop = loop   # node was reached by a '*' edge
+        self.payloads = [] # list of (priority, payload)
+
+    # Returns a copy sharing the children of this node
+    def m_copy(self):
+        ret = m_uvm_path_trie_node(self.loop)
+        ret.children = dict(self.children)
+        ret.qmark = self.qmark
+        ret.star = self.star
+        ret.payloads = list(self.payloads)
+        return ret
+
+
+# Internal class. The patterns of a <uvm_inst_path_matcher> and the results
+# cached for them. Only the caches change once the snapshot is published.
+class m_uvm_path_matcher_snapshot():
+
+    def __init__(self, exact, root, regex, size):
+        self.m_exact = exact  # map<string,list of (priority, payload)>
+        self.m_root = root    # m_uvm_path_trie_node
+        self.m_regex = regex  # list of (compiled re, priority, payload)
+        self.m_size = size
+        self.m_cache = {}     # map<string,list of payload>
+        self.m_set_cache = {} # map<string,frozenset of payload>
+
+
+class uvm_inst_path_matcher():
+
+    # Results cached per snapshot before the caches are flushed
+    m_max_cache = 4096
+
+    def __init__(self):
+        self.m_lock = threading.Lock()
+        self.m_snap = m_uvm_path_matcher_snapshot({}, m_uvm_path_trie_node(), [], 0)
+
+    def size(self):
+        return self.m_snap.m_size
+
+    # Function- add
+    #
+    # Adds ~pattern~, returning ~payload~ for matching paths. Lower ~priority~
+    # values are returned first.
+    def add(self, pattern, payload, priority=0):
+        entry = (priority, payload)
+
+        with self.m_lock:
+            snap = self.m_snap
+            exact = snap.m_exact
+            root = snap.m_root
+            regex = snap.m_regex
+
+            if len(pattern) > 1 and pattern[0] == "/" and pattern[-1] == "/":
+                regex = regex + [(re.compile(uvm_glob_to_re(pattern)), priority, payload)]
+            elif "*" not in pattern and "?" not in pattern:
+                exact = dict(exact)
+                exact[pattern] = exact.get(pattern, []) + [entry]
+            else:
+                # Copy the nodes along the path of the pattern
+                root = root.m_copy()
+                node = root
+                for c in pattern:
+                    if c == "*":
+                        child = m_uvm_path_trie_node(True) if node.star is None else node.star.m_copy()
+                        node.star = child
+                    elif c == "?":
+                        child = m_uvm_path_trie_node() if node.qmark is None else node.qmark.m_copy()
+                        node.qmark = child
+                    else:
+                        child = node.children.get(c)
+                        child = m_uvm_path_trie_node() if child is None else child.m_copy()
+                        node.children[c] = child
+                    node = child
+                node.payloads.append(entry)
+
+            self.m_snap = m_uvm_path_matcher_snapshot(exact, root, regex, snap.m_size+1)
+
+    def clear(self):
+        with self.m_lock:
+            self.m_snap = m_uvm_path_matcher_snapshot({}, m_uvm_path_trie_node(), [], 0)
+
+    # Function- match
+    #
+    # Returns the payloads of all patterns matching ~path~, in priority order.
+    def match(self, path):
+        return self.m_match(self.m_snap, path)
+
+    # Function- match_set
+    #
+    # Returns the payloads of all patterns matching ~path~ as a set.
+    def match_set(self, path):
+        snap = self.m_snap
+        ret = snap.m_set_cache.get(path)
+
+        if ret is None:
+            ret = frozenset(self.m_match(snap, path))
+            self.m_cache_result(snap.m_set_cache, path, ret)
+
+        return ret
+
+    def m_match(self, snap, path):
+        ret = snap.m_cache.get(path)
+
+        if ret is None:
+            entries = []
+
+            exact = snap.m_exact.get(path)
+            if exact is not None:
+                entries.extend(exact)
+
+            for (expr, priority, payload) in snap.m_regex:
+                if expr.search(path) is not None:
+                    entries.append((priority, payload))
+
+            states = self.m_closure([snap.m_root])
+            for c in path:
+                if len(states) == 0:
+                    break
+                next_states = []
+                for node in states:
+                    child = node.children.get(c)
+                    if child is not None:
+                        next_states.append(child)
+                    if node.qmark is not None:
+                        next_states.append(node.qmark)
+                    if node.loop:
+                        next_states.append(node)
+                states = self.m_closure(next_states)
+
+            for node in states:
+                entries.extend(node.payloads)
+
+            entries.sort(key=lambda e: e[0])
+            ret = [e[1] for e in entries]
+            self.m_cache_result(snap.m_cache, path, ret)
+
+        return ret
+
+    # Caches are flushed once full, so that unique instance paths do not
+    # grow them without bound
+    def m_cache_result(self, cache, path, ret):
+        if len(cache) >= uvm_inst_path_matcher.m_max_cache:
+            cache.clear()
+        cache[path] = ret
+
+    # Adds the nodes reachable through '*' edges, which may match nothing
+    def m_closure(self, nodes):
+        ret = []
+        seen = set()
+        stack = list(nodes)
+
+        while len(stack) > 0:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            ret.append(node)
+            if node.star is not None:
+                stack.append(node.star)
+
+        return ret
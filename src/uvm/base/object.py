@@ -295,6 +295,31 @@ class uvm_object(uvm_void):
             tmp.copy(self)
         return tmp
 
+    # Function: recycle
+    #
+    # Prepares an object returned to a <uvm_object_pool> for reuse. Renames
+    # the object to ~name~ and calls <do_recycle>.
+    #
+    # The ~recycle~ method is not virtual and should not be overloaded in
+    # derived classes. To reset the fields of a derived class, that class
+    # should override the <do_recycle> method.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def recycle(self, name=""):
+        self.set_name(name)
+        self.do_recycle()
+
+    # Function: do_recycle
+    #
+    # The ~do_recycle~ method is the user-definable hook called by the
+    # <recycle> method. A derived class should override this method to restore
+    # its fields to the values they have after construction, and must call
+    # ~super().do_recycle()~.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    def do_recycle(self):
+        pass
+
 
     # Group -- NODOCS -- Printing
 
@@ -536,7 +536,7 @@ class uvm_phase_type(Enum):
 #|                       +-------------------------------------------- JUMPING< -+
 
 class uvm_phase_state(Enum):
-    UVM_PHASE_UNINITIALIZED = 0,
+    UVM_PHASE_UNINITIALIZED = 0
     UVM_PHASE_DORMANT       = 1
     UVM_PHASE_SCHEDULED     = 2
     UVM_PHASE_SYNCING       = 4
@@ -0,0 +1,111 @@
+#------------------------------------------------------------------------------
+# Copyright 2019 Matthew Ballance
+#   All Rights Reserved Worldwide
+#
+#   Licensed under the Apache License, Version 2.0 (the
+#   "License"); you may not use this file except in
+#   compliance with the License.  You may obtain a copy of
+#   the License at
+#
+#       http:#www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in
+#   writing, software distributed under the License is
+#   distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+#   CONDITIONS OF ANY KIND, either express or implied.  See
+#   the License for the specific language governing
+#   permissions and limitations under the License.
+#------------------------------------------------------------------------------
+
+#------------------------------------------------------------------------------
+#
+# CLASS: uvm_object_pool
+#
+# Bounded free-list of objects produced by a single <uvm_object_wrapper>.
+# Pools are created on demand by <uvm_default_factory::acquire_object_by_type>;
+# objects handed back through <uvm_default_factory::release_object> are reset
+# with <uvm_object::recycle> and reused by the next acquire instead of being
+# constructed again.
+#
+# The library implements this class beyond what is documented in IEEE 1800.2.
+#------------------------------------------------------------------------------
+
+class uvm_object_pool():
+
+    def __init__(self, wrapper, max_size=64):
+        self.m_wrapper = wrapper
+        self.m_free = []
+        self.m_max_size = max_size
+        self.m_hits = 0
+        self.m_misses = 0
+        self.m_drops = 0
+
+    # Function: acquire
+    #
+    # Returns a recycled object named ~name~ if one is available, otherwise
+    # creates a new one through the wrapper.
+    def acquire(self, name=""):
+        if len(self.m_free) > 0:
+            self.m_hits += 1
+            obj = self.m_free.pop()
+            obj.recycle(name)
+            return obj
+
+        self.m_misses += 1
+        return self.m_wrapper.create_object(name)
+
+    # Function: release
+    #
+    # Returns ~obj~ to the pool. The object is dropped when the pool already
+    # holds <get_max_size> objects. The caller must not use ~obj~ afterwards.
+    def release(self, obj):
+        if len(self.m_free) < self.m_max_size:
+            self.m_free.append(obj)
+        else:
+            self.m_drops += 1
+
+    # Function: set_max_size
+    #
+    # Bounds the number of idle objects held by the pool. Shrinking the bound
+    # discards the excess idle objects.
+    def set_max_size(self, max_size):
+        self.m_max_size = max_size
+        if len(self.m_free) > max_size:
+            del self.m_free[max_size:]
+
+    def get_max_size(self):
+        return self.m_max_size
+
+    # Function: get_size
+    #
+    # Returns the number of idle objects currently held by the pool.
+    def get_size(self):
+        return len(self.m_free)
+
+    # Function: get_hits
+    #
+    # Returns the number of acquires satisfied from the free-list.
+    def get_hits(self):
+        return self.m_hits
+
+    # Function: get_misses
+    #
+    # Returns the number of acquires that had to construct a new object.
+    def get_misses(self):
+        return self.m_misses
+
+    # Function: get_drops
+    #
+    # Returns the number of releases discarded because the pool was full.
+    def get_drops(self):
+        return self.m_drops
+
+    def get_wrapper(self):
+        return self.m_wrapper
+
+    def clear(self):
+        self.m_free.clear()
+        self.m_hits = 0
+        self.m_misses = 0
+        self.m_drops = 0
+
@@ -3,14 +3,72 @@ Created on Oct 8, 2019
 
 @author: ballance
 '''
+from uvm.base.object_wrapper import uvm_object_wrapper
 
-class uvm_object_registry():
+#------------------------------------------------------------------------------
+#
+# CLASS -- NODOCS -- uvm_object_registry #(T,Tname)
+#
+# The uvm_object_registry serves as a lightweight proxy for a <uvm_object> of
+# type ~T~. It is the ~type_id~ installed on a class by <uvm_object_utils>
+# and is the wrapper registered with the factory for that class.
+#------------------------------------------------------------------------------
+
+# @uvm-ieee 1800.2-2017 auto 8.2.4.1
+class uvm_object_registry(uvm_object_wrapper):
     
     def __init__(self, cls):
+        super().__init__(cls)
         self.target_cls = cls
-        
-    def create(self, name = ""):
-        if name == "":
-            return self.target_cls()
-        else:
-            return self.target_cls(name)
+
+    # Function -- NODOCS -- get
+    #
+    # Returns the singleton instance of this type. Type-based factory operation
+    # depends on there being a single proxy instance for each registered type.
+
+    def get(self):
+        return self
+
+    # Function -- NODOCS -- create
+    #
+    # Returns an instance of the object type, ~T~, represented by this proxy,
+    # subject to any factory overrides based on the context provided by the
+    # ~parent~'s full name. The ~contxt~ argument, if supplied, supersedes the
+    # ~parent~'s context. The new instance will have the given leaf ~name~,
+    # if provided.
+
+    def create(self, name="", parent=None, contxt=""):
+        from uvm.base.coreservice import uvm_coreservice_t
+        if contxt == "" and parent is not None:
+            contxt = parent.get_full_name()
+        return uvm_coreservice_t.get().get_factory().create_object_by_type(
+            self, contxt, name)
+
+    # Function -- NODOCS -- set_type_override
+    #
+    # Configures the factory to create an object of the type represented by
+    # ~override_type~ whenever a request is made to create an object of the type
+    # represented by this proxy, provided no instance override applies.
+
+    def set_type_override(self, override_type, replace=True):
+        from uvm.base.coreservice import uvm_coreservice_t
+        uvm_coreservice_t.get().get_factory().set_type_override_by_type(
+            self, override_type, replace)
+
+    # Function -- NODOCS -- set_inst_override
+    #
+    # Configures the factory to create an object of the type represented by
+    # ~override_type~ whenever a request is made to create an object of the type
+    # represented by this proxy, with matching instance paths. If ~parent~ is
+    # given, ~inst_path~ is interpreted as being relative to the ~parent~'s
+    # hierarchical instance path.
+
+    def set_inst_override(self, override_type, inst_path, parent=None):
+        from uvm.base.coreservice import uvm_coreservice_t
+        if parent is not None:
+            if inst_path == "":
+                inst_path = parent.get_full_name()
+            else:
+                inst_path = parent.get_full_name() + "." + inst_path
+        uvm_coreservice_t.get().get_factory().set_inst_override_by_type(
+            self, override_type, inst_path)
@@ -26,6 +26,7 @@
 #   the License for the specific language governing
 #   permissions and limitations under the License.
 #------------------------------------------------------------------------------
+import inspect
 
 #------------------------------------------------------------------------------
 #
@@ -45,6 +46,45 @@ class uvm_object_wrapper():
     
     def __init__(self, T):
         self.T = T
+        self.m_bind_constructors()
+
+    # Function- m_bind_constructors
+    #
+    # Replaces <create_object> and <create_component> on this instance with
+    # callables specialized for the signature of T, so that creating through
+    # the wrapper costs about the same as calling T directly. Derived wrappers
+    # that override the create methods are left untouched.
+    def m_bind_constructors(self):
+        T = self.T
+        cls = type(self)
+
+        if cls.create_component is uvm_object_wrapper.create_component:
+            self.create_component = T
+
+        if cls.create_object is not uvm_object_wrapper.create_object:
+            return
+
+        try:
+            params = list(inspect.signature(T).parameters.values())
+        except (TypeError, ValueError):
+            return
+
+        if len(params) == 0:
+            def create_object(name=""):
+                obj = T()
+                if name != "":
+                    obj.set_name(name)
+                return obj
+        elif params[0].kind in (params[0].VAR_POSITIONAL, params[0].VAR_KEYWORD):
+            return
+        elif params[0].default is params[0].empty:
+            create_object = T
+        else:
+            default_name = params[0].default
+            def create_object(name=""):
+                return T(name or default_name)
+
+        self.create_object = create_object
 
     # Function -- NODOCS -- create_object
     #
@@ -80,5 +120,10 @@ class uvm_object_wrapper():
     def get_type_name(self):
         return self.T.__name__
 
+    # Function- initialize
+    #
+    # Registers this wrapper with the factory. Called from uvm_init for
+    # wrappers queued on uvm_deferred_init by the utils decorators.
     def initialize(self):
-        pass
+        from uvm.base.coreservice import uvm_coreservice_t
+        uvm_coreservice_t.get().get_factory().register(self)
@@ -25,14 +25,19 @@
 #   permissions and limitations under the License.
 #----------------------------------------------------------------------
 from uvm.base.object import uvm_object
+from collections import deque
 from uvm.base.object_globals import uvm_phase_type, uvm_core_state,\
-    m_uvm_core_state, uvm_phase_state
+    m_uvm_core_state, uvm_phase_state, uvm_wait_op
 import cocotb
-from cocotb.triggers import Timer
+from cocotb.triggers import Event, First, NullTrigger
+from cocotb.utils import get_sim_time
 from uvm.util.mailbox import Mailbox
-from uvm.uvm_macros import uvm_fatal
+from uvm.util.countdown_barrier import CountdownBarrier
+from uvm.uvm_macros import uvm_fatal, uvm_error, uvm_warning
 from uvm.util.format import strcat
 from uvm.base.phase_state_change import uvm_phase_state_change
+from uvm.base.phase_topology import uvm_phase_topology
+from uvm.base.phase_sync import uvm_phase_sync_barrier
 import uvm.base
 
 #------------------------------------------------------------------------------
@@ -139,6 +144,20 @@ class uvm_phase(uvm_object):
 
     #`uvm_object_utils(uvm_phase)
 
+    m_phase_trace = False
+
+    # The most recent jumps, see <get_jump_trace>
+    m_jump_trace = deque(maxlen=256)
+
+    # Active <uvm_phase_profiler>, None unless phase profiling is enabled
+    m_profiler = None
+
+    m_default_max_ready_to_end_iters = 20 # 20 is the initial value defined by 1800.2-2017 9.3.1.3.5
+
+    # Bumped on every change to the m_predecessors/m_successors graph.
+    # Compiled topologies built at an older version are stale.
+    m_graph_version = 0
+
     # TODO: callbacks
 #  `uvm_register_cb(uvm_phase, uvm_phase_cb)
 
@@ -166,10 +185,29 @@ class uvm_phase(uvm_object):
         self.m_imp = None          # phase imp to call when we execute this node
         
         self.m_run_count = 0 # num times this phase has executed
+        self.m_topology = None # uvm_phase_topology
 #   local process            m_phase_proc;
-#   local static int         m_default_max_ready_to_end_iters = 20;    # 20 is the initial value defined by 1800.2-2017 9.3.1.3.5
-#   int                      max_ready_to_end_iters = get_default_max_ready_to_end_iterations();
-        self.m_num_procs_not_yet_returned = 0
+        self.max_ready_to_end_iters = uvm_phase.get_default_max_ready_to_end_iterations()
+        self.m_ready_to_end_count = 0
+        self.m_task_procs = CountdownBarrier() # processes forked by a task phase
+        self.m_pred_latch = -1 # predecessors not yet DONE; -1 until armed
+        self.m_state_ev = None # Event fired on the next state change
+        # (CountdownBarrier, id) entries of the nodes waiting in
+        # m_wait_for_pred for this node to reach READY_TO_END
+        self.m_rte_waiters = None
+        self.m_sync = []  # nodes to which we are synced
+        self.m_sync_barrier = None # uvm_phase_sync_barrier shared with them
+        self.m_jump_bkwd = False
+        self.m_jump_fwd = False
+        self.m_jump_phase = None
+        self.m_premature_end = False
+        self.m_jump_ev = None  # Event fired by end_prematurely()
+        self.m_exec_proc = None # running execute_phase(), until it is DONE
+        # Domains run their nodes from their own ready queue
+        self.m_ready_queue = None
+        if phase_type == uvm_phase_type.UVM_PHASE_DOMAIN:
+            self.m_ready_queue = Mailbox()
+        self.m_driver = None
         
 #   begin
 #     uvm_cmdline_processor clp = uvm_cmdline_processor::get_inst();
@@ -189,67 +227,100 @@ class uvm_phase(uvm_object):
             self.m_end_node = uvm_phase(name + "_end", uvm_phase_type.UVM_PHASE_TERMINAL, self)
             self.m_successors[self.m_end_node] = True
             self.m_end_node.m_predecessors[self] = True
+            uvm_phase.m_graph_version += 1
 
     # @uvm-ieee 1800.2-2017 auto 9.3.1.3.2
     def get_phase_type(self):
         return self.m_phase_type
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.3.3
-#   extern virtual function void set_max_ready_to_end_iterations(int max);
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.3.4
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.3.6
-#   extern virtual function int get_max_ready_to_end_iterations();
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.3.5
-#   extern static function void set_default_max_ready_to_end_iterations(int max);
-# 
-#   extern static function int get_default_max_ready_to_end_iterations();
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.3.3
+    def set_max_ready_to_end_iterations(self, max):
+        self.max_ready_to_end_iters = max
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.3.4
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.3.6
+    def get_max_ready_to_end_iterations(self):
+        return self.max_ready_to_end_iters
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.3.5
+    @staticmethod
+    def set_default_max_ready_to_end_iterations(max):
+        uvm_phase.m_default_max_ready_to_end_iters = max
+
+    @staticmethod
+    def get_default_max_ready_to_end_iterations():
+        return uvm_phase.m_default_max_ready_to_end_iters
 # 
 #     #-------------
 #     # Group -- NODOCS -- State
 #     #-------------
 # 
 # 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.4.1
-#   extern function uvm_phase_state get_state();
-# 
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.4.2
-#   extern function int get_run_count();
-# 
-# 
-# 
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.4.1
+    def get_state(self):
+        return self.m_state
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.4.2
+    def get_run_count(self):
+        return self.m_run_count
+
     # @uvm-ieee 1800.2-2017 auto 9.3.1.4.3
     def find_by_name(self, name, stay_in_scope=True):
-        print("TODO: uvm_phase.find_by_name()")
+        if self.get_name() == name:
+            return self
+        topo = self.m_get_topology()
+        candidates = topo.get_name_match(name)
+        ret = topo.find_predecessor(self, candidates, stay_in_scope)
+        if ret is None:
+            ret = topo.find_successor(self, candidates, stay_in_scope)
+        return ret
 
     # @uvm-ieee 1800.2-2017 auto 9.3.1.4.4
     def find(self, phase, stay_in_scope=True):
-        print("TODO: uvm_phase.find()")
+        if phase is None:
+            return None
+        if phase == self.m_imp or phase == self:
+            return phase
+        topo = self.m_get_topology()
+        candidates = topo.get_match(phase)
+        ret = topo.find_predecessor(self, candidates, stay_in_scope)
+        if ret is None:
+            ret = topo.find_successor(self, candidates, stay_in_scope)
+        return ret
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.4.5
+    def is_(self, phase):
+        return self.m_imp == phase or self == phase
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.4.6
+    def is_before(self, phase):
+        # TODO: add support for 'stay_in_scope=1' functionality
+        if phase is None or self.is_(phase):
+            return False
+        topo = self.m_get_topology()
+        return topo.find_successor(self, topo.get_match(phase), False) is not None
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.4.7
+    def is_after(self, phase):
+        # TODO: add support for 'stay_in_scope=1' functionality
+        if phase is None or self.is_(phase):
+            return False
+        topo = self.m_get_topology()
+        return topo.find_predecessor(self, topo.get_match(phase), False) is not None
+
 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.4.5
-#   extern function bit is(uvm_phase phase);
-# 
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.4.6
-#   extern function bit is_before(uvm_phase phase);
-# 
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.4.7
-#   extern function bit is_after(uvm_phase phase);
-# 
-# 
 #     #-----------------
 #     # Group -- NODOCS -- Callbacks
 #     #-----------------
 # 
 # 
 #     # @uvm-ieee 1800.2-2017 auto 9.3.1.5.1
+
+    # Name of the uvm_component method that this imp's exec_func or
+    # exec_task calls. Traversals skip components for which that method
+    # is a no-op (see <uvm_component::m_is_noop_phase_method>).
+    m_phase_method = None
+
     def exec_func(self, comp, phase):
         # Nop
         pass
@@ -257,8 +328,7 @@ class uvm_phase(uvm_object):
 # 
 # 
     # @uvm-ieee 1800.2-2017 auto 9.3.1.5.2
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
+    async def exec_task(self, comp, phase):
         pass
 # 
 #     #----------------
@@ -273,16 +343,13 @@ class uvm_phase(uvm_object):
             before_phase=None,
             start_with_phase=None,
             end_with_phase=None):
-        print("TODO: uvm_phase.add() - " + str(phase) + " - " + str(phase.get_phase_type()))
-#   uvm_phase new_node, begin_node, end_node, tmp_node;
-#   uvm_phase_state_change state_chg;
-# 
         new_node = None
         begin_node = None
         end_node = None
         
         if phase is None:
             uvm_fatal("PH/NULL", "add: phase argument is null")
+            return
  
         if with_phase is not None and with_phase.get_phase_type() == uvm_phase_type.UVM_PHASE_IMP:
             nm = with_phase.get_name()
@@ -297,68 +364,59 @@ class uvm_phase(uvm_object):
             if before_phase is None:
                 uvm_fatal("PH_BAD_ADD",
                     strcat("cannot find before_phase '",nm,"' within node '",self.get_name(),"'"))
-# 
-#   if (after_phase != null  and  after_phase.get_phase_type() == UVM_PHASE_IMP) begin
-#     string nm = after_phase.get_name();
-#     after_phase = find(after_phase);
-#     if (after_phase  is None)
-#       `uvm_fatal("PH_BAD_ADD",
-#          {"cannot find after_phase '",nm,"' within node '",get_name(),"'"})
-#   end
-# 
-#   if (start_with_phase != null  and  start_with_phase.get_phase_type() == UVM_PHASE_IMP) begin
-#     string nm = start_with_phase.get_name();
-#     start_with_phase = find(start_with_phase);
-#     if (start_with_phase  is None)
-#       `uvm_fatal("PH_BAD_ADD",
-#          {"cannot find start_with_phase '",nm,"' within node '",get_name(),"'"})
-#   end
-# 
-#   if (end_with_phase != null  and  end_with_phase.get_phase_type() == UVM_PHASE_IMP) begin
-#      string nm = end_with_phase.get_name();
-#      end_with_phase = find(end_with_phase);
-#      if (end_with_phase  is None)
-#       `uvm_fatal("PH_BAD_ADD",
-#          {"cannot find end_with_phase '",nm,"' within node '",get_name(),"'"})
-#   end
-# 
-#   if (((with_phase != null) + (after_phase != null) + (start_with_phase != null)) > 1)
-#     `uvm_fatal("PH_BAD_ADD",
-#        "only one of with_phase/after_phase/start_with_phase may be specified as they all specify predecessor")
-# 
-#   if (((with_phase != null) + (before_phase != null) + (end_with_phase != null)) > 1)
-#     `uvm_fatal("PH_BAD_ADD",
-#        "only one of with_phase/before_phase/end_with_phase may be specified as they all specify successor")
-# 
-#   if (before_phase == this  or  
-#      after_phase == m_end_node  or  
-#      with_phase == m_end_node  or 
-#      start_with_phase == m_end_node  or 
-#      end_with_phase == m_end_node) 
-#     `uvm_fatal("PH_BAD_ADD",
-#        "cannot add before begin node, after end node, or with end nodes")
-# 
-#   if (before_phase != null  and  after_phase != null) begin
-#     if (!after_phaseis_before=before_phase) begin
-#       `uvm_fatal("PH_BAD_ADD",{"Phase '",before_phase.get_name(),
-#                  "' is not before phase '",after_phase.get_name(),"'"})
-#     end
-#   end
-# 
-#   if (before_phase != null  and  start_with_phase != null) begin
-#     if (!start_with_phaseis_before=before_phase) begin
-#       `uvm_fatal("PH_BAD_ADD",{"Phase '",before_phase.get_name(),
-#                  "' is not before phase '",start_with_phase.get_name(),"'"})
-#     end
-#   end
-# 
-#   if (end_with_phase != null  and  after_phase != null) begin
-#     if (!after_phaseis_before=end_with_phase) begin
-#        `uvm_fatal("PH_BAD_ADD",{"Phase '",end_with_phase.get_name(),
-#                  "' is not before phase '",after_phase.get_name(),"'"})
-#     end
-#   end
-# 
+
+        if after_phase is not None and after_phase.get_phase_type() == uvm_phase_type.UVM_PHASE_IMP:
+            nm = after_phase.get_name()
+            after_phase = self.find(after_phase)
+            if after_phase is None:
+                uvm_fatal("PH_BAD_ADD",
+                    strcat("cannot find after_phase '",nm,"' within node '",self.get_name(),"'"))
+
+        if start_with_phase is not None and start_with_phase.get_phase_type() == uvm_phase_type.UVM_PHASE_IMP:
+            nm = start_with_phase.get_name()
+            start_with_phase = self.find(start_with_phase)
+            if start_with_phase is None:
+                uvm_fatal("PH_BAD_ADD",
+                    strcat("cannot find start_with_phase '",nm,"' within node '",self.get_name(),"'"))
+
+        if end_with_phase is not None and end_with_phase.get_phase_type() == uvm_phase_type.UVM_PHASE_IMP:
+            nm = end_with_phase.get_name()
+            end_with_phase = self.find(end_with_phase)
+            if end_with_phase is None:
+                uvm_fatal("PH_BAD_ADD",
+                    strcat("cannot find end_with_phase '",nm,"' within node '",self.get_name(),"'"))
+
+        if ((with_phase is not None) + (after_phase is not None) + (start_with_phase is not None)) > 1:
+            uvm_fatal("PH_BAD_ADD",
+                "only one of with_phase/after_phase/start_with_phase may be specified as they all specify predecessor")
+
+        if ((with_phase is not None) + (before_phase is not None) + (end_with_phase is not None)) > 1:
+            uvm_fatal("PH_BAD_ADD",
+                "only one of with_phase/before_phase/end_with_phase may be specified as they all specify successor")
+
+        if (before_phase == self or
+                after_phase == self.m_end_node or
+                with_phase == self.m_end_node or
+                start_with_phase == self.m_end_node or
+                end_with_phase == self.m_end_node):
+            uvm_fatal("PH_BAD_ADD",
+                "cannot add before begin node, after end node, or with end nodes")
+
+        if before_phase is not None and after_phase is not None:
+            if not after_phase.is_before(before_phase):
+                uvm_fatal("PH_BAD_ADD", strcat("Phase '",before_phase.get_name(),
+                    "' is not before phase '",after_phase.get_name(),"'"))
+
+        if before_phase is not None and start_with_phase is not None:
+            if not start_with_phase.is_before(before_phase):
+                uvm_fatal("PH_BAD_ADD", strcat("Phase '",before_phase.get_name(),
+                    "' is not before phase '",start_with_phase.get_name(),"'"))
+
+        if end_with_phase is not None and after_phase is not None:
+            if not after_phase.is_before(end_with_phase):
+                uvm_fatal("PH_BAD_ADD", strcat("Phase '",end_with_phase.get_name(),
+                    "' is not before phase '",after_phase.get_name(),"'"))
+
         # If we are inserting a new "leaf node"
         if phase.get_phase_type() == uvm_phase_type.UVM_PHASE_IMP:
             new_node = uvm_phase(phase.get_name(),uvm_phase_type.UVM_PHASE_NODE,self)
@@ -370,188 +428,204 @@ class uvm_phase(uvm_object):
             begin_node = phase
             end_node   = phase.m_end_node
             phase.m_parent = self
-# 
-#     # If 'with_phase' is us, then insert node in parallel
-#   /*
-#   if (with_phase == this) begin
-#     after_phase = this;
-#     before_phase = m_end_node;
-#   end
-#   */
 
         # If no before/after/with specified, insert at end of this schedule
         if with_phase is None and after_phase is None  and before_phase is None and start_with_phase is None  and  end_with_phase is None:
             before_phase = self.m_end_node
-# 
-# 
-#   if (m_phase_trace) begin
-#     uvm_phase_type typ = phase.get_phase_type();
-#     `uvm_info("PH/TRC/ADD_PH",
-#       {get_name()," (",m_phase_type.name(),") ADD_PHASE: phase=",phase.get_full_name()," (",
-#       typ.name(),", inst_id=",$sformatf("%0d",phase.get_inst_id()),")",
-#       " with_phase=",   (with_phase  is None)   ? "null" : with_phase.get_name(), 
-#       " start_with_phase=",   (start_with_phase  is None)   ? "null" : start_with_phase.get_name(), 
-#       " end_with_phase=",   (end_with_phase  is None)   ? "null" : end_with_phase.get_name(), 
-#       " after_phase=",  (after_phase  is None)  ? "null" : after_phase.get_name(),
-#       " before_phase=", (before_phase  is None) ? "null" : before_phase.get_name(), 
-#       " new_node=",     (new_node  is None)     ? "null" : {new_node.get_name(),
-#                                                            " inst_id=",
-#                                                            $sformatf("%0d",new_node.get_inst_id())},
-#       " begin_node=",   (begin_node  is None)   ? "null" : begin_node.get_name(),
-#       " end_node=",     (end_node  is None)     ? "null" : end_node.get_name()},UVM_DEBUG)
-#   end
-# 
-# 
-#     # 
-#     # INSERT IN PARALLEL WITH 'WITH' PHASE
-#   if (with_phase != null) begin
-#     # all pre-existing predecessors to with_phase are predecessors to the new phase
-#     begin_node.m_predecessors = with_phase.m_predecessors;
-#     foreach (with_phase.m_predecessors[pred]) pred.m_successors[begin_node] = 1;
-#     # all pre-existing successors to with_phase are successors to this phase
-#     end_node.m_successors = with_phase.m_successors;
-#     foreach (with_phase.m_successors[succ]) succ.m_predecessors[end_node] = 1;
-#   end
-#   
-#   if (start_with_phase != null) begin
-#     # all pre-existing predecessors to start_with_phase are predecessors to the new phase
-#     begin_node.m_predecessors = start_with_phase.m_predecessors;
-#     foreach (start_with_phase.m_predecessors[pred]) begin
-#       pred.m_successors[begin_node] = 1;
-#     end
-#     # if not otherwise specified, successors for the new phase are the successors to the end of this schedule
-#     if (before_phase  is None  and  end_with_phase  is None) begin
-#       end_node.m_successors = m_end_node.m_successors ;
-#       foreach (m_end_node.m_successors[succ]) begin
-#         succ.m_predecessors[end_node] = 1;
-#       end
-#     end
-#   end
-#   
-#   if (end_with_phase != null) begin
-#      # all pre-existing successors to end_with_phase are successors to the new phase
-#     end_node.m_successors = end_with_phase.m_successors;
-#     foreach (end_with_phase.m_successors[succ]) begin
-#       succ.m_predecessors[end_node] = 1;
-#     end
-#     # if not otherwise specified, predecessors for the new phase are the predecessors to the start of this schedule
-#     if (after_phase  is None  and  start_with_phase  is None) begin
-#       begin_node.m_predecessors = this.m_predecessors ;
-#       foreach (this.m_predecessors[pred]) begin
-#         pred.m_successors[begin_node] = 1;
-#       end
-#     end
-#   end
-# 
-#     # INSERT BEFORE PHASE
-#   if (before_phase != null) begin
-#     # unless predecessors to this phase are otherwise specified, 
-#     # pre-existing predecessors to before_phase move to be predecessors to the new phase
-#     if (after_phase  is None  and  start_with_phase  is None) begin
-#       foreach (before_phase.m_predecessors[pred]) begin
-#         pred.m_successorsdelete=before_phase;
-#         pred.m_successors[begin_node] = 1;
-#       end
-#       begin_node.m_predecessors = before_phase.m_predecessors;
-#       before_phase.m_predecessors.clear();
-#     end
-#     # there is a special case if before and after used to be adjacent;
-#     # the new phase goes in-between them
-#     elif: (before_phase.m_predecessorsexists=after_phase) begin
-#       before_phase.m_predecessorsdelete=after_phase;
-#     end
-# 
-#     # before_phase is now the sole successor of this phase
-#     before_phase.m_predecessors[end_node] = 1;
-#     end_node.m_successors.clear() ;
-#     end_node.m_successors[before_phase] = 1;
-# 
-#   end
-# 
-# 
-#     # INSERT AFTER PHASE
-#   if (after_phase != null) begin
-#     # unless successors to this phase are otherwise specified, 
-#     # pre-existing successors to after_phase are now successors to this phase
-#     if (before_phase  is None  and  end_with_phase  is None) begin
-#       foreach (after_phase.m_successors[succ]) begin
-#        succ.m_predecessorsdelete=after_phase;
-#        succ.m_predecessors[end_node] = 1;
-#       end
-#       end_node.m_successors = after_phase.m_successors;
-#       after_phase.m_successors.clear();
-#     end
-#     # there is a special case if before and after used to be adjacent;
-#     # the new phase goes in-between them
-#     elif: (after_phase.m_successorsexists=before_phase) begin
-#       after_phase.m_successorsdelete=before_phase;
-#     end
-# 
-#     # after_phase is the sole predecessor of this phase 
-#     after_phase.m_successors[begin_node] = 1;
-#     begin_node.m_predecessors.clear();
-#     begin_node.m_predecessors[after_phase] = 1;
-#   end
-#   
-# 
-# 
-#     # Transition nodes to DORMANT state
-#   if (new_node  is None)
-#     tmp_node = phase;
-#   else
-#     tmp_node = new_node;
-# 
-#   state_chg = uvm_phase_state_change::type_id::create(tmp_node.get_name());
-#   state_chg.m_phase = tmp_node;
-#   state_chg.m_jump_to = null;
-#   state_chg.m_prev_state = tmp_node.m_state;
-#   tmp_node.m_state = UVM_PHASE_DORMANT;
-#   `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(tmp_node, state_chg)) 
-# endfunction        
-# 
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.6.2
-#   extern function uvm_phase get_parent();
-# 
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.6.3
-#   extern virtual function string get_full_name();
-# 
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.6.4
-#   extern function uvm_phase get_schedule(bit hier = 0);
-# 
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.6.5
-#   extern function string get_schedule_name(bit hier = 0);
-# 
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.6.6
-#   extern function uvm_domain get_domain();
-# 
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.6.7
-#   extern function uvm_phase get_imp();
-# 
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.6.8
-#   extern function string get_domain_name();
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.6.9
-#   extern function void get_adjacent_predecessor_nodes(ref uvm_phase pred[]);
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.6.10
-#   extern function void get_adjacent_successor_nodes(ref uvm_phase succ[]);
-# 
+
+        # The graph is about to change; compiled topologies are stale
+        uvm_phase.m_graph_version += 1
+
+        # INSERT IN PARALLEL WITH 'WITH' PHASE
+        if with_phase is not None:
+            # all pre-existing predecessors to with_phase are predecessors to the new phase
+            begin_node.m_predecessors = dict(with_phase.m_predecessors)
+            for pred in with_phase.m_predecessors.keys():
+                pred.m_successors[begin_node] = True
+            # all pre-existing successors to with_phase are successors to this phase
+            end_node.m_successors = dict(with_phase.m_successors)
+            for succ in with_phase.m_successors.keys():
+                succ.m_predecessors[end_node] = True
+
+        if start_with_phase is not None:
+            # all pre-existing predecessors to start_with_phase are predecessors to the new phase
+            begin_node.m_predecessors = dict(start_with_phase.m_predecessors)
+            for pred in start_with_phase.m_predecessors.keys():
+                pred.m_successors[begin_node] = True
+            # if not otherwise specified, successors for the new phase are the successors to the end of this schedule
+            if before_phase is None and end_with_phase is None:
+                end_node.m_successors = dict(self.m_end_node.m_successors)
+                for succ in self.m_end_node.m_successors.keys():
+                    succ.m_predecessors[end_node] = True
+
+        if end_with_phase is not None:
+            # all pre-existing successors to end_with_phase are successors to the new phase
+            end_node.m_successors = dict(end_with_phase.m_successors)
+            for succ in end_with_phase.m_successors.keys():
+                succ.m_predecessors[end_node] = True
+            # if not otherwise specified, predecessors for the new phase are the predecessors to the start of this schedule
+            if after_phase is None and start_with_phase is None:
+                begin_node.m_predecessors = dict(self.m_predecessors)
+                for pred in self.m_predecessors.keys():
+                    pred.m_successors[begin_node] = True
+
+        # INSERT BEFORE PHASE
+        if before_phase is not None:
+            # unless predecessors to this phase are otherwise specified, 
+            # pre-existing predecessors to before_phase move to be predecessors to the new phase
+            if after_phase is None and start_with_phase is None:
+                for pred in before_phase.m_predecessors.keys():
+                    del pred.m_successors[before_phase]
+                    pred.m_successors[begin_node] = True
+                begin_node.m_predecessors = dict(before_phase.m_predecessors)
+                before_phase.m_predecessors.clear()
+            # there is a special case if before and after used to be adjacent;
+            # the new phase goes in-between them
+            elif after_phase in before_phase.m_predecessors.keys():
+                del before_phase.m_predecessors[after_phase]
+
+            # before_phase is now the sole successor of this phase
+            before_phase.m_predecessors[end_node] = True
+            end_node.m_successors.clear()
+            end_node.m_successors[before_phase] = True
+
+        # INSERT AFTER PHASE
+        if after_phase is not None:
+            # unless successors to this phase are otherwise specified, 
+            # pre-existing successors to after_phase are now successors to this phase
+            if before_phase is None and end_with_phase is None:
+                for succ in after_phase.m_successors.keys():
+                    del succ.m_predecessors[after_phase]
+                    succ.m_predecessors[end_node] = True
+                end_node.m_successors = dict(after_phase.m_successors)
+                after_phase.m_successors.clear()
+            # there is a special case if before and after used to be adjacent;
+            # the new phase goes in-between them
+            elif before_phase in after_phase.m_successors.keys():
+                del after_phase.m_successors[before_phase]
+
+            # after_phase is the sole predecessor of this phase 
+            after_phase.m_successors[begin_node] = True
+            begin_node.m_predecessors.clear()
+            begin_node.m_predecessors[after_phase] = True
+
+        # Transition nodes to DORMANT state
+        if new_node is None:
+            tmp_node = phase
+        else:
+            tmp_node = new_node
+
+        state_chg = uvm_phase_state_change(tmp_node.get_name())
+        state_chg.m_phase = tmp_node
+        state_chg.m_jump_to = None
+        state_chg.m_prev_state = tmp_node.m_state
+        tmp_node.m_state = uvm_phase_state.UVM_PHASE_DORMANT
+        # TODO: `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(tmp_node, state_chg)) 
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.6.2
+    def get_parent(self):
+        return self.m_parent
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.6.3
+    def get_full_name(self):
+        if self.m_phase_type == uvm_phase_type.UVM_PHASE_IMP:
+            return self.get_name()
+        ret = self.get_domain_name()
+        sch = self.get_schedule_name()
+        if sch != "":
+            ret = ret + "." + sch
+        if self.m_phase_type != uvm_phase_type.UVM_PHASE_DOMAIN and self.m_phase_type != uvm_phase_type.UVM_PHASE_SCHEDULE:
+            ret = ret + "." + self.get_name()
+        return ret
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.6.4
+    def get_schedule(self, hier=False):
+        sched = self
+        if hier:
+            while sched.m_parent is not None and sched.m_parent.get_phase_type() == uvm_phase_type.UVM_PHASE_SCHEDULE:
+                sched = sched.m_parent
+        if sched.m_phase_type == uvm_phase_type.UVM_PHASE_SCHEDULE:
+            return sched
+        if sched.m_phase_type == uvm_phase_type.UVM_PHASE_NODE:
+            if self.m_parent is not None and self.m_parent.m_phase_type != uvm_phase_type.UVM_PHASE_DOMAIN:
+                return self.m_parent
+        return None
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.6.5
+    def get_schedule_name(self, hier=False):
+        sched = self.get_schedule(hier)
+        if sched is None:
+            return ""
+        s = sched.get_name()
+        while (sched.m_parent is not None and sched.m_parent != sched and
+                sched.m_parent.get_phase_type() == uvm_phase_type.UVM_PHASE_SCHEDULE):
+            sched = sched.m_parent
+            s = sched.get_name() + ("." if len(s) > 0 else "") + s
+        return s
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.6.6
+    def get_domain(self):
+        phase = self
+        while phase is not None and phase.m_phase_type != uvm_phase_type.UVM_PHASE_DOMAIN:
+            phase = phase.m_parent
+        # Returns None when there is no parent domain
+        return phase
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.6.7
+    def get_imp(self):
+        return self.m_imp
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.6.8
+    def get_domain_name(self):
+        domain = self.get_domain()
+        if domain is None:
+            return "unknown"
+        return domain.get_name()
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.6.9
+    def get_adjacent_predecessor_nodes(self, pred):
+        # Replace any terminal / schedule nodes with their predecessors
+        pred.clear()
+        seen = set()
+        stack = list(self.m_predecessors.keys())
+        while len(stack) > 0:
+            p = stack.pop(0)
+            if p in seen:
+                continue
+            seen.add(p)
+            if p.get_phase_type() != uvm_phase_type.UVM_PHASE_NODE:
+                stack.extend(p.m_predecessors.keys())
+            else:
+                pred.append(p)
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.6.10
+    def get_adjacent_successor_nodes(self, succ):
+        # Replace any terminal / schedule nodes with their successors
+        succ.clear()
+        seen = set()
+        stack = list(self.m_successors.keys())
+        while len(stack) > 0:
+            s = stack.pop(0)
+            if s in seen:
+                continue
+            seen.add(s)
+            if s.get_phase_type() != uvm_phase_type.UVM_PHASE_NODE:
+                stack.extend(s.m_successors.keys())
+            else:
+                succ.append(s)
+
+    # Function- m_get_topology
+    #
+    # Returns the compiled <uvm_phase_topology> of the graph this node
+    # belongs to, rebuilding it if the graph changed since it was compiled.
+    def m_get_topology(self):
+        topo = self.m_topology
+        if topo is None or topo.m_version != uvm_phase.m_graph_version:
+            topo = uvm_phase_topology(self, uvm_phase.m_graph_version)
+            for node in topo.get_nodes():
+                node.m_topology = topo
+        return topo
+
 #     #-----------------------
 #     # Group -- NODOCS -- Phase Done Objection
 #     #-----------------------
@@ -617,21 +691,101 @@ class uvm_phase(uvm_object):
 # 
 # 
 # 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.8.1
-#   extern function void sync(uvm_domain target,
-#                             uvm_phase phase=None,
-#                             uvm_phase with_phase=None);
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.8.2
-#   extern function void unsync(uvm_domain target,
-#                               uvm_phase phase=None,
-#                               uvm_phase with_phase=None);
-# 
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.8.3
-#   extern task wait_for_state(uvm_phase_state state, uvm_wait_op op=UVM_EQ);
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.8.1
+    def sync(self, target, phase=None, with_phase=None):
+        if not self.m_check_sync_args("sync", target, phase, with_phase):
+            return
+
+        if phase is None:
+            # whole domain sync - sync each node of this domain schedule
+            for imp in self.m_get_domain_imps():
+                self.sync(target, imp)
+        else:
+            # single phase sync
+            # this is a 2-way ('with') sync and we check first in case it is already there
+            if with_phase is None:
+                with_phase = phase
+            from_node = self.find(phase)
+            to_node = target.find(with_phase)
+            if from_node is None or to_node is None or from_node is to_node:
+                return
+            if to_node not in from_node.m_sync:
+                from_node.m_sync.append(to_node)
+            if from_node not in to_node.m_sync:
+                to_node.m_sync.append(from_node)
+            uvm_phase_sync_barrier.m_merge(from_node, to_node)
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.8.2
+    def unsync(self, target, phase=None, with_phase=None):
+        if not self.m_check_sync_args("unsync", target, phase, with_phase):
+            return
+
+        if phase is None:
+            # whole domain unsync - unsync each node of this domain schedule
+            for imp in self.m_get_domain_imps():
+                self.unsync(target, imp)
+        else:
+            # single phase unsync
+            if with_phase is None:
+                with_phase = phase
+            from_node = self.find(phase)
+            to_node = target.find(with_phase)
+            if from_node is None or to_node is None:
+                return
+            if to_node in from_node.m_sync:
+                from_node.m_sync.remove(to_node)
+            if from_node in to_node.m_sync:
+                to_node.m_sync.remove(from_node)
+            if from_node.m_sync_barrier is not None:
+                from_node.m_sync_barrier.m_split()
+
+    def m_check_sync_args(self, name, target, phase, with_phase):
+        if not self.is_domain():
+            uvm_fatal("PH_BADSYNC", name + "() called from a non-domain phase schedule node")
+        elif target is None:
+            uvm_fatal("PH_BADSYNC", name + "() called with a null target domain")
+        elif not target.is_domain():
+            uvm_fatal("PH_BADSYNC", name + "() called with a non-domain phase schedule node as target")
+        elif phase is None and with_phase is not None:
+            uvm_fatal("PH_BADSYNC", name + "() called with null phase and non-null with phase")
+        else:
+            return True
+        return False
+
+    # Function- m_get_domain_imps
+    #
+    # Returns the imps of all phase nodes of this domain, in schedule order
+    def m_get_domain_imps(self):
+        imps = []
+        topo = self.m_get_topology()
+        desc = topo.m_reach[1][topo.get_index(self)]
+        nodes = topo.get_nodes()
+        for i in range(len(nodes)):
+            if (desc >> i) & 1 and nodes[i].m_imp is not None and nodes[i].m_imp not in imps:
+                imps.append(nodes[i].m_imp)
+        return imps
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.8.3
+    @cocotb.coroutine
+    def wait_for_state(self, state, op=uvm_wait_op.UVM_EQ):
+        while not self.m_state_matches(state, op):
+            if self.m_state_ev is None:
+                self.m_state_ev = Event()
+            yield self.m_state_ev.wait()
+
+    def m_state_matches(self, state, op):
+        if op == uvm_wait_op.UVM_EQ:
+            return (state.value & self.m_state.value) != 0
+        elif op == uvm_wait_op.UVM_NE:
+            return (state.value & self.m_state.value) == 0
+        elif op == uvm_wait_op.UVM_LT:
+            return self.m_state.value < state.value
+        elif op == uvm_wait_op.UVM_LTE:
+            return self.m_state.value <= state.value
+        elif op == uvm_wait_op.UVM_GT:
+            return self.m_state.value > state.value
+        else:
+            return self.m_state.value >= state.value
 # 
 #    
 #     #---------------
@@ -660,30 +814,100 @@ class uvm_phase(uvm_object):
 #     # that share a phase to jump to that phase.
 #  
 # 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.9.1
-#   extern function void jump(uvm_phase phase);
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.9.2
-#   extern function void set_jump_phase(uvm_phase phase) ;
-#   
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.9.3
-#   extern function void end_prematurely() ;
-# 
-#     # Function- jump_all
-#     #
-#     # Make all schedules jump to a specified ~phase~, even if the jump target is local.
-#     # The jump happens to all phase schedules that contain the jump-to ~phase~,
-#     # i.e. a global jump. 
-#     #
-#   extern static function void jump_all(uvm_phase phase);
-# 
-# 
-# 
-#     # @uvm-ieee 1800.2-2017 auto 9.3.1.9.4
-#   extern function uvm_phase get_jump_target();
-# 
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.9.1
+    #
+    # Note that this function does not directly alter flow of control.
+    # That is, the new phase is not initiated in this function.
+    # Rather, flags are set which execute_phase() uses to determine
+    # that a jump has been requested and performs the jump.
+    def jump(self, phase):
+        self.set_jump_phase(phase)
+        self.end_prematurely()
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.9.2
+    def set_jump_phase(self, phase):
+        if (self.m_state.value < uvm_phase_state.UVM_PHASE_STARTED.value or
+                self.m_state.value > uvm_phase_state.UVM_PHASE_ENDED.value):
+            uvm_error("JMPPHIDL", "Attempting to jump from phase \"" +
+                self.get_name() + "\" which is not currently active (current state is " +
+                self.m_state.name + "). The jump will not happen until the phase becomes " +
+                "active.")
+
+        # A jump can be either forward or backwards in the phase graph.
+        # If the specified phase (name) is found in the set of predecessors
+        # then we are jumping backwards.  If, on the other hand, the phase is in the set
+        # of successors then we are jumping forwards.  If neither, then we
+        # have an error.
+        topo = self.m_get_topology()
+        candidates = topo.get_match(phase)
+        if self.is_(phase):
+            d = self
+        else:
+            d = topo.find_predecessor(self, candidates, False)
+
+        if d is None:
+            d = topo.find_successor(self, candidates, False)
+            if d is None:
+                uvm_fatal("PH_BADJUMP", ("phase %s is neither a predecessor or successor of " +
+                    "phase %s or is non-existant, so we cannot jump to it.  " +
+                    "Phase control flow is now undefined so the simulation " +
+                    "must terminate") % (phase.get_name(), self.get_name()))
+                return
+            self.m_jump_fwd = True
+        else:
+            self.m_jump_bkwd = True
+
+        self.m_jump_phase = d
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.9.3
+    def end_prematurely(self):
+        self.m_premature_end = True
+        if self.m_jump_ev is not None:
+            self.m_jump_ev.set()
+
+    # Function- jump_all
+    #
+    # Make all schedules jump to a specified ~phase~, even if the jump target is local.
+    # The jump happens to all phase schedules that contain the jump-to ~phase~,
+    # i.e. a global jump. 
+    #
+    @staticmethod
+    def jump_all(phase):
+        uvm_warning("NOTIMPL","uvm_phase::jump_all is not implemented and has been replaced by uvm_domain::jump_all")
+
+    # @uvm-ieee 1800.2-2017 auto 9.3.1.9.4
+    def get_jump_target(self):
+        return self.m_jump_phase
+
+    # Function: set_jump_trace_depth
+    #
+    # Sets how many of the most recent jumps are kept in the jump trace
+    # (256 by default). A depth of 0 turns tracing off. Resizing keeps the
+    # newest entries.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    @staticmethod
+    def set_jump_trace_depth(depth):
+        uvm_phase.m_jump_trace = deque(uvm_phase.m_jump_trace, maxlen=depth)
+
+    # Function: get_jump_trace
+    #
+    # Returns the jump trace, oldest jump first, as a list of (time,
+    # from_phase, to_phase, direction, num_cleared) tuples. ~time~ is the
+    # simulation time in ns, the phases are full names, ~direction~ is
+    # "forward" or "backward", and ~num_cleared~ the number of phase nodes
+    # whose state the jump reset.
+    #
+    # @uvm-accellera The details of this API are specific to this implementation
+    @staticmethod
+    def get_jump_trace():
+        return list(uvm_phase.m_jump_trace)
+
+    @staticmethod
+    def clear_jump_trace():
+        uvm_phase.m_jump_trace.clear()
+
 # 
 # 
 #     #--------------------------
@@ -726,8 +950,6 @@ class uvm_phase(uvm_object):
 # 
 #     # Implementation - Synchronization
 #     #---------------------------------
-#   local uvm_phase m_sync[$];  # schedule instance to which we are synced
-# 
 # `ifdef UVM_ENABLE_DEPRECATED_API
 #     # In order to avoid raciness during static initialization,
 #     # the creation of the "phase done" objection has been
@@ -750,435 +972,462 @@ class uvm_phase(uvm_object):
 #   local uvm_objection phase_done;
 # `endif
 #    
-#   local int unsigned m_ready_to_end_count;
-# 
-#   function int unsigned get_ready_to_end_count();
-#      return m_ready_to_end_count;
-#   endfunction
-# 
-#   extern local function void get_predecessors_for_successors(output bit pred_of_succ[uvm_phase]);
-#   extern local task m_wait_for_pred();
+
+    def get_ready_to_end_count(self):
+        return self.m_ready_to_end_count
 # 
 #     # Implementation - Jumping
 #     #-------------------------
-#   local bit                m_jump_bkwd;
-#   local bit                m_jump_fwd;
-#   local uvm_phase          m_jump_phase;
-#   local bit                m_premature_end;
-#   extern function void clear(uvm_phase_state state = UVM_PHASE_DORMANT);
-#   extern function void clear_successors(
-#                              uvm_phase_state state = UVM_PHASE_DORMANT,
-#                              uvm_phase end_state=None);
-# 
+
+    # Function- clear
+    #
+    # for internal graph maintenance after a jump. A node that is still
+    # executing is killed along with its task phase processes.
+    def clear(self, state=uvm_phase_state.UVM_PHASE_DORMANT):
+        self.m_set_state(state)
+        self.m_pred_latch = -1
+        if self.m_exec_proc is not None:
+            proc = self.m_exec_proc
+            self.m_exec_proc = None
+            proc.kill()
+        self.kill()
+        # TODO: clear the phase objection
+
+    # Function- clear_successors
+    #
+    # for internal graph maintenance after a jump
+    # - called only by execute_phase()
+    # - calls clear() on this node and every successor, except ~end_state~
+    #   and what can only be reached through it. The set of nodes comes
+    #   from the compiled topology, see <uvm_phase_topology::get_clear_set>.
+    def clear_successors(self, state=uvm_phase_state.UVM_PHASE_DORMANT, end_state=None):
+        if self is end_state:
+            return 0
+        nodes = self.m_get_topology().get_clear_set(self, end_state)
+        for node in nodes:
+            node.clear(state)
+        return len(nodes)
+
+    # Function- m_finish_jump
+    #
+    # Completes the jump requested by set_jump_phase(): resets the nodes
+    # between here and the jump target, records the jump in the jump trace
+    # and puts the target on the hopper once its predecessors are DONE.
+    def m_finish_jump(self, time):
+        jump_phase = self.m_jump_phase
+        cleared = 0
+        if self.m_jump_fwd:
+            cleared += self.clear_successors(uvm_phase_state.UVM_PHASE_DONE, jump_phase)
+        cleared += jump_phase.clear_successors()
+
+        uvm_phase.m_jump_trace.append((time, self.get_full_name(),
+            jump_phase.get_full_name(), "forward" if self.m_jump_fwd else "backward",
+            cleared))
+
+        self.m_jump_phase = None
+        self.m_jump_fwd = False
+        self.m_jump_bkwd = False
+        # The target still waits for its predecessors outside of the
+        # cleared nodes, such as a parallel run phase
+        if jump_phase.m_arm_pred_latch():
+            uvm_phase.m_schedule(jump_phase)
+
 #     # Implementation - Overall Control
 #     #---------------------------------
+    # Ready queue for nodes that do not belong to a domain
     m_phase_hopper = Mailbox()
-    
+
+    m_running = False # set once m_run_phases() has started the drivers
+    m_drivers = []    # driver processes of the ready queues
+
+    # Function- m_schedule
+    #
+    # Marks ~phase~ SCHEDULED and puts it on the ready queue of its domain.
+    # Each domain has its own queue and driver, so the nodes of one domain
+    # are started independently of the others. Domains only wait for each
+    # other at the points where their graphs join or sync.
+    @staticmethod
+    def m_schedule(phase):
+        phase.m_set_state(uvm_phase_state.UVM_PHASE_SCHEDULED)
+        domain = phase.get_domain()
+        if domain is None:
+            uvm_phase.m_phase_hopper.try_put(phase)
+            return
+        domain.m_ready_queue.try_put(phase)
+        if domain.m_driver is None and uvm_phase.m_running:
+            uvm_phase.m_start_driver(domain)
+
+    @staticmethod
+    def m_start_driver(domain):
+        domain.m_driver = cocotb.fork(uvm_phase.m_run_queue(domain.m_ready_queue))
+        uvm_phase.m_drivers.append(domain.m_driver)
+
+    # Task- m_run_queue
+    #
+    # Driver of one ready queue: starts every node put on it
+    @staticmethod
+    @cocotb.coroutine
+    def m_run_queue(queue):
+        while True:
+            phase = yield queue.get()
+            # Skip nodes that a jump has cleared since they were scheduled
+            if phase.m_state == uvm_phase_state.UVM_PHASE_SCHEDULED:
+                phase.m_exec_proc = cocotb.fork(phase.execute_phase())
+
     @staticmethod
     @cocotb.coroutine
     def m_run_phases():
         global m_uvm_core_state
-        print("TODO: uvm_phase.m_run_phases()")
         # This task contains the top-level process that owns all the phase
         # processes.  By hosting the phase processes here we avoid problems
         # associated with phase processes related as parents/children
-        from uvm.base.coreservice import uvm_coreservice_t
-        cs = uvm_coreservice_t.get()
-        top = cs.get_root()
- 
+
         # initiate by starting first phase in common domain
         from uvm.base.domain import uvm_domain
-        uvm_phase.m_phase_hopper.try_put(uvm_domain.get_common_domain())
+        uvm_phase.m_schedule(uvm_domain.get_common_domain())
+
+        # Start the drivers of domains that already have work queued
+        uvm_phase.m_running = True
+        domains = {}
+        uvm_domain.get_domains(domains)
+        for domain in domains.values():
+            if domain.m_driver is None and len(domain.m_ready_queue.data) > 0:
+                uvm_phase.m_start_driver(domain)
 
         m_uvm_core_state=uvm_core_state.RUNNING
-        
-        while True:
-            phase = yield uvm_phase.m_phase_hopper.get()
-            print("--> start execute_phase")
-            cocotb.fork(phase.execute_phase())
-            print("<-- start execute_phase")
-   
+
+        # Serve the nodes that do not belong to any domain
+        yield uvm_phase.m_run_queue(uvm_phase.m_phase_hopper)
+
+    # Function- m_stop_drivers
+    #
+    # Kills the ready queue drivers once phasing is over
+    @staticmethod
+    def m_stop_drivers():
+        uvm_phase.m_running = False
+        for driver in uvm_phase.m_drivers:
+            driver.kill()
+        uvm_phase.m_drivers = []
+        from uvm.base.domain import uvm_domain
+        domains = {}
+        uvm_domain.get_domains(domains)
+        for domain in domains.values():
+            domain.m_driver = None
+
     @cocotb.coroutine
     def execute_phase(self):
         from uvm.base.coreservice import uvm_coreservice_t
-        print("TODO: uvm_phase::execute_phase " + str(type(self)))
-#   uvm_task_phase task_phase;
-#   uvm_root top;
-#   uvm_phase_state_change state_chg;
-#   uvm_coreservice_t cs;
-# 
+        from uvm.base.task_phase import uvm_task_phase
         cs = uvm_coreservice_t.get()
         top = cs.get_root()
- 
-        # If we got here by jumping forward, we must wait for
-        # all its predecessor nodes to be marked DONE.
-        # (the next conditional speeds this up)
-        # Also, this helps us fast-forward through terminal (end) nodes
-#   foreach (m_predecessors[pred])
-#     wait (pred.m_state == UVM_PHASE_DONE);
-# 
-# 
+
+        # A node only reaches the hopper once its predecessor latch has
+        # counted down to zero (see <m_pred_done>), also when a jump leads
+        # to it (see <m_arm_pred_latch>), so there is no need to wait for
+        # the predecessors here.
+
         # If DONE (by, say, a forward jump), return immed
         if self.m_state == uvm_phase_state.UVM_PHASE_DONE:
+            self.m_exec_proc = None
             return
 
         state_chg = uvm_phase_state_change(self.get_name())
         state_chg.m_phase      = self
         state_chg.m_jump_to    = None
 
-#     #---------
-#     # SYNCING:
-#     #---------
-#     # Wait for phases with which we have a sync()
-#     # relationship to be ready. Sync can be 2-way -
-#     # this additional state avoids deadlock.
-#   state_chg.m_prev_state = m_state;
-#   m_state = UVM_PHASE_SYNCING;
-#   `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(this, state_chg))
-#     #0;
-#    
-#   if (m_sync.size()) begin
-#     
-#     foreach (m_sync[i]) begin
-#       wait (m_sync[i].m_state >= UVM_PHASE_SYNCING);
-#     end
-#   end
-# 
+        #---------
+        # SYNCING:
+        #---------
+        # Wait for phases with which we have a sync()
+        # relationship to be ready. Sync can be 2-way -
+        # this additional state avoids deadlock.
+        state_chg.m_prev_state = self.m_state
+        self.m_set_state(uvm_phase_state.UVM_PHASE_SYNCING)
+        yield NullTrigger()
+
+        while self.m_sync_barrier is not None and not self.m_sync_barrier.is_released():
+            yield self.m_sync_barrier.m_wait()
+
         self.m_run_count += 1
-# 
-#   if (m_phase_trace) begin
-#     `UVM_PH_TRACE("PH/TRC/STRT","Starting phase",this,UVM_LOW)
-#   end
-# 
-# 
+
+        is_task_phase = isinstance(self.m_imp, uvm_task_phase)
+
         # If we're a schedule or domain, then "fake" execution
         if self.m_phase_type != uvm_phase_type.UVM_PHASE_NODE:
             state_chg.m_prev_state = self.m_state
-            self.m_state = uvm_phase_state.UVM_PHASE_STARTED
-#     `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(this, state_chg))
-# 
-#     #0;
-# 
-#     state_chg.m_prev_state = m_state;
-#     m_state = UVM_PHASE_EXECUTING;
-#     `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(this, state_chg))
-# 
-#     #0;
-#   end
-# 
-# 
-#   else begin # PHASE NODE
-# 
-#     #---------
-#     # STARTED:
-#     #---------
-#     state_chg.m_prev_state = m_state;
-#     m_state = UVM_PHASE_STARTED;
-#     `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(this, state_chg))
-# 
-#     m_imp.traverse(top,this,UVM_PHASE_STARTED);
-#     m_ready_to_end_count = 0 ; # reset the ready_to_end count when phase starts
-#     #0; # LET ANY WAITERS WAKE UP
-# 
-# 
-#     #if (m_imp.get_phase_type() != UVM_PHASE_TASK) begin
-#     if (!$cast(task_phase,m_imp)) begin
-# 
-        #-----------
-        # EXECUTING: (function phases)
-        #-----------
-        if not hasattr(self.m_imp, "m_traverse"):
-#        state_chg.m_prev_state = m_state;
-#        m_state = UVM_PHASE_EXECUTING;
-#        `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(this, state_chg))
-            print("TODO: traverse " + str(self.m_imp))
-            self.m_imp.traverse(top, uvm_phase_state.UVM_PHASE_EXECUTING)
+            self.m_set_state(uvm_phase_state.UVM_PHASE_STARTED)
+            yield NullTrigger()
+
+            state_chg.m_prev_state = self.m_state
+            self.m_set_state(uvm_phase_state.UVM_PHASE_EXECUTING)
+            yield NullTrigger()
+        else: # PHASE NODE
+            #---------
+            # STARTED:
+            #---------
+            state_chg.m_prev_state = self.m_state
+            self.m_set_state(uvm_phase_state.UVM_PHASE_STARTED)
+            self.m_imp.traverse(top, self, uvm_phase_state.UVM_PHASE_STARTED)
+            self.m_ready_to_end_count = 0 # reset the ready_to_end count when phase starts
+            yield NullTrigger() # LET ANY WAITERS WAKE UP
+
+            if not is_task_phase:
+                #-----------
+                # EXECUTING: (function phases)
+                #-----------
+                state_chg.m_prev_state = self.m_state
+                self.m_set_state(uvm_phase_state.UVM_PHASE_EXECUTING)
+                yield NullTrigger() # LET ANY WAITERS WAKE UP
+                self.m_imp.traverse(top, self, uvm_phase_state.UVM_PHASE_EXECUTING)
+            else:
+                #-----------
+                # EXECUTING: (task phases)
+                #-----------
+                state_chg.m_prev_state = self.m_state
+                self.m_set_state(uvm_phase_state.UVM_PHASE_EXECUTING)
+                self.m_imp.traverse(top, self, uvm_phase_state.UVM_PHASE_EXECUTING)
+                yield NullTrigger() # Give sequences, etc. a chance to object
+
+                # TODO: wait for the phase objection to drop, the jump
+                # request or the run phase timeout, whichever comes first.
+                # Until objections are in place the phase ends once all of
+                # its processes have returned, or on a jump request.
+                if not self.m_premature_end:
+                    self.m_jump_ev = Event()
+                    yield First(self.m_task_procs.wait(), self.m_jump_ev.wait())
+                    self.m_jump_ev = None
+
+                #--------------
+                # READY_TO_END:
+                #--------------
+                do_ready_to_end = not self.m_premature_end
+                while do_ready_to_end:
+                    self.m_ready_to_end_count += 1
+                    state_chg.m_prev_state = self.m_state
+                    self.m_set_state(uvm_phase_state.UVM_PHASE_READY_TO_END)
+                    self.m_imp.traverse(top, self, uvm_phase_state.UVM_PHASE_READY_TO_END)
+                    yield NullTrigger() # Give traverse targets a chance to object
+                    do_ready_to_end = (self.m_state == uvm_phase_state.UVM_PHASE_EXECUTING and
+                        self.m_ready_to_end_count < self.get_max_ready_to_end_iterations())
+
+            if self.m_premature_end:
+                if self.m_jump_phase is not None:
+                    state_chg.m_jump_to = self.m_jump_phase
+                    # TODO: report once report verbosity is implemented
+#                    `uvm_info("PH_JUMP",
+#                          $sformatf("phase %s (schedule %s, domain %s) is jumping to phase %s",
+#                           get_name(), get_schedule_name(), get_domain_name(), m_jump_phase.get_name()),
+#                          UVM_MEDIUM)
+#                else:
+#                    `uvm_info("PH_JUMP",
+#                          $sformatf("phase %s (schedule %s, domain %s) is ending prematurely",
+#                           get_name(), get_schedule_name(), get_domain_name()),
+#                          UVM_MEDIUM)
+                yield NullTrigger() # LET ANY WAITERS ON READY_TO_END TO WAKE UP
+            elif not is_task_phase:
+                # WAIT FOR PREDECESSORS:
+                # function phases only
+                yield self.m_wait_for_pred()
+
+            #-------
+            # ENDED:
+            #-------
+            # execute 'phase_ended' callbacks
+            state_chg.m_prev_state = self.m_state
+            self.m_set_state(uvm_phase_state.UVM_PHASE_ENDED)
+            self.m_imp.traverse(top, self, uvm_phase_state.UVM_PHASE_ENDED)
+            yield NullTrigger() # LET ANY WAITERS WAKE UP
+
+            #---------
+            # CLEANUP:
+            #---------
+            state_chg.m_prev_state = self.m_state
+            if self.m_premature_end:
+                self.m_set_state(uvm_phase_state.UVM_PHASE_JUMPING)
+            else:
+                self.m_set_state(uvm_phase_state.UVM_PHASE_CLEANUP)
+            # kill this phase's threads
+            self.kill()
+            yield NullTrigger() # LET ANY WAITERS WAKE UP
+
+        #------
+        # DONE:
+        #------
+        # From here on a jump must not kill this process
+        self.m_exec_proc = None
+        self.m_premature_end = False
+        if self.m_jump_fwd or self.m_jump_bkwd:
+            #---------
+            # JUMPING:
+            #---------
+            # Reset the nodes between here and the jump target and start
+            # over from the target. A forward jump marks the nodes it skips
+            # DONE, so that dependencies on them are satisfied.
+            self.m_finish_jump(get_sim_time("ns"))
         else:
-#            self.m_executing_phases[self] = True
- 
-#            state_chg.m_prev_state = m_state;
-#            m_state = UVM_PHASE_EXECUTING;
-#           `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(this, state_chg))
-            print("TODO: execute task phase") 
-#         fork : master_phase_process
-#           begin
-#    
-#             m_phase_proc = process::self();
-#    
-#             #-----------
-#             # EXECUTING: (task phases)
-#             #-----------
-#             task_phase.traverse(top,this,UVM_PHASE_EXECUTING);
-#    
-#             wait(0); # stay alive for later kill
-#    
-#           end
-#         join_none
-#    
-#         uvm_wait_for_nba_region(); #Give sequences, etc. a chance to object
-#   
-#         # Now wait for one of three criterion for end-of-phase.
-#         fork
-#           begin # guard
-#           
-#            fork
-#              # JUMP
-#              begin
-#                 wait (m_premature_end);
-#                 `UVM_PH_TRACE("PH/TRC/EXE/JUMP","PHASE EXIT ON JUMP REQUEST",this,UVM_DEBUG)
-#              end
-#   
-#              # WAIT_FOR_ALL_DROPPED
-#              begin
-#                bit do_ready_to_end  ; # bit used for ready_to_end iterations
-#            uvm_objection phase_done;
-#                phase_done = get_objection();
-#                # OVM semantic: don't end until objection raised or stop request
-#                if (phase_doneget_objection_total=top  or 
-#                    m_use_ovm_run_semantic  and  m_imp.get_name() == "run") begin
-#                  if (!phase_done.m_top_all_dropped)
-#                    phase_done.wait_for(UVM_ALL_DROPPED, top);
-#                  `UVM_PH_TRACE("PH/TRC/EXE/ALLDROP","PHASE EXIT ALL_DROPPED",this,UVM_DEBUG)
-#                end
-#                else begin
-#                   if (m_phase_trace) `UVM_PH_TRACE("PH/TRC/SKIP","No objections raised, skipping phase",this,UVM_LOW)
-#                end
-#                
-#                wait_for_self_and_siblings_to_drop() ;
-#                do_ready_to_end = 1;
-#                   
-#                #--------------
-#                # READY_TO_END:
-#                #--------------
-#  
-#                while (do_ready_to_end) begin
-#                  uvm_wait_for_nba_region(); # Let all siblings see no objections before traverse might raise another 
-#                  `UVM_PH_TRACE("PH_READY_TO_END","PHASE READY TO END",this,UVM_DEBUG)
-#                  m_ready_to_end_count++;
-#                  if (m_phase_trace)
-#                    `UVM_PH_TRACE("PH_READY_TO_END_CB","CALLING READY_TO_END CB",this,UVM_HIGH)
-#                  state_chg.m_prev_state = m_state;
-#                  m_state = UVM_PHASE_READY_TO_END;
-#                  `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(this, state_chg))
-#                  if (m_imp != null)
-#                    m_imp.traverse(top,this,UVM_PHASE_READY_TO_END);
-#                   
-#                  uvm_wait_for_nba_region(); # Give traverse targets a chance to object 
-# 
-#                  wait_for_self_and_siblings_to_drop();
-#                  do_ready_to_end = (m_state == UVM_PHASE_EXECUTING)  and  (m_ready_to_end_count < get_max_ready_to_end_iterations()) ; #when we don't wait in task above, we drop out of while loop
-#                end
-#              end
-#   
-#              # TIMEOUT
-#              begin
-#                if (this.get_name() == "run") begin
-#                   if (top.phase_timeout == 0)
-#                     wait(top.phase_timeout != 0);
-#                   if (m_phase_trace)
-#                     `UVM_PH_TRACE("PH/TRC/TO_WAIT", $sformatf("STARTING PHASE TIMEOUT WATCHDOG (timeout == %t)", top.phase_timeout), this, UVM_HIGH)
-#                   `uvm_delay(top.phase_timeout)
-#                   if ($time == `UVM_DEFAULT_TIMEOUT) begin
-#                      if (m_phase_trace)
-#                        `UVM_PH_TRACE("PH/TRC/TIMEOUT", "PHASE TIMEOUT WATCHDOG EXPIRED", this, UVM_LOW)
-#                      foreach (m_executing_phases[p]) begin
-#             uvm_objection p_phase_done;
-#             p_phase_done = p.get_objection();
-#                         if ((p_phase_done != null)  and  (p_phase_done.get_objection_total() > 0)) begin
-#                            if (m_phase_trace)
-#                              `UVM_PH_TRACE("PH/TRC/TIMEOUT/OBJCTN", 
-#                                            $sformatf("Phase '%s' has outstanding objections:\n%s", p.get_full_name(), p_phase_done.convert2string()),
-#                                            this,
-#                                            UVM_LOW)
-#                         end
-#                      end
-#                         
-#                      `uvm_fatal("PH_TIMEOUT",
-#                                 $sformatf("Default timeout of %0t hit, indicating a probable testbench issue",
-#                                           `UVM_DEFAULT_TIMEOUT))
-#                   end
-#                   else begin
-#                      if (m_phase_trace)
-#                        `UVM_PH_TRACE("PH/TRC/TIMEOUT", "PHASE TIMEOUT WATCHDOG EXPIRED", this, UVM_LOW)
-#                      foreach (m_executing_phases[p]) begin
-#             uvm_objection p_phase_done;
-#             p_phase_done = p.get_objection();
-#                         if ((p_phase_done != null)  and  (p_phase_done.get_objection_total() > 0)) begin
-#                            if (m_phase_trace)
-#                              `UVM_PH_TRACE("PH/TRC/TIMEOUT/OBJCTN", 
-#                                            $sformatf("Phase '%s' has outstanding objections:\n%s", p.get_full_name(), p_phase_done.convert2string()),
-#                                            this,
-#                                            UVM_LOW)
-#                         end
-#                      end
-#                         
-#                      `uvm_fatal("PH_TIMEOUT",
-#                                 $sformatf("Explicit timeout of %0t hit, indicating a probable testbench issue",
-#                                           top.phase_timeout))
-#                   end
-#                   if (m_phase_trace)
-#                     `UVM_PH_TRACE("PH/TRC/EXE/3","PHASE EXIT TIMEOUT",this,UVM_DEBUG)
-#                end # if (this.get_name() == "run")
-#                else begin
-#                   wait (0); # never unblock for non-run phase
-#                end
-#              end # if (m_phase_trace)
-# 
-#   
-#            join_any
-#            disable fork;
-#         
-#           end
-#   
-#         join # guard
-# 
-#     end
-# 
-#   end
-# 
-#   m_executing_phasesdelete=this;
-# 
-#     #---------
-#     # JUMPING:
-#     #---------
-# 
-#     # If jump_to() was called then we need to kill all the successor
-#     # phases which may still be running and then initiate the new
-#     # phase.  The return is necessary so we don't start new successor
-#     # phases.  If we are doing a forward jump then we want to set the
-#     # state of this phase's successors to UVM_PHASE_DONE.  This
-#     # will let us pretend that all the phases between here and there
-#     # were executed and completed.  Thus any dependencies will be
-#     # satisfied preventing deadlocks.
-#     # GSA TBD insert new jump support
-# 
-#   if (m_phase_type == UVM_PHASE_NODE) begin
-# 
-#     if(m_premature_end) begin
-#       if(m_jump_phase != null) begin 
-#         state_chg.m_jump_to = m_jump_phase;
-#       
-#         `uvm_info("PH_JUMP",
-#               $sformatf("phase %s (schedule %s, domain %s) is jumping to phase %s",
-#                get_name(), get_schedule_name(), get_domain_name(), m_jump_phase.get_name()),
-#               UVM_MEDIUM)
-#       end
-#       else begin
-#         `uvm_info("PH_JUMP",
-#               $sformatf("phase %s (schedule %s, domain %s) is ending prematurely",
-#                get_name(), get_schedule_name(), get_domain_name()),
-#               UVM_MEDIUM)
-#       end
-#   
-#   
-#       #0; # LET ANY WAITERS ON READY_TO_END TO WAKE UP
-#       if (m_phase_trace)
-#         `UVM_PH_TRACE("PH_END","ENDING PHASE PREMATURELY",this,UVM_HIGH)
-#     end
-#     else begin
-#       # WAIT FOR PREDECESSORS:  # WAIT FOR PREDECESSORS:
-#       # function phases only
-#       if (task_phase  is None)
-#         m_wait_for_pred();
-#     end
-#   
-#     #-------
-#     # ENDED:
-#     #-------
-#     # execute 'phase_ended' callbacks
-#     if (m_phase_trace)
-#       `UVM_PH_TRACE("PH_END","ENDING PHASE",this,UVM_HIGH)
-#     state_chg.m_prev_state = m_state;
-#     m_state = UVM_PHASE_ENDED;
-#     `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(this, state_chg))
-#     if (m_imp != null)
-#       m_imp.traverse(top,this,UVM_PHASE_ENDED);
-#     #0; # LET ANY WAITERS WAKE UP
-#   
-#   
-#     #---------
-#     # CLEANUP:
-#     #---------
-#     # kill this phase's threads
-#     state_chg.m_prev_state = m_state;
-#     if(m_premature_end) m_state = UVM_PHASE_JUMPING;
-#     else m_state = UVM_PHASE_CLEANUP ;
-#     `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(this, state_chg))
-#     if (m_phase_proc != null) begin
-#       m_phase_proc.kill();
-#       m_phase_proc = null;
-#     end
-#     #0; # LET ANY WAITERS WAKE UP
-#     begin
-#       uvm_objection objection = get_objection();
-#       if (objection != null)
-#         objection.clear();
-#     end
-#   end
-# 
-#     #------
-#     # DONE:
-#     #------
-#   m_premature_end = 0 ;
-#   if(m_jump_fwd  or  m_jump_bkwd) begin
-#     if(m_jump_fwd) begin
-#       clear_successors(UVM_PHASE_DONE,m_jump_phase);
-#     end
-#     m_jump_phase.clear_successors();
-#   end
-#   else begin
-# 
-#     if (m_phase_trace)
-#       `UVM_PH_TRACE("PH/TRC/DONE","Completed phase",this,UVM_LOW)
-#     state_chg.m_prev_state = m_state;
-#     m_state = UVM_PHASE_DONE;
-#     `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(this, state_chg))
-#     m_phase_proc = null;
-#     #0; # LET ANY WAITERS WAKE UP
-#   end
-#     #0; # LET ANY WAITERS WAKE UP
-#   begin
-#     uvm_objection objection;
-#     objection = get_objection();
-#     if (objection != null)
-#       objection.clear();
-#   end
-# 
-# #-----------
-# # SCHEDULED:
-# #-----------
-#   if(m_jump_fwd  or  m_jump_bkwd) begin
-#     void'(m_phase_hoppertry_put=m_jump_phase);
-#     m_jump_phase = null;
-#     m_jump_fwd = 0;
-#     m_jump_bkwd = 0;
-#   end
-#     # If more successors, schedule them to run now
-#   elif: (m_successors.size() == 0) begin
-#     top.set_phase_all_done()
-#   end 
-#   else begin
-#     # execute all the successors
-#     foreach (m_successors[succ]) begin
-#       if(succ.m_state < UVM_PHASE_SCHEDULED) begin
-#         state_chg.m_prev_state = succ.m_state;
-#         state_chg.m_phase = succ;
-#         succ.m_state = UVM_PHASE_SCHEDULED;
-#         `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(succ, state_chg))
-#         #0; # LET ANY WAITERS WAKE UP
-#         void'(m_phase_hoppertry_put=succ);
-#         if (m_phase_trace)
-#           `UVM_PH_TRACE("PH/TRC/SCHEDULED",{"Scheduled from phase ",get_full_name()},succ,UVM_LOW)
-#       end
-#     end
-#   end        
-        yield Timer(0)
+            state_chg.m_prev_state = self.m_state
+            self.m_set_state(uvm_phase_state.UVM_PHASE_DONE)
+
+            #-----------
+            # SCHEDULED:
+            #-----------
+            # Successors are released in the same step that marks this node DONE,
+            # so that no other predecessor can observe the DONE state before the
+            # latches have been counted down.
+            self.m_schedule_successors(top)
+        yield NullTrigger() # LET ANY WAITERS WAKE UP
+
+    # Function- m_schedule_successors
+    #
+    # Counts down the predecessor latch of every successor of this node and
+    # puts the ones whose last predecessor this was onto the hopper. When
+    # there are no successors, all phasing is done.
+    def m_schedule_successors(self, top):
+        if len(self.m_successors) == 0:
+            top.set_phase_all_done()
+            return
+
+        for succ in self.m_successors.keys():
+            if succ.m_pred_done() and succ.m_state.value < uvm_phase_state.UVM_PHASE_SCHEDULED.value:
+                uvm_phase.m_schedule(succ)
+
+    # Function- m_pred_done
+    #
+    # Called once by each predecessor as it reaches DONE. Returns True when
+    # no predecessor remains outstanding and the node may be scheduled.
+    #
+    # The latch is armed by the first predecessor to finish (see
+    # <m_arm_pred_latch>). The latch disarms itself when it fires so that
+    # the node can be scheduled again after a backward jump.
+    def m_pred_done(self):
+        if self.m_pred_latch < 0:
+            return self.m_arm_pred_latch()
+
+        self.m_pred_latch -= 1
+        if self.m_pred_latch <= 0:
+            self.m_pred_latch = -1
+            return True
+        return False
+
+    # Function- m_arm_pred_latch
+    #
+    # Arms the predecessor latch with the number of predecessors that are
+    # not yet DONE, each of which counts it down through <m_pred_done> when
+    # it finishes. Predecessors that were marked DONE without executing (for
+    # example by a forward jump) are thus never waited for. Returns True,
+    # leaving the latch disarmed, when there are none.
+    #
+    # Called by the first predecessor to finish, and by <m_finish_jump> for
+    # the jump target, which no predecessor has released.
+    def m_arm_pred_latch(self):
+        self.m_pred_latch = 0
+        for pred in self.m_predecessors.keys():
+            if pred.m_state != uvm_phase_state.UVM_PHASE_DONE:
+                self.m_pred_latch += 1
+
+        if self.m_pred_latch == 0:
+            self.m_pred_latch = -1
+            return True
+        return False
+
+    # Function- m_set_state
+    #
+    # Changes the state of this node and wakes up any <wait_for_state> callers.
+    def m_set_state(self, state):
+        prev_state = self.m_state
+        self.m_state = state
+        if self.m_sync_barrier is not None:
+            self.m_sync_barrier.m_state_changed(prev_state, state)
+        waiters = self.m_rte_waiters
+        if waiters is not None and state.value >= uvm_phase_state.UVM_PHASE_READY_TO_END.value:
+            self.m_rte_waiters = None
+            for (barrier, pid) in waiters:
+                barrier.m_exit(pid)
+        ev = self.m_state_ev
+        if ev is not None:
+            self.m_state_ev = None
+            ev.set()
+
+    # Function- get_predecessors_for_successors
+    #
+    # Internal implementation, more efficient than calling get_predessor_nodes on all
+    # of the successors returned by get_adjacent_successor_nodes
+    def get_predecessors_for_successors(self, pred_of_succ):
+        successors = []
+        self.get_adjacent_successor_nodes(successors)
+
+        # get all predecessors to these successors
+        pending = []
+        for s in successors:
+            pending.extend(s.m_predecessors.keys())
+
+        # replace any terminal nodes with their predecessors, recursively.
+        # we are only interested in "real" phase nodes
+        seen = set()
+        while len(pending) > 0:
+            pred = pending.pop()
+            if pred in seen:
+                continue
+            seen.add(pred)
+            if pred.get_phase_type() != uvm_phase_type.UVM_PHASE_NODE:
+                pending.extend(pred.m_predecessors.keys())
+            else:
+                pred_of_succ[pred] = True
+
+        # remove ourselves from the list
+        pred_of_succ.pop(self, None)
+
+    # Task- m_wait_for_pred
+    #
+    # Waits for all predecessors of our successors (real phase nodes, not
+    # terminals) to be READY_TO_END.
+    @cocotb.coroutine
+    def m_wait_for_pred(self):
+        barrier = self.m_get_pred_barrier()
+        if barrier is not None:
+            yield barrier.wait()
+
+        yield NullTrigger() # LET ANY WAITERS WAKE UP
+
+    # Function- m_get_pred_barrier
+    #
+    # Returns a barrier that each predecessor of our successors counts down
+    # as it reaches READY_TO_END (see <m_set_state>), so that
+    # <m_wait_for_pred> waits on a single trigger rather than on each
+    # sibling in turn. Returns None when all of them already have.
+    def m_get_pred_barrier(self):
+        pred_of_succ = {}
+        self.get_predecessors_for_successors(pred_of_succ)
+
+        barrier = None
+        for sibling in pred_of_succ.keys():
+            if sibling.m_state.value < uvm_phase_state.UVM_PHASE_READY_TO_END.value:
+                if barrier is None:
+                    barrier = CountdownBarrier()
+                if sibling.m_rte_waiters is None:
+                    sibling.m_rte_waiters = []
+                sibling.m_rte_waiters.append((barrier, barrier.m_enter()))
+        return barrier
         
 #   extern local function void m_terminate_phase();
 #   extern local function void m_print_termination_state();
 #   extern local task wait_for_self_and_siblings_to_drop();
-#   extern function void kill();
-#   extern function void kill_successors();
+
+    # Function- kill
+    #
+    # Kills the task phase processes of this node that have not yet returned.
+    def kill(self):
+        self.m_task_procs.kill()
+
+
+    # Function- kill_successors
+    #
+    # Kills all the successor phases of the current phase, then this one.
+    def kill_successors(self):
+        nodes = self.m_get_topology().get_clear_set(self, None)
+        for i in range(len(nodes)-1, -1, -1):
+            nodes[i].kill()
+
 # 
 #     # TBD add more useful debug
 #     #---------------------------------
@@ -1210,9 +1459,10 @@ class uvm_phase(uvm_object):
 #     return s;
 #   endfunction
 # 
-#   function bit is_domain();
-#     return (m_phase_type == UVM_PHASE_DOMAIN);
-#   endfunction
+
+    def is_domain(self):
+        return self.m_phase_type == uvm_phase_type.UVM_PHASE_DOMAIN
+
 # 
 #   virtual function void m_get_transitive_children(ref uvm_phase phases[$]);
 #     foreach (m_successors[succ])
@@ -1298,398 +1548,51 @@ class uvm_phase(uvm_object):
 # 
 # `define UVM_PH_TRACE(ID,MSG,PH,VERB) \
 #    `uvm_info(ID, {$sformatf("Phase '%0s' (id=%0d) ", \
-#        PH.get_full_name(), PH.get_inst_id()),MSG}, VERB)
-# 
-# #-----------------------------
-# # Implementation - Construction
-# #-----------------------------
-# 
-# # new
-# 
-# function uvm_phase::new(string name="uvm_phase",
-#                         uvm_phase_type phase_type=UVM_PHASE_SCHEDULE,
-#                         uvm_phase parent=None);
-#   supernew=name;
-#   m_phase_type = phase_type;
-# 
-#     # The common domain is the only thing that initializes m_state.  All
-#     # other states are initialized by being 'added' to a schedule.
-#   if ((name == "common")  and 
-#       (phase_type == UVM_PHASE_DOMAIN))
-#     m_state = UVM_PHASE_DORMANT;
-#    
-#   m_run_count = 0;
-#   m_parent = parent;
-# 
-#   begin
-#     uvm_cmdline_processor clp = uvm_cmdline_processor::get_inst();
-#     string val;
-#     if (clp.get_arg_value("+UVM_PHASE_TRACE", val))
-#       m_phase_trace = 1;
-#     else
-#       m_phase_trace = 0;
-#     if (clp.get_arg_value("+UVM_USE_OVM_RUN_SEMANTIC", val))
-#       m_use_ovm_run_semantic = 1;
-#     else
-#       m_use_ovm_run_semantic = 0;
-#   end
-# 
-#    
-#   if (parent  is None  and  (phase_type == UVM_PHASE_SCHEDULE  or 
-#                          phase_type == UVM_PHASE_DOMAIN )) begin
-#     #m_parent = this;
-#     m_end_node = new({name,"_end"}, UVM_PHASE_TERMINAL, this);
-#     this.m_successors[m_end_node] = 1;
-#     m_end_node.m_predecessors[this] = 1;
-#   end
-# 
-# endfunction
-# 
-# 
-# # add
-# # ---
-# # TBD error checks if param nodes are actually in this schedule or not
-# 
-# function void uvm_phase::add(uvm_phase phase,
-#                              uvm_phase with_phase=None,
-#                              uvm_phase after_phase=None,
-#                              uvm_phase before_phase=None,
-#                              uvm_phase start_with_phase=None,
-#                              uvm_phase end_with_phase=None
-#                           );
-#   uvm_phase new_node, begin_node, end_node, tmp_node;
-#   uvm_phase_state_change state_chg;
-# 
-#   if (phase  is None)
-#       `uvm_fatal("PH/NULL", "add: phase argument is null")
-# 
-#   if (with_phase != null  and  with_phase.get_phase_type() == UVM_PHASE_IMP) begin
-#     string nm = with_phase.get_name();
-#     with_phase = find(with_phase);
-#     if (with_phase  is None)
-#       `uvm_fatal("PH_BAD_ADD",
-#          {"cannot find with_phase '",nm,"' within node '",get_name(),"'"})
-#   end
-# 
-#   if (before_phase != null  and  before_phase.get_phase_type() == UVM_PHASE_IMP) begin
-#     string nm = before_phase.get_name();
-#     before_phase = find(before_phase);
-#     if (before_phase  is None)
-#       `uvm_fatal("PH_BAD_ADD",
-#          {"cannot find before_phase '",nm,"' within node '",get_name(),"'"})
-#   end
-# 
-#   if (after_phase != null  and  after_phase.get_phase_type() == UVM_PHASE_IMP) begin
-#     string nm = after_phase.get_name();
-#     after_phase = find(after_phase);
-#     if (after_phase  is None)
-#       `uvm_fatal("PH_BAD_ADD",
-#          {"cannot find after_phase '",nm,"' within node '",get_name(),"'"})
-#   end
-# 
-#   if (start_with_phase != null  and  start_with_phase.get_phase_type() == UVM_PHASE_IMP) begin
-#     string nm = start_with_phase.get_name();
-#     start_with_phase = find(start_with_phase);
-#     if (start_with_phase  is None)
-#       `uvm_fatal("PH_BAD_ADD",
-#          {"cannot find start_with_phase '",nm,"' within node '",get_name(),"'"})
-#   end
-# 
-#   if (end_with_phase != null  and  end_with_phase.get_phase_type() == UVM_PHASE_IMP) begin
-#      string nm = end_with_phase.get_name();
-#      end_with_phase = find(end_with_phase);
-#      if (end_with_phase  is None)
-#       `uvm_fatal("PH_BAD_ADD",
-#          {"cannot find end_with_phase '",nm,"' within node '",get_name(),"'"})
-#   end
-# 
-#   if (((with_phase != null) + (after_phase != null) + (start_with_phase != null)) > 1)
-#     `uvm_fatal("PH_BAD_ADD",
-#        "only one of with_phase/after_phase/start_with_phase may be specified as they all specify predecessor")
-# 
-#   if (((with_phase != null) + (before_phase != null) + (end_with_phase != null)) > 1)
-#     `uvm_fatal("PH_BAD_ADD",
-#        "only one of with_phase/before_phase/end_with_phase may be specified as they all specify successor")
-# 
-#   if (before_phase == this  or  
-#      after_phase == m_end_node  or  
-#      with_phase == m_end_node  or 
-#      start_with_phase == m_end_node  or 
-#      end_with_phase == m_end_node) 
-#     `uvm_fatal("PH_BAD_ADD",
-#        "cannot add before begin node, after end node, or with end nodes")
-# 
-#   if (before_phase != null  and  after_phase != null) begin
-#     if (!after_phaseis_before=before_phase) begin
-#       `uvm_fatal("PH_BAD_ADD",{"Phase '",before_phase.get_name(),
-#                  "' is not before phase '",after_phase.get_name(),"'"})
-#     end
-#   end
-# 
-#   if (before_phase != null  and  start_with_phase != null) begin
-#     if (!start_with_phaseis_before=before_phase) begin
-#       `uvm_fatal("PH_BAD_ADD",{"Phase '",before_phase.get_name(),
-#                  "' is not before phase '",start_with_phase.get_name(),"'"})
-#     end
-#   end
-# 
-#   if (end_with_phase != null  and  after_phase != null) begin
-#     if (!after_phaseis_before=end_with_phase) begin
-#        `uvm_fatal("PH_BAD_ADD",{"Phase '",end_with_phase.get_name(),
-#                  "' is not before phase '",after_phase.get_name(),"'"})
-#     end
-#   end
-# 
-#     # If we are inserting a new "leaf node"
-#   if (phase.get_phase_type() == UVM_PHASE_IMP) begin
-#     uvm_task_phase tp;
-#     new_node = new(phase.get_name(),UVM_PHASE_NODE,this);
-#     new_node.m_imp = phase;
-#     begin_node = new_node;
-#     end_node = new_node;
-# 
-#   end
-#     # We are inserting an existing schedule
-#   else begin
-#     begin_node = phase;
-#     end_node   = phase.m_end_node;
-#     phase.m_parent = this;
-#   end
-# 
-#     # If 'with_phase' is us, then insert node in parallel
-#   /*
-#   if (with_phase == this) begin
-#     after_phase = this;
-#     before_phase = m_end_node;
-#   end
-#   */
-# 
-#     # If no before/after/with specified, insert at end of this schedule
-#   if (with_phase is None  and  after_phase is None  and  before_phase is None  and  
-#      start_with_phase is None  and  end_with_phase is None) begin
-#     before_phase = m_end_node;
-#   end
-# 
-# 
-#   if (m_phase_trace) begin
-#     uvm_phase_type typ = phase.get_phase_type();
-#     `uvm_info("PH/TRC/ADD_PH",
-#       {get_name()," (",m_phase_type.name(),") ADD_PHASE: phase=",phase.get_full_name()," (",
-#       typ.name(),", inst_id=",$sformatf("%0d",phase.get_inst_id()),")",
-#       " with_phase=",   (with_phase  is None)   ? "null" : with_phase.get_name(), 
-#       " start_with_phase=",   (start_with_phase  is None)   ? "null" : start_with_phase.get_name(), 
-#       " end_with_phase=",   (end_with_phase  is None)   ? "null" : end_with_phase.get_name(), 
-#       " after_phase=",  (after_phase  is None)  ? "null" : after_phase.get_name(),
-#       " before_phase=", (before_phase  is None) ? "null" : before_phase.get_name(), 
-#       " new_node=",     (new_node  is None)     ? "null" : {new_node.get_name(),
-#                                                            " inst_id=",
-#                                                            $sformatf("%0d",new_node.get_inst_id())},
-#       " begin_node=",   (begin_node  is None)   ? "null" : begin_node.get_name(),
-#       " end_node=",     (end_node  is None)     ? "null" : end_node.get_name()},UVM_DEBUG)
-#   end
-# 
-# 
-#     # 
-#     # INSERT IN PARALLEL WITH 'WITH' PHASE
-#   if (with_phase != null) begin
-#     # all pre-existing predecessors to with_phase are predecessors to the new phase
-#     begin_node.m_predecessors = with_phase.m_predecessors;
-#     foreach (with_phase.m_predecessors[pred]) pred.m_successors[begin_node] = 1;
-#     # all pre-existing successors to with_phase are successors to this phase
-#     end_node.m_successors = with_phase.m_successors;
-#     foreach (with_phase.m_successors[succ]) succ.m_predecessors[end_node] = 1;
-#   end
-#   
-#   if (start_with_phase != null) begin
-#     # all pre-existing predecessors to start_with_phase are predecessors to the new phase
-#     begin_node.m_predecessors = start_with_phase.m_predecessors;
-#     foreach (start_with_phase.m_predecessors[pred]) begin
-#       pred.m_successors[begin_node] = 1;
-#     end
-#     # if not otherwise specified, successors for the new phase are the successors to the end of this schedule
-#     if (before_phase  is None  and  end_with_phase  is None) begin
-#       end_node.m_successors = m_end_node.m_successors ;
-#       foreach (m_end_node.m_successors[succ]) begin
-#         succ.m_predecessors[end_node] = 1;
-#       end
-#     end
-#   end
-#   
-#   if (end_with_phase != null) begin
-#      # all pre-existing successors to end_with_phase are successors to the new phase
-#     end_node.m_successors = end_with_phase.m_successors;
-#     foreach (end_with_phase.m_successors[succ]) begin
-#       succ.m_predecessors[end_node] = 1;
-#     end
-#     # if not otherwise specified, predecessors for the new phase are the predecessors to the start of this schedule
-#     if (after_phase  is None  and  start_with_phase  is None) begin
-#       begin_node.m_predecessors = this.m_predecessors ;
-#       foreach (this.m_predecessors[pred]) begin
-#         pred.m_successors[begin_node] = 1;
-#       end
-#     end
-#   end
-# 
-#     # INSERT BEFORE PHASE
-#   if (before_phase != null) begin
-#     # unless predecessors to this phase are otherwise specified, 
-#     # pre-existing predecessors to before_phase move to be predecessors to the new phase
-#     if (after_phase  is None  and  start_with_phase  is None) begin
-#       foreach (before_phase.m_predecessors[pred]) begin
-#         pred.m_successorsdelete=before_phase;
-#         pred.m_successors[begin_node] = 1;
-#       end
-#       begin_node.m_predecessors = before_phase.m_predecessors;
-#       before_phase.m_predecessors.clear();
-#     end
-#     # there is a special case if before and after used to be adjacent;
-#     # the new phase goes in-between them
-#     elif: (before_phase.m_predecessorsexists=after_phase) begin
-#       before_phase.m_predecessorsdelete=after_phase;
-#     end
-# 
-#     # before_phase is now the sole successor of this phase
-#     before_phase.m_predecessors[end_node] = 1;
-#     end_node.m_successors.clear() ;
-#     end_node.m_successors[before_phase] = 1;
-# 
-#   end
-# 
-# 
-#     # INSERT AFTER PHASE
-#   if (after_phase != null) begin
-#     # unless successors to this phase are otherwise specified, 
-#     # pre-existing successors to after_phase are now successors to this phase
-#     if (before_phase  is None  and  end_with_phase  is None) begin
-#       foreach (after_phase.m_successors[succ]) begin
-#        succ.m_predecessorsdelete=after_phase;
-#        succ.m_predecessors[end_node] = 1;
-#       end
-#       end_node.m_successors = after_phase.m_successors;
-#       after_phase.m_successors.clear();
-#     end
-#     # there is a special case if before and after used to be adjacent;
-#     # the new phase goes in-between them
-#     elif: (after_phase.m_successorsexists=before_phase) begin
-#       after_phase.m_successorsdelete=before_phase;
-#     end
-# 
-#     # after_phase is the sole predecessor of this phase 
-#     after_phase.m_successors[begin_node] = 1;
-#     begin_node.m_predecessors.clear();
-#     begin_node.m_predecessors[after_phase] = 1;
-#   end
-#   
-# 
-# 
-#     # Transition nodes to DORMANT state
-#   if (new_node  is None)
-#     tmp_node = phase;
-#   else
-#     tmp_node = new_node;
-# 
-#   state_chg = uvm_phase_state_change::type_id::create(tmp_node.get_name());
-#   state_chg.m_phase = tmp_node;
-#   state_chg.m_jump_to = null;
-#   state_chg.m_prev_state = tmp_node.m_state;
-#   tmp_node.m_state = UVM_PHASE_DORMANT;
-#   `uvm_do_callbacks(uvm_phase, uvm_phase_cb, phase_state_change(tmp_node, state_chg)) 
-# endfunction
-# 
-# 
-# # get_parent
-# # ----------
-# 
-# function uvm_phase uvm_phase::get_parent();
-#   return m_parent;
-# endfunction
-# 
-# 
-# # get_imp
-# # -------
-# 
-# function uvm_phase uvm_phase::get_imp();
-#   return m_imp;
-# endfunction
-# 
-# 
-# # get_schedule
-# # ------------
-# 
-# function uvm_phase uvm_phase::get_schedule(bit hier=0);
-#   uvm_phase sched;
-#   sched = this;
-#   if (hier)
-#     while (sched.m_parent != null  and  (sched.m_parent.get_phase_type() == UVM_PHASE_SCHEDULE))
-#       sched = sched.m_parent;
-#   if (sched.m_phase_type == UVM_PHASE_SCHEDULE)
-#     return sched;
-#   if (sched.m_phase_type == UVM_PHASE_NODE)
-#     if (m_parent != null  and  m_parent.m_phase_type != UVM_PHASE_DOMAIN)
-#       return m_parent;
-#   return null;
-# endfunction
-# 
-# 
-# # get_domain
-# # ----------
+#        PH.get_full_name(), PH.get_inst_id()),MSG}, VERB)
 # 
-# function uvm_domain uvm_phase::get_domain();
-#   uvm_phase phase;
-#   phase = this;
-#   while (phase != null  and  phase.m_phase_type != UVM_PHASE_DOMAIN)
-#     phase = phase.m_parent;
-#   if (phase  is None) # no parent domain 
-#     return null;
-#   if(!$cast(get_domain,phase))
-#       `uvm_fatal("PH/INTERNAL", "get_domain: m_phase_type is DOMAIN but $cast to uvm_domain fails")
-# endfunction
+# #-----------------------------
+# # Implementation - Construction
+# #-----------------------------
 # 
+# # new
 # 
-# # get_domain_name
-# # ---------------
-#   
-# function string uvm_phase::get_domain_name();
-#   uvm_domain domain;
-#   domain = get_domain();
-#   if (domain  is None)
-#     return "unknown";
-#   return domain.get_name();
-# endfunction
+# function uvm_phase::new(string name="uvm_phase",
+#                         uvm_phase_type phase_type=UVM_PHASE_SCHEDULE,
+#                         uvm_phase parent=None);
+#   supernew=name;
+#   m_phase_type = phase_type;
 # 
+#     # The common domain is the only thing that initializes m_state.  All
+#     # other states are initialized by being 'added' to a schedule.
+#   if ((name == "common")  and 
+#       (phase_type == UVM_PHASE_DOMAIN))
+#     m_state = UVM_PHASE_DORMANT;
+#    
+#   m_run_count = 0;
+#   m_parent = parent;
 # 
-# # get_schedule_name
-# # -----------------
-#   
-# function string uvm_phase::get_schedule_name(bit hier=0);
-#   uvm_phase sched;
-#   string s;
-#   sched = get_schedule(hier);
-#   if (sched  is None)
-#     return "";
-#   s = sched.get_name();
-#   while (sched.m_parent != null  and  sched.m_parent != sched  and 
-#           (sched.m_parent.get_phase_type() == UVM_PHASE_SCHEDULE)) begin
-#     sched = sched.m_parent;
-#     s = {sched.get_name(),(s.len()>0?".":""),s};
+#   begin
+#     uvm_cmdline_processor clp = uvm_cmdline_processor::get_inst();
+#     string val;
+#     if (clp.get_arg_value("+UVM_PHASE_TRACE", val))
+#       m_phase_trace = 1;
+#     else
+#       m_phase_trace = 0;
+#     if (clp.get_arg_value("+UVM_USE_OVM_RUN_SEMANTIC", val))
+#       m_use_ovm_run_semantic = 1;
+#     else
+#       m_use_ovm_run_semantic = 0;
 #   end
-#   return s;
-# endfunction
 # 
+#    
+#   if (parent  is None  and  (phase_type == UVM_PHASE_SCHEDULE  or 
+#                          phase_type == UVM_PHASE_DOMAIN )) begin
+#     #m_parent = this;
+#     m_end_node = new({name,"_end"}, UVM_PHASE_TERMINAL, this);
+#     this.m_successors[m_end_node] = 1;
+#     m_end_node.m_predecessors[this] = 1;
+#   end
 # 
-# # get_full_name
-# # -------------
-# 
-# function string uvm_phase::get_full_name();
-#   string dom, sch;
-#   if (m_phase_type == UVM_PHASE_IMP)
-#     return get_name();
-#   get_full_name = get_domain_name();
-#   sch = get_schedule_name();
-#   if (sch != "")
-#     get_full_name = {get_full_name, ".", sch};
-#   if (m_phase_type != UVM_PHASE_DOMAIN  and  m_phase_type != UVM_PHASE_SCHEDULE)
-#     get_full_name = {get_full_name, ".", get_name()};
 # endfunction
 # 
 # 
@@ -1700,54 +1603,11 @@ class uvm_phase(uvm_object):
 #   return m_phase_type;
 # endfunction
 # 
-# # set_max_ready_to_end_iterations
-# # -------------------------------
-# 
-# function void uvm_phase::set_max_ready_to_end_iterations(int max);
-#   max_ready_to_end_iters = max;
-# endfunction
-# 
-# # get_max_ready_to_end_iterations
-# # -------------------------------
-# 
-# function int uvm_phase::get_max_ready_to_end_iterations();
-#   return max_ready_to_end_iters;
-# endfunction
-# 
-# # set_default_max_ready_to_end_iterations
-# # ---------------------------------------
-# 
-# function void uvm_phase::set_default_max_ready_to_end_iterations(int max);
-#   m_default_max_ready_to_end_iters = max;
-# endfunction
-# 
-# # get_default_max_ready_to_end_iterations
-# # ---------------------------------------
-# 
-# function int uvm_phase::get_default_max_ready_to_end_iterations();
-#   return m_default_max_ready_to_end_iters;
-# endfunction
-# 
 # 
 # #-----------------------
 # # Implementation - State
 # #-----------------------
 # 
-# # get_state
-# # ---------
-# 
-# function uvm_phase_state uvm_phase::get_state();
-#   return m_state;
-# endfunction
-# 
-# # get_run_count
-# # -------------
-# 
-# function int uvm_phase::get_run_count();
-#   return m_run_count;
-# endfunction
-# 
-# 
 # # m_print_successors
 # # ------------------
 # 
@@ -1766,162 +1626,6 @@ class uvm_phase(uvm_object):
 # endfunction
 # 
 # 
-# # m_find_predecessor
-# # ------------------
-# 
-# function uvm_phase uvm_phase::m_find_predecessor(uvm_phase phase, bit stay_in_scope=1, uvm_phase orig_phase=None);
-#   uvm_phase found;
-#     #$display("  FIND PRED node '",phase.get_name(),"' (id=",$sformatf("%0d",phase.get_inst_id()),") - checking against ",get_name()," (",m_phase_type.name()," id=",$sformatf("%0d",get_inst_id()),(m_imp is None)?"":{"/",$sformatf("%0d",m_imp.get_inst_id())},")");
-#   if (phase  is None) begin
-#     return null ;
-#   end
-#   if (phase == m_imp  or  phase == this)
-#     return this;
-#   foreach (m_predecessors[pred]) begin
-#     uvm_phase orig;
-#     orig = (orig_phase is None) ? this : orig_phase;
-#     if (!stay_in_scope  or  
-#         (pred.get_schedule() == orig.get_schedule())  or 
-#         (pred.get_domain() == orig.get_domain())) begin
-#       found = pred.m_find_predecessor(phase,stay_in_scope,orig);
-#       if (found != null)
-#         return found;
-#     end
-#   end
-#   return null;
-# endfunction
-# 
-# 
-# # m_find_predecessor_by_name
-# # --------------------------
-# 
-# function uvm_phase uvm_phase::m_find_predecessor_by_name(string name, bit stay_in_scope=1, uvm_phase orig_phase=None);
-#   uvm_phase found;
-#     #$display("  FIND PRED node '",name,"' - checking against ",get_name()," (",m_phase_type.name()," id=",$sformatf("%0d",get_inst_id()),(m_imp is None)?"":{"/",$sformatf("%0d",m_imp.get_inst_id())},")");
-#   if (get_name() == name)
-#     return this;
-#   foreach (m_predecessors[pred]) begin
-#     uvm_phase orig;
-#     orig = (orig_phase is None) ? this : orig_phase;
-#     if (!stay_in_scope  or  
-#         (pred.get_schedule() == orig.get_schedule())  or 
-#         (pred.get_domain() == orig.get_domain())) begin
-#       found = pred.m_find_predecessor_by_name(name,stay_in_scope,orig);
-#       if (found != null)
-#         return found;
-#     end
-#   end
-#   return null;
-# endfunction
-# 
-# 
-# # m_find_successor
-# # ----------------
-# 
-# function uvm_phase uvm_phase::m_find_successor(uvm_phase phase, bit stay_in_scope=1, uvm_phase orig_phase=None);
-#   uvm_phase found;
-#     #$display("  FIND SUCC node '",phase.get_name(),"' (id=",$sformatf("%0d",phase.get_inst_id()),") - checking against ",get_name()," (",m_phase_type.name()," id=",$sformatf("%0d",get_inst_id()),(m_imp is None)?"":{"/",$sformatf("%0d",m_imp.get_inst_id())},")");
-#   if (phase  is None) begin
-#     return null ;
-#   end
-#   if (phase == m_imp  or  phase == this) begin
-#     return this;
-#     end
-#   foreach (m_successors[succ]) begin
-#     uvm_phase orig;
-#     orig = (orig_phase is None) ? this : orig_phase;
-#     if (!stay_in_scope  or  
-#         (succ.get_schedule() == orig.get_schedule())  or 
-#         (succ.get_domain() == orig.get_domain())) begin
-#       found = succ.m_find_successor(phase,stay_in_scope,orig);
-#       if (found != null) begin
-#         return found;
-#         end
-#     end
-#   end
-#   return null;
-# endfunction
-# 
-# 
-# # m_find_successor_by_name
-# # ------------------------
-# 
-# function uvm_phase uvm_phase::m_find_successor_by_name(string name, bit stay_in_scope=1, uvm_phase orig_phase=None);
-#   uvm_phase found;
-#     #$display("  FIND SUCC node '",name,"' - checking against ",get_name()," (",m_phase_type.name()," id=",$sformatf("%0d",get_inst_id()),(m_imp is None)?"":{"/",$sformatf("%0d",m_imp.get_inst_id())},")");
-#   if (get_name() == name)
-#     return this;
-#   foreach (m_successors[succ]) begin
-#     uvm_phase orig;
-#     orig = (orig_phase is None) ? this : orig_phase;
-#     if (!stay_in_scope  or  
-#         (succ.get_schedule() == orig.get_schedule())  or 
-#         (succ.get_domain() == orig.get_domain())) begin
-#       found = succ.m_find_successor_by_name(name,stay_in_scope,orig);
-#       if (found != null)
-#         return found;
-#     end
-#   end
-#   return null;
-# endfunction
-# 
-# 
-# # find
-# # ----
-# 
-# function uvm_phase uvm_phase::find(uvm_phase phase, bit stay_in_scope=1);
-#     # TBD full search
-#     #$display({"\nFIND node '",phase.get_name(),"' within ",get_name()," (scope ",m_phase_type.name(),")", (stay_in_scope) ? " staying within scope" : ""});
-#   if (phase == m_imp  or  phase == this)
-#     return phase;
-#   find = m_find_predecessor(phase,stay_in_scope,this);
-#   if (find  is None)
-#     find = m_find_successor(phase,stay_in_scope,this);
-# endfunction
-# 
-# 
-# # find_by_name
-# # ------------
-# 
-# function uvm_phase uvm_phase::find_by_name(string name, bit stay_in_scope=1);
-#     # TBD full search
-#     #$display({"\nFIND node named '",name,"' within ",get_name()," (scope ",m_phase_type.name(),")", (stay_in_scope) ? " staying within scope" : ""});
-#   if (get_name() == name)
-#     return this;
-#   find_by_name = m_find_predecessor_by_name(name,stay_in_scope,this);
-#   if (find_by_name  is None)
-#     find_by_name = m_find_successor_by_name(name,stay_in_scope,this);
-# endfunction
-# 
-# 
-# # is
-# # --
-#   
-# function bit uvm_phase::is(uvm_phase phase);
-#   return (m_imp == phase  or  this == phase); 
-# endfunction
-# 
-#   
-# # is_before
-# # ---------
-# 
-# function bit uvm_phase::is_before(uvm_phase phase);
-#     #$display("this=%s is before phase=%s?",get_name(),phase.get_name());
-#     # TODO: add support for 'stay_in_scope=1' functionality
-#   return (!is(phase)  and  m_find_successor(phase,0,this) != null);
-# endfunction
-# 
-# 
-# # is_after
-# # --------
-#   
-# function bit uvm_phase::is_after(uvm_phase phase);
-#     #$display("this=%s is after phase=%s?",get_name(),phase.get_name());
-#     # TODO: add support for 'stay_in_scope=1' functionality
-#   return (!is(phase)  and  m_find_predecessor(phase,0,this) != null);
-# endfunction
-# 
-# 
 # # execute_phase
 # # -------------
 # 
@@ -2303,147 +2007,6 @@ class uvm_phase(uvm_object):
 # 
 # endtask
 # 
-# function void uvm_phase::get_adjacent_predecessor_nodes(ref uvm_phase pred[]);
-#    bit done;
-#    bit predecessors[uvm_phase];
-#    int idx;
-# 
-#    # Get all predecessors (including TERMINALS, SCHEDULES, etc.)
-#    foreach (m_predecessors[p])
-#      predecessors[p] = 1;
-# 
-#    # Replace any terminal / schedule nodes with their predecessors,
-#    # recursively.
-#    do begin
-#       done = 1;
-#       foreach (predecessors[p]) begin
-#          if (p.get_phase_type() != UVM_PHASE_NODE) begin
-#             predecessorsdelete=p;
-#             foreach (p.m_predecessors[next_p])
-#               predecessors[next_p] = 1;
-#             done = 0;
-#          end
-#       end
-#    end while (!done); 
-# 
-#    pred = new [predecessors.size()];
-#    foreach (predecessors[p]) begin
-#       pred[idx++] = p;
-#    end
-# endfunction : get_adjacent_predecessor_nodes
-# 
-# function void uvm_phase::get_adjacent_successor_nodes(ref uvm_phase succ[]);
-#    bit done;
-#    bit successors[uvm_phase];
-#    int idx;
-# 
-#    # Get all successors (including TERMINALS, SCHEDULES, etc.)
-#    foreach (m_successors[s])
-#      successors[s] = 1;
-# 
-#    # Replace any terminal / schedule nodes with their successors,
-#    # recursively.
-#    do begin
-#       done = 1;
-#       foreach (successors[s]) begin
-#          if (s.get_phase_type() != UVM_PHASE_NODE) begin
-#             successorsdelete=s;
-#             foreach (s.m_successors[next_s])
-#               successors[next_s] = 1;
-#             done = 0;
-#          end
-#       end
-#    end while (!done); 
-# 
-#    succ = new [successors.size()];
-#    foreach (successors[s]) begin
-#       succ[idx++] = s;
-#    end
-# endfunction : get_adjacent_successor_nodes
-# 
-# # Internal implementation, more efficient than calling get_predessor_nodes on all
-# # of the successors returned by get_adjacent_successor_nodes
-# function void uvm_phase::get_predecessors_for_successors(output bit pred_of_succ[uvm_phase]);
-#     bit done;
-#     uvm_phase successors[];
-# 
-#     get_adjacent_successor_nodes(successors);
-#           
-#     # get all predecessors to these successors
-#     foreach (successors[s])
-#       foreach (successors[s].m_predecessors[pred])
-#         pred_of_succ[pred] = 1;
-#     
-#     # replace any terminal nodes with their predecessors, recursively.
-#     # we are only interested in "real" phase nodes
-#     do begin
-#       done=1;
-#       foreach (pred_of_succ[pred]) begin
-#         if (pred.get_phase_type() != UVM_PHASE_NODE) begin
-#           pred_of_succdelete=pred; 
-#           foreach (pred.m_predecessors[next_pred])
-#             pred_of_succ[next_pred] = 1;
-#           done =0;
-#         end
-#       end
-#     end while (!done);
-# 
-# 
-#     # remove ourselves from the list
-#     pred_of_succdelete=this;
-# endfunction
-# 
-# 
-# # m_wait_for_pred
-# # ---------------
-# 
-# task uvm_phase::m_wait_for_pred();
-# 
-#     bit pred_of_succ[uvm_phase];
-#     get_predecessors_for_successors(pred_of_succ);
-# 
-#     # wait for predecessors to successors (real phase nodes, not terminals)
-#     # mostly debug msgs
-#     foreach (pred_of_succ[sibling]) begin
-# 
-#       if (m_phase_trace) begin
-#         string s;
-#         s = $sformatf("Waiting for phase '%s' (%0d) to be READY_TO_END. Current state is %s",
-#             sibling.get_name(),sibling.get_inst_id(),sibling.m_state.name());
-#         `UVM_PH_TRACE("PH/TRC/WAIT_PRED_OF_SUCC",s,this,UVM_HIGH)
-#       end
-# 
-#       sibling.wait_for_state(UVM_PHASE_READY_TO_END, UVM_GTE);
-# 
-#       if (m_phase_trace) begin
-#         string s;
-#         s = $sformatf("Phase '%s' (%0d) is now READY_TO_END. Releasing phase",
-#             sibling.get_name(),sibling.get_inst_id());
-#         `UVM_PH_TRACE("PH/TRC/WAIT_PRED_OF_SUCC",s,this,UVM_HIGH)
-#       end
-# 
-#     end
-# 
-#     if (m_phase_trace) begin
-#       if (pred_of_succ.num()) begin
-#         string s = "( ";
-#         foreach (pred_of_succ[pred])
-#           s = {s, pred.get_full_name()," "};
-#         s = {s, ")"};
-#         `UVM_PH_TRACE("PH/TRC/WAIT_PRED_OF_SUCC",
-#               {"*** All pred to succ ",s," in READY_TO_END state, so ending phase ***"},this,UVM_HIGH)
-#       end
-#       else begin
-#         `UVM_PH_TRACE("PH/TRC/WAIT_PRED_OF_SUCC",
-#                     "*** No pred to succ other than myself, so ending phase ***",this,UVM_HIGH)
-#       end
-#     end
-# 
-#     #0; # LET ANY WAITERS WAKE UP
-# 
-# endtask
-# 
-# 
 # #---------------------------------
 # # Implementation - Synchronization
 # #---------------------------------
@@ -2523,252 +2086,6 @@ class uvm_phase(uvm_object):
 #   end
 # endfunction : get_objection_count
 # 
-# # sync
-# # ----
-# 
-# function void uvm_phase::sync(uvm_domain target,
-#                               uvm_phase phase=None,
-#                               uvm_phase with_phase=None);
-#   if (!this.is_domain()) begin
-#     `uvm_fatal("PH_BADSYNC","sync() called from a non-domain phase schedule node")
-#   end
-#   elif: (target  is None) begin
-#     `uvm_fatal("PH_BADSYNC","sync() called with a null target domain")
-#   end
-#   elif: (!target.is_domain()) begin
-#     `uvm_fatal("PH_BADSYNC","sync() called with a non-domain phase schedule node as target")
-#   end
-#   elif: (phase  is None  and  with_phase != null) begin
-#     `uvm_fatal("PH_BADSYNC","sync() called with null phase and non-null with phase")
-#   end
-#   elif: (phase  is None) begin
-#     # whole domain sync - traverse this domain schedule from begin to end node and sync each node
-#     int visited[uvm_phase];
-#     uvm_phase queue[$];
-#     queueappend=this;
-#     visited[this] = 1;
-#     while (queue.size()) begin
-#       uvm_phase node;
-#       node = queue.pop_front();
-#       if (node.m_imp != null) begin
-#         sync(target, node.m_imp);
-#       end
-#       foreach (node.m_successors[succ]) begin
-#         if (!visitedexists=succ) begin
-#           queueappend=succ;
-#           visited[succ] = 1;
-#         end
-#       end
-#     end
-#   end else begin
-#     # single phase sync
-#     # this is a 2-way ('with') sync and we check first in case it is already there
-#     uvm_phase from_node, to_node;
-#     int found_to[$], found_from[$];
-#     if(with_phase  is None) with_phase = phase;
-#     from_node = find(phase);
-#     to_node = targetfind=with_phase;
-#     if(from_node  is None  or  to_node  is None) return;
-#     found_to = from_node.m_syncfind_index=node with (node == to_node);
-#     found_from = to_node.m_syncfind_index=node with (node == from_node);
-#     if (found_to.size() == 0) from_node.m_syncappend=to_node;
-#     if (found_from.size() == 0) to_node.m_syncappend=from_node;
-#   end
-# endfunction
-# 
-# 
-# # unsync
-# # ------
-# 
-# function void uvm_phase::unsync(uvm_domain target,
-#                                 uvm_phase phase=None,
-#                                 uvm_phase with_phase=None);
-#   if (!this.is_domain()) begin
-#     `uvm_fatal("PH_BADSYNC","unsync() called from a non-domain phase schedule node")
-#   end elif: (target  is None) begin
-#     `uvm_fatal("PH_BADSYNC","unsync() called with a null target domain")
-#   end elif: (!target.is_domain()) begin
-#     `uvm_fatal("PH_BADSYNC","unsync() called with a non-domain phase schedule node as target")
-#   end elif: (phase  is None  and  with_phase != null) begin
-#     `uvm_fatal("PH_BADSYNC","unsync() called with null phase and non-null with phase")
-#   end elif: (phase  is None) begin
-#     # whole domain unsync - traverse this domain schedule from begin to end node and unsync each node
-#     int visited[uvm_phase];
-#     uvm_phase queue[$];
-#     queueappend=this;
-#     visited[this] = 1;
-#     while (queue.size()) begin
-#       uvm_phase node;
-#       node = queue.pop_front();
-#       if (node.m_imp != null) unsync(target,node.m_imp);
-#       foreach (node.m_successors[succ]) begin
-#         if (!visitedexists=succ) begin
-#           queueappend=succ;
-#           visited[succ] = 1;
-#         end
-#       end
-#     end
-#   end else begin
-#     # single phase unsync
-#     # this is a 2-way ('with') sync and we check first in case it is already there
-#     uvm_phase from_node, to_node;
-#     int found_to[$], found_from[$];
-#     if(with_phase  is None) with_phase = phase;
-#     from_node = find(phase);
-#     to_node = targetfind=with_phase;
-#     if(from_node  is None  or  to_node  is None) return;
-#     found_to = from_node.m_syncfind_index=node with (node == to_node);
-#     found_from = to_node.m_syncfind_index=node with (node == from_node);
-#     if (found_to.size()) from_node.m_sync.delete(found_to[0]);
-#     if (found_from.size()) to_node.m_sync.delete(found_from[0]);
-#   end
-# endfunction
-# 
-# 
-# # wait_for_state
-# #---------------
-#   
-# task uvm_phase::wait_for_state(uvm_phase_state state, uvm_wait_op op=UVM_EQ);
-#   case (op)
-#     UVM_EQ:  wait((state&m_state) != 0);
-#     UVM_NE:  wait((state&m_state) == 0);
-#     UVM_LT:  wait(m_state <  state);
-#     UVM_LTE: wait(m_state <= state);
-#     UVM_GT:  wait(m_state >  state);
-#     UVM_GTE: wait(m_state >= state);
-#   endcase
-# endtask
-# 
-# 
-# #-------------------------
-# # Implementation - Jumping
-# #-------------------------
-# 
-# # set_jump_phase
-# # ----
-# #
-# # Specify a phase to transition to when phase is complete.
-# 
-# function void uvm_phase::set_jump_phase(uvm_phase phase) ;
-#   uvm_phase d;
-# 
-#   if ((m_state <  UVM_PHASE_STARTED)  or 
-#       (m_state >  UVM_PHASE_ENDED) )
-#   begin
-#    `uvm_error("JMPPHIDL", { "Attempting to jump from phase \"",
-#       get_name(), "\" which is not currently active (current state is ",
-#       m_state.name(), "). The jump will not happen until the phase becomes ",
-#       "active."})
-#   end
-# 
-# 
-# 
-#     # A jump can be either forward or backwards in the phase graph.
-#     # If the specified phase (name) is found in the set of predecessors
-#     # then we are jumping backwards.  If, on the other hand, the phase is in the set
-#     # of successors then we are jumping forwards.  If neither, then we
-#     # have an error.
-#     #
-#     # If the phase is non-existant and thus we don't know where to jump
-#     # we have a situation where the only thing to do is to uvm_report_fatal
-#     # and terminate_phase.  By calling this function the intent was to
-#     # jump to some other phase. So, continuing in the current phase doesn't
-#     # make any sense.  And we don't have a valid phase to jump to.  So we're done.
-# 
-#   d = m_find_predecessor(phase,0);
-#   if (d  is None) begin
-#     d = m_find_successor(phase,0);
-#     if (d  is None) begin
-#       string msg;
-#       $sformat(msg,{"phase %s is neither a predecessor or successor of ",
-#                     "phase %s or is non-existant, so we cannot jump to it.  ",
-#                     "Phase control flow is now undefined so the simulation ",
-#                     "must terminate"}, phase.get_name(), get_name());
-#       `uvm_fatal("PH_BADJUMP", msg)
-#     end
-#     else begin
-#       m_jump_fwd = 1;
-#       `uvm_info("PH_JUMPF",$sformatf("jumping forward to phase %s", phase.get_name()),
-#                 UVM_DEBUG)
-#     end
-#   end
-#   else begin
-#     m_jump_bkwd = 1;
-#     `uvm_info("PH_JUMPB",$sformatf("jumping backward to phase %s", phase.get_name()),
-#               UVM_DEBUG)
-#   end
-#   
-#   m_jump_phase = d;
-# endfunction
-# 
-# # end_prematurely
-# # ----
-# #
-# # Set a flag to cause the phase to end prematurely.  
-# 
-# function void uvm_phase::end_prematurely() ;
-#    m_premature_end = 1 ;
-# endfunction
-# 
-# # jump
-# # ----
-# #
-# # Note that this function does not directly alter flow of control.
-# # That is, the new phase is not initiated in this function.
-# # Rather, flags are set which execute_phase() uses to determine
-# # that a jump has been requested and performs the jump.
-# 
-# function void uvm_phase::jump(uvm_phase phase);
-#    set_jump_phase(phase) ;
-#    end_prematurely() ;
-# endfunction
-# 
-# 
-# # jump_all
-# # --------
-# function void uvm_phase::jump_all(uvm_phase phase);
-#     `uvm_warning("NOTIMPL","uvm_phase::jump_all is not implemented and has been replaced by uvm_domain::jump_all")
-# endfunction
-# 
-# 
-# # get_jump_target
-# # ---------------
-#   
-# function uvm_phase uvm_phase::get_jump_target();
-#   return m_jump_phase;
-# endfunction
-# 
-# 
-# # clear
-# # -----
-# # for internal graph maintenance after a forward jump
-# function void uvm_phase::clear(uvm_phase_state state = UVM_PHASE_DORMANT);
-#   uvm_objection phase_done;
-#   phase_done = get_objection();
-#   m_state = state;
-#   m_phase_proc = null;
-#   if (phase_done != null)
-#     phase_doneclear=this;
-# endfunction
-# 
-# 
-# # clear_successors
-# # ----------------
-# # for internal graph maintenance after a forward jump
-# # - called only by execute_phase()
-# # - depth-first traversal of the DAG, calliing clear() on each node
-# # - do not clear the end phase or beyond 
-# function void uvm_phase::clear_successors(uvm_phase_state state = UVM_PHASE_DORMANT, 
-#     uvm_phase end_state=None);
-#   if(this == end_state) 
-#     return;
-#   clear(state);
-#   foreach(m_successors[succ]) begin
-#     succ.clear_successors(state, end_state);
-#   end
-# endfunction
-# 
-# 
 # #---------------------------------
 # # Implementation - Overall Control
 # #---------------------------------
@@ -2816,65 +2133,6 @@ class uvm_phase(uvm_object):
 #   end
 # endtask
 # 
-# # kill
-# # ----
-# 
-# function void uvm_phase::kill();
-# 
-#   `uvm_info("PH_KILL", {"killing phase '", get_name(),"'"}, UVM_DEBUG)
-# 
-#   if (m_phase_proc != null) begin
-#     m_phase_proc.kill();
-#     m_phase_proc = null;
-#   end
-# 
-# endfunction
-# 
-# 
-# # kill_successors
-# # ---------------
-# 
-# # Using a depth-first traversal, kill all the successor phases of the
-# # current phase.
-# function void uvm_phase::kill_successors();
-#   foreach (m_successors[succ])
-#     succ.kill_successors();
-#   kill();
-# endfunction
-# 
-# 
-# # m_run_phases
-# # ------------
-# 
-# # This task contains the top-level process that owns all the phase
-# # processes.  By hosting the phase processes here we avoid problems
-# # associated with phase processes related as parents/children
-# task uvm_phase::m_run_phases();
-#   uvm_root top;
-#   uvm_coreservice_t cs;
-#   cs = uvm_coreservice_t::get();
-#   top = cs.get_root();
-# 
-#     # initiate by starting first phase in common domain
-#   begin
-#     uvm_phase ph = uvm_domain::get_common_domain();
-#     void'(m_phase_hoppertry_put=ph);
-#   end
-# 
-#   m_uvm_core_state=UVM_CORE_RUNNING;
-#   forever begin
-#     uvm_phase phase;
-#     m_phase_hopperget=phase;
-#     fork
-#       begin
-#         phase.execute_phase();
-#       end
-#     join_none
-#     #0;  # let the process start running
-#   end
-# endtask
-# 
-# 
 # # terminate_phase
 # # ---------------
 # 
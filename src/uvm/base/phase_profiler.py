@@ -0,0 +1,231 @@
+#------------------------------------------------------------------------------
+# Copyright 2019 Matthew Ballance
+#   All Rights Reserved Worldwide
+#
+#   Licensed under the Apache License, Version 2.0 (the
+#   "License"); you may not use this file except in
+#   compliance with the License.  You may obtain a copy of
+#   the License at
+#
+#       http:#www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in
+#   writing, software distributed under the License is
+#   distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+#   CONDITIONS OF ANY KIND, either express or implied.  See
+#   the License for the specific language governing
+#   permissions and limitations under the License.
+#------------------------------------------------------------------------------
+import json
+from time import perf_counter_ns
+from uvm.base.phase import uvm_phase
+
+#------------------------------------------------------------------------------
+#
+# CLASS: uvm_phase_profiler
+#
+# Phase execution profile collected while enabled, either by
+# <uvm_phase_profiler::enable> or with the +UVM_PHASE_PROFILE plusarg.
+# Every call of a function phase method records its wall-clock time, and
+# every task phase process records both its wall-clock and its simulation
+# time. Times are kept per phase node and component.
+#
+# The profile can be formatted as a table sorted by time, and written as a
+# Chrome trace file (chrome://tracing, Perfetto). In the trace, function
+# phases are laid out on a wall-clock timeline and task phases on a
+# simulation time timeline.
+#
+# The library implements this class beyond what is documented in IEEE 1800.2.
+#------------------------------------------------------------------------------
+
+# Internal class. Accumulated times of one phase node for one component.
+class uvm_phase_profile_entry():
+
+    def __init__(self, phase_name, comp_name, is_task):
+        self.phase_name = phase_name
+        self.comp_name = comp_name
+        self.is_task = is_task
+        self.count = 0
+        self.wall_ns = 0
+        self.sim_ns = 0
+
+
+class uvm_phase_profiler():
+
+    # Timeline ids used in the Chrome trace
+    m_wall_pid = 1
+    m_sim_pid = 2
+
+    def __init__(self, max_events=100000):
+        self.m_max_events = max_events
+        self.m_entries = {} # map<(string,string),uvm_phase_profile_entry>
+        self.m_events = []
+        self.m_dropped = 0
+        self.m_t0 = perf_counter_ns()
+
+    # Function: enable
+    #
+    # Turns profiling on, and returns the profiler. When already enabled,
+    # the profile collected so far is kept.
+    @staticmethod
+    def enable(max_events=100000):
+        if uvm_phase.m_profiler is None:
+            uvm_phase.m_profiler = uvm_phase_profiler(max_events)
+        return uvm_phase.m_profiler
+
+    # Function: disable
+    #
+    # Turns profiling off and discards the profile.
+    @staticmethod
+    def disable():
+        uvm_phase.m_profiler = None
+
+    # Function: get
+    #
+    # Returns the active profiler, or None when profiling is off.
+    @staticmethod
+    def get():
+        return uvm_phase.m_profiler
+
+    def m_get_entry(self, phase, comp, is_task):
+        key = (phase.get_full_name(), comp.get_full_name())
+        entry = self.m_entries.get(key)
+        if entry is None:
+            entry = uvm_phase_profile_entry(key[0], key[1], is_task)
+            self.m_entries[key] = entry
+        return entry
+
+    def m_add_event(self, event):
+        if len(self.m_events) < self.m_max_events:
+            self.m_events.append(event)
+        else:
+            self.m_dropped += 1
+
+    # Function: record_func
+    #
+    # Records one call of a function phase method of ~comp~ for the phase
+    # node ~phase~, between the perf_counter_ns() values ~start~ and ~end~.
+    def record_func(self, phase, comp, start, end):
+        entry = self.m_get_entry(phase, comp, False)
+        entry.count += 1
+        entry.wall_ns += end - start
+        self.m_add_event({
+            "name": entry.comp_name,
+            "cat": entry.phase_name,
+            "ph": "X",
+            "ts": (start - self.m_t0) / 1000.0,
+            "dur": (end - start) / 1000.0,
+            "pid": uvm_phase_profiler.m_wall_pid,
+            "tid": entry.phase_name})
+
+    # Function: record_task
+    #
+    # Records one task phase process of ~comp~ for the phase node ~phase~,
+    # that ran from ~start~ to ~end~ (perf_counter_ns() values) and from
+    # ~sim_start~ to ~sim_end~ (simulation time in ns).
+    def record_task(self, phase, comp, start, end, sim_start, sim_end):
+        entry = self.m_get_entry(phase, comp, True)
+        entry.count += 1
+        entry.wall_ns += end - start
+        entry.sim_ns += sim_end - sim_start
+        self.m_add_event({
+            "name": entry.comp_name,
+            "cat": entry.phase_name,
+            "ph": "X",
+            "ts": sim_start / 1000.0,
+            "dur": (sim_end - sim_start) / 1000.0,
+            "pid": uvm_phase_profiler.m_sim_pid,
+            "tid": entry.phase_name,
+            "args": {"wall_us": (end - start) / 1000.0}})
+
+    def clear(self):
+        self.m_entries.clear()
+        self.m_events = []
+        self.m_dropped = 0
+
+    # Function: to_dict
+    #
+    # Returns the profile as plain Python data: per-phase totals and
+    # per-component entries, both sorted by decreasing wall-clock time.
+    def to_dict(self):
+        phases = {}
+        for entry in self.m_entries.values():
+            total = phases.get(entry.phase_name)
+            if total is None:
+                total = {
+                    "phase": entry.phase_name,
+                    "task": entry.is_task,
+                    "components": 0,
+                    "wall_ns": 0,
+                    "sim_ns": 0}
+                phases[entry.phase_name] = total
+            total["components"] += 1
+            total["wall_ns"] += entry.wall_ns
+            total["sim_ns"] += entry.sim_ns
+
+        entries = []
+        for entry in sorted(self.m_entries.values(), key=lambda e: e.wall_ns, reverse=True):
+            entries.append({
+                "phase": entry.phase_name,
+                "component": entry.comp_name,
+                "task": entry.is_task,
+                "count": entry.count,
+                "wall_ns": entry.wall_ns,
+                "sim_ns": entry.sim_ns})
+
+        return {
+            "phases": sorted(phases.values(), key=lambda p: p["wall_ns"], reverse=True),
+            "components": entries}
+
+    # Function: convert2string
+    #
+    # Formats the profile as a table, listing at most ~max_rows~ components,
+    # or as JSON when ~fmt~ is "json".
+    def convert2string(self, fmt="table", max_rows=50):
+        data = self.to_dict()
+
+        if fmt == "json":
+            return json.dumps(data, indent=2)
+
+        qs = []
+        qs.append("\n#### Phase Profile\n\n")
+        qs.append("  %-32s %6s %10s %12s %14s\n" % (
+            "Phase", "Kind", "Comps", "Wall(ms)", "Sim(ns)"))
+        for p in data["phases"]:
+            qs.append("  %-32s %6s %10d %12.3f %14s\n" % (
+                p["phase"], "task" if p["task"] else "func", p["components"],
+                p["wall_ns"]/1000000.0, str(p["sim_ns"]) if p["task"] else "-"))
+
+        qs.append("\n  %-32s %-40s %8s %12s %14s\n" % (
+            "Phase", "Component", "Count", "Wall(ms)", "Sim(ns)"))
+        for c in data["components"][:max_rows]:
+            qs.append("  %-32s %-40s %8d %12.3f %14s\n" % (
+                c["phase"], c["component"], c["count"], c["wall_ns"]/1000000.0,
+                str(c["sim_ns"]) if c["task"] else "-"))
+        if len(data["components"]) > max_rows:
+            qs.append("  ... %0d more\n" % (len(data["components"]) - max_rows))
+
+        qs.append("\n####\n\n")
+        return "".join(qs)
+
+    # Function: get_trace
+    #
+    # Returns the profile in Chrome trace event format.
+    def get_trace(self):
+        events = [
+            {"name": "process_name", "ph": "M", "pid": uvm_phase_profiler.m_wall_pid,
+                "args": {"name": "function phases (wall clock)"}},
+            {"name": "process_name", "ph": "M", "pid": uvm_phase_profiler.m_sim_pid,
+                "args": {"name": "task phases (simulation time)"}}]
+        events.extend(self.m_events)
+        return {
+            "traceEvents": events,
+            "otherData": {"dropped_events": self.m_dropped},
+            "profile": self.to_dict()}
+
+    # Function: write
+    #
+    # Writes the Chrome trace to the file ~filename~.
+    def write(self, filename):
+        with open(filename, "w") as fp:
+            json.dump(self.get_trace(), fp)
@@ -0,0 +1,136 @@
+#------------------------------------------------------------------------------
+# Copyright 2019 Matthew Ballance
+#   All Rights Reserved Worldwide
+#
+#   Licensed under the Apache License, Version 2.0 (the
+#   "License"); you may not use this file except in
+#   compliance with the License.  You may obtain a copy of
+#   the License at
+#
+#       http:#www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in
+#   writing, software distributed under the License is
+#   distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+#   CONDITIONS OF ANY KIND, either express or implied.  See
+#   the License for the specific language governing
+#   permissions and limitations under the License.
+#------------------------------------------------------------------------------
+from cocotb.triggers import Event
+from uvm.base.object_globals import uvm_phase_state
+
+#------------------------------------------------------------------------------
+#
+# CLASS- uvm_phase_sync_barrier
+#
+# Shared by all phase nodes that are linked, directly or through other
+# nodes, by <uvm_phase::sync> relationships. The barrier counts how many of
+# its members have reached SYNCING (or any later state). A member leaves
+# SYNCING only once all of them have, so advancing a sync group costs one
+# count update per member rather than a scan of every sync relationship.
+#
+# The pairwise relationships are kept in <uvm_phase::m_sync>; the barrier
+# is rebuilt from them when <uvm_phase::unsync> breaks a group apart.
+#------------------------------------------------------------------------------
+class uvm_phase_sync_barrier():
+
+    def __init__(self):
+        self.m_members = [] # nodes sharing this barrier
+        self.m_ready = 0    # members at or past SYNCING
+        self.m_ev = None
+
+    @staticmethod
+    def m_is_ready(state):
+        return state.value >= uvm_phase_state.UVM_PHASE_SYNCING.value
+
+    def m_add(self, node):
+        node.m_sync_barrier = self
+        self.m_members.append(node)
+        if uvm_phase_sync_barrier.m_is_ready(node.m_state):
+            self.m_ready += 1
+
+    # Function- m_state_changed
+    #
+    # Called by <uvm_phase::m_set_state> for every member
+    def m_state_changed(self, prev_state, state):
+        was_ready = uvm_phase_sync_barrier.m_is_ready(prev_state)
+        is_ready = uvm_phase_sync_barrier.m_is_ready(state)
+        if was_ready != is_ready:
+            if is_ready:
+                self.m_ready += 1
+                if self.is_released():
+                    self.m_fire()
+            else:
+                self.m_ready -= 1
+
+    def is_released(self):
+        return self.m_ready == len(self.m_members)
+
+    def m_fire(self):
+        ev = self.m_ev
+        if ev is not None:
+            self.m_ev = None
+            ev.set()
+
+    # Function- m_wait
+    #
+    # Returns a trigger that fires when the barrier is released or split.
+    # Waiters must re-check their node's barrier afterwards.
+    def m_wait(self):
+        if self.m_ev is None:
+            self.m_ev = Event()
+        return self.m_ev.wait()
+
+    # Function- m_merge
+    #
+    # Makes ~a~ and ~b~ share one barrier
+    @staticmethod
+    def m_merge(a, b):
+        ba = a.m_sync_barrier
+        bb = b.m_sync_barrier
+        if ba is None and bb is None:
+            ba = uvm_phase_sync_barrier()
+            ba.m_add(a)
+            ba.m_add(b)
+        elif ba is None:
+            bb.m_add(a)
+        elif bb is None:
+            ba.m_add(b)
+        elif ba is not bb:
+            if len(ba.m_members) < len(bb.m_members):
+                (ba, bb) = (bb, ba)
+            for node in bb.m_members:
+                ba.m_add(node)
+            bb.m_members = []
+            bb.m_ready = 0
+            bb.m_fire()
+        else:
+            return
+        if ba.is_released():
+            ba.m_fire()
+
+    # Function- m_split
+    #
+    # Rebuilds the barriers of this group from the pairwise relationships of
+    # its members, after one of them was removed.
+    def m_split(self):
+        members = self.m_members
+        self.m_members = []
+        self.m_ready = 0
+        for node in members:
+            node.m_sync_barrier = None
+
+        for node in members:
+            if node.m_sync_barrier is not None or len(node.m_sync) == 0:
+                continue
+            barrier = uvm_phase_sync_barrier()
+            barrier.m_add(node)
+            i = 0
+            while i < len(barrier.m_members):
+                for peer in barrier.m_members[i].m_sync:
+                    if peer.m_sync_barrier is None:
+                        barrier.m_add(peer)
+                i += 1
+
+        # Let waiters re-evaluate against their new barrier
+        self.m_fire()
@@ -0,0 +1,235 @@
+#------------------------------------------------------------------------------
+# Copyright 2019 Matthew Ballance
+#   All Rights Reserved Worldwide
+#
+#   Licensed under the Apache License, Version 2.0 (the
+#   "License"); you may not use this file except in
+#   compliance with the License.  You may obtain a copy of
+#   the License at
+#
+#       http:#www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in
+#   writing, software distributed under the License is
+#   distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR
+#   CONDITIONS OF ANY KIND, either express or implied.  See
+#   the License for the specific language governing
+#   permissions and limitations under the License.
+#------------------------------------------------------------------------------
+
+#------------------------------------------------------------------------------
+#
+# CLASS- uvm_phase_topology
+#
+# Compiled form of one connected phase graph (domains, schedules, nodes and
+# terminals linked through m_predecessors/m_successors). Nodes are numbered
+# in topological order and every node carries its transitive predecessors
+# and successors as integer bitsets, so that <uvm_phase::find>,
+# <uvm_phase::is_before> and related queries reduce to a few bit operations
+# instead of recursive graph searches.
+#
+# A topology is built on first use after the graph was last modified (see
+# <uvm_phase::m_graph_version>) and is shared by all nodes of the graph.
+#------------------------------------------------------------------------------
+class uvm_phase_topology():
+
+    def __init__(self, root, version):
+        self.m_version = version
+        self.m_nodes = uvm_phase_topology.m_sort(root)
+        self.m_index = {}
+        for i in range(len(self.m_nodes)):
+            self.m_index[self.m_nodes[i]] = i
+
+        n = len(self.m_nodes)
+        self.m_preds = [None]*n # list of predecessor indices, per node
+        self.m_succs = [None]*n # list of successor indices, per node
+        self.m_schedules = [None]*n
+        self.m_domains = [None]*n
+        self.m_match = {} # map<uvm_phase,int> nodes that satisfy is()
+        self.m_names = {} # map<string,int> nodes with a given name
+
+        for i in range(n):
+            node = self.m_nodes[i]
+            self.m_preds[i] = [self.m_index[p] for p in node.m_predecessors.keys()]
+            self.m_succs[i] = [self.m_index[s] for s in node.m_successors.keys()]
+            self.m_schedules[i] = node.get_schedule()
+            self.m_domains[i] = node.get_domain()
+
+            bit = 1 << i
+            self.m_match[node] = self.m_match.get(node, 0) | bit
+            if node.m_imp is not None:
+                self.m_match[node.m_imp] = self.m_match.get(node.m_imp, 0) | bit
+            name = node.get_name()
+            self.m_names[name] = self.m_names.get(name, 0) | bit
+
+        # Unscoped reachability, used by is_before/is_after and by searches
+        # with stay_in_scope=0
+        self.m_reach = self.m_build_reach(-1)
+
+        # Reachability restricted to the scope of a given node, keyed by
+        # the (schedule, domain) pair that defines the scope
+        self.m_scoped_reach = {}
+
+        # Nodes cleared by a jump, keyed by (start, end) index pairs
+        self.m_clear_sets = {}
+
+    # Function- m_sort
+    #
+    # Collects every node connected to ~root~ and returns them in
+    # topological order. Among nodes that are ready at the same time the
+    # order of discovery is kept, so the result is deterministic.
+    @staticmethod
+    def m_sort(root):
+        nodes = [root]
+        seen = set(nodes)
+        i = 0
+        while i < len(nodes):
+            node = nodes[i]
+            for adj in node.m_predecessors.keys():
+                if adj not in seen:
+                    seen.add(adj)
+                    nodes.append(adj)
+            for adj in node.m_successors.keys():
+                if adj not in seen:
+                    seen.add(adj)
+                    nodes.append(adj)
+            i += 1
+
+        pending = {}
+        ready = []
+        for node in nodes:
+            pending[node] = len(node.m_predecessors)
+            if pending[node] == 0:
+                ready.append(node)
+
+        order = []
+        i = 0
+        while i < len(ready):
+            node = ready[i]
+            order.append(node)
+            for succ in node.m_successors.keys():
+                pending[succ] -= 1
+                if pending[succ] == 0:
+                    ready.append(succ)
+            i += 1
+
+        if len(order) != len(nodes):
+            # A cycle; keep the remaining nodes so that lookups still work
+            placed = set(order)
+            for node in nodes:
+                if node not in placed:
+                    order.append(node)
+
+        return order
+
+    # Function- m_build_reach
+    #
+    # Returns (ancestors, descendants) bitset lists. When ~scope~ is not -1,
+    # only nodes whose bit is set in ~scope~ are entered, mirroring the
+    # stay_in_scope filter of the recursive SV search.
+    def m_build_reach(self, scope):
+        n = len(self.m_nodes)
+        anc = [0]*n
+        desc = [0]*n
+
+        for i in range(n):
+            bits = 0
+            for p in self.m_preds[i]:
+                if (scope >> p) & 1:
+                    bits |= (1 << p) | anc[p]
+            anc[i] = bits
+
+        for i in range(n-1, -1, -1):
+            bits = 0
+            for s in self.m_succs[i]:
+                if (scope >> s) & 1:
+                    bits |= (1 << s) | desc[s]
+            desc[i] = bits
+
+        return (anc, desc)
+
+    def m_get_reach(self, idx, stay_in_scope):
+        if not stay_in_scope:
+            return self.m_reach
+
+        key = (self.m_schedules[idx], self.m_domains[idx])
+        reach = self.m_scoped_reach.get(key)
+        if reach is None:
+            scope = 0
+            for i in range(len(self.m_nodes)):
+                if self.m_schedules[i] is key[0] or self.m_domains[i] is key[1]:
+                    scope |= (1 << i)
+            reach = self.m_build_reach(scope)
+            self.m_scoped_reach[key] = reach
+        return reach
+
+    # Function- find_predecessor
+    #
+    # Returns the nearest predecessor of ~node~ whose bit is set in
+    # ~candidates~, or None.
+    def find_predecessor(self, node, candidates, stay_in_scope=True):
+        idx = self.m_index[node]
+        hits = self.m_get_reach(idx, stay_in_scope)[0][idx] & candidates
+        if hits == 0:
+            return None
+        # Ancestors have lower indices; the nearest has the highest
+        return self.m_nodes[hits.bit_length()-1]
+
+    # Function- find_successor
+    #
+    # Returns the nearest successor of ~node~ whose bit is set in
+    # ~candidates~, or None.
+    def find_successor(self, node, candidates, stay_in_scope=True):
+        idx = self.m_index[node]
+        hits = self.m_get_reach(idx, stay_in_scope)[1][idx] & candidates
+        if hits == 0:
+            return None
+        return self.m_nodes[(hits & -hits).bit_length()-1]
+
+    def get_match(self, phase):
+        return self.m_match.get(phase, 0)
+
+    def get_name_match(self, name):
+        return self.m_names.get(name, 0)
+
+    def get_index(self, node):
+        return self.m_index[node]
+
+    def get_nodes(self):
+        return self.m_nodes
+
+    # Function- get_successors
+    #
+    # Returns all transitive successors of ~node~, in topological order.
+    def get_successors(self, node):
+        return self.get_clear_set(node, None)[1:]
+
+    # Function- get_clear_set
+    #
+    # Returns ~node~ followed by every successor that can be reached from it
+    # without passing through ~end~, in topological order. These are the
+    # nodes that <uvm_phase::clear_successors> resets. The sets are computed
+    # once per (node, end) pair, so repeated jumps between the same phases
+    # cost only the size of the set.
+    def get_clear_set(self, node, end):
+        start = self.m_index[node]
+        stop = -1 if end is None else self.m_index.get(end, -1)
+        ret = self.m_clear_sets.get((start, stop))
+        if ret is None:
+            if stop == -1:
+                bits = self.m_reach[1][start]
+            else:
+                bits = 0
+                pending = [start]
+                while len(pending) > 0:
+                    i = pending.pop()
+                    for s in self.m_succs[i]:
+                        if s != stop and not (bits >> s) & 1:
+                            bits |= (1 << s)
+                            pending.append(s)
+            ret = [node]
+            for i in range(start+1, len(self.m_nodes)):
+                if (bits >> i) & 1:
+                    ret.append(self.m_nodes[i])
+            self.m_clear_sets[(start, stop)] = ret
+        return ret
@@ -35,11 +35,12 @@ from uvm.base.component import uvm_component
 from uvm.base.coreservice import uvm_coreservice_t
 from uvm.base.factory import uvm_factory
 from uvm.base.globals import uvm_report_fatal, uvm_report_warning,\
-    uvm_report_info
+    uvm_report_info, uvm_report_error, m_uvm_flush_deferred_init, uvm_is_match
 from uvm.base.object_globals import m_uvm_core_state, uvm_core_state, UVM_NONE, \
     UVM_LOW
 from uvm.base.objection import uvm_objection
 from uvm.base.phase import uvm_phase
+from uvm.base.phase_profiler import uvm_phase_profiler
 from uvm.base.run_test_callback import uvm_run_test_callback
 from uvm.util.format import sformatf, strcat
 from uvm.base.cmdline_processor import uvm_cmdline_processor
@@ -157,9 +158,18 @@ class uvm_root(uvm_component):
 
         uvm_run_test_callback.m_do_pre_run_test()
 
+        # Register any types whose classes were imported after uvm_init
+        m_uvm_flush_deferred_init()
+
         factory = uvm_factory.get()
         m_uvm_core_state = uvm_core_state.PRE_RUN
 
+        if self.m_get_option_plusarg("+UVM_FACTORY_STATS") is not None:
+            factory.set_stats_enabled(True)
+
+        if self.m_get_option_plusarg("+UVM_PHASE_PROFILE") is not None:
+            uvm_phase_profiler.enable()
+
         testname_plusarg = False
 
         # Set up the process that decouples the thread that drops objections from
@@ -251,6 +261,9 @@ class uvm_root(uvm_component):
     
         # clean up after ourselves
         phase_runner_proc.kill()
+        uvm_phase.m_stop_drivers()
+
+        self.m_report_phase_profile()
 
         print("TODO: uvm_report_server")
 #        l_rs = uvm_report_server.get_server();
@@ -285,6 +298,9 @@ class uvm_root(uvm_component):
 
         m_uvm_core_state = uvm_core_state.PRE_ABORT
 
+        # Keep the provenance of the most recently created objects
+        uvm_factory.get().print_trace()
+
         self.m_do_pre_abort()
 
         uvm_run_test_callback.m_do_pre_abort()
@@ -426,18 +442,12 @@ class uvm_root(uvm_component):
 
     # PRIVATE members
     def m_find_all_recurse(self, comp_match, comps, comp=None):
-        # TODO: seems a non-Pythonic way of doing things
-        name = ""
-
-        if comp.get_first_child(name):
-           while True: 
-               self.m_find_all_recurse(comp_match, comps, comp.get_child(name))
-               
-               if not comp.get_next_child(name):
-                   break
-               
-        if self.uvm_is_match(comp_match, comp.get_full_name()) and comp.get_name() != "": # uvm_top
-            comps.append(comp)
+        # Children are matched before their parent, as in the recursive SV
+        # implementation. The postorder list is built without recursion, so
+        # arbitrarily deep hierarchies are safe.
+        for c in comp.m_get_postorder():
+            if c.get_name() != "" and uvm_is_match(comp_match, c.get_full_name()): # uvm_top
+                comps.append(c)
 
     def __init__ (self):
         super().__init__("__top__", None)
@@ -491,12 +501,83 @@ class uvm_root(uvm_component):
         # TODO: 
 #     extern local function void m_do_verbosity_settings();
 #     extern local function void m_do_timeout_settings();
-#     extern local function void m_do_factory_settings();
-#     extern local function void m_process_inst_override(string ovr);
-#     extern local function void m_process_type_override(string ovr);
 #     extern local function void m_do_config_settings();
 #     extern local function void m_do_max_quit_settings();
     
+    # m_do_factory_settings
+    # ---------------------
+    #
+    # Collects every +uvm_set_inst_override, +uvm_set_type_override and
+    # +UVM_FACTORY_OVERRIDE_FILE setting and hands them to the factory as
+    # one batch, so that the override index is only rebuilt once.
+    def m_do_factory_settings(self):
+        factory = uvm_factory.get()
+        type_overrides = []
+        inst_overrides = []
+        args = []
+
+        for prefix in ("+UVM_FACTORY_OVERRIDE_FILE=", "+uvm_factory_override_file="):
+            self.clp.get_arg_values(prefix, args)
+            for filename in args:
+                uvm_report_info("UVM_CMDLINE_PROC", "Applying factory overrides from file: " +
+                    filename, UVM_NONE)
+                factory.load_overrides(filename)
+
+        for prefix in ("+UVM_SET_INST_OVERRIDE=", "+uvm_set_inst_override="):
+            self.clp.get_arg_values(prefix, args)
+            for ovr in args:
+                self.m_process_inst_override(ovr, inst_overrides)
+
+        for prefix in ("+UVM_SET_TYPE_OVERRIDE=", "+uvm_set_type_override="):
+            self.clp.get_arg_values(prefix, args)
+            for ovr in args:
+                self.m_process_type_override(ovr, type_overrides)
+
+        if len(type_overrides) > 0 or len(inst_overrides) > 0:
+            factory.set_overrides_by_name(type_overrides, inst_overrides)
+
+    # m_process_inst_override
+    # -----------------------
+
+    def m_process_inst_override(self, ovr, inst_overrides):
+        split_val = ovr.split(",")
+
+        if len(split_val) != 3:
+            uvm_report_error("UVM_CMDLINE_PROC", "Invalid setting for +uvm_set_inst_override=" + ovr +
+                ", setting must specify <requested_type>,<override_type>,<instance_path>", UVM_NONE)
+            return
+
+        uvm_report_info("INSTOVR", "Applying instance override from the command line: +uvm_set_inst_override=" +
+            ovr, UVM_NONE)
+        inst_overrides.append((split_val[0], split_val[1], split_val[2]))
+
+    # m_process_type_override
+    # -----------------------
+
+    def m_process_type_override(self, ovr, type_overrides):
+        split_val = ovr.split(",")
+        replace = True
+
+        if len(split_val) > 3 or len(split_val) < 2:
+            uvm_report_error("UVM_CMDLINE_PROC", "Invalid setting for +uvm_set_type_override=" + ovr +
+                ", setting must specify <requested_type>,<override_type>[,<replace>]", UVM_NONE)
+            return
+
+        # Replace arg is optional. If set, must be 0 or 1
+        if len(split_val) == 3:
+            if split_val[2] == "0":
+                replace = False
+            elif split_val[2] == "1":
+                replace = True
+            else:
+                uvm_report_error("UVM_CMDLINE_PROC", "Invalid replace arg for +uvm_set_type_override=" + ovr +
+                    " value must be 0 or 1", UVM_NONE)
+                return
+
+        uvm_report_info("UVM_CMDLINE_PROC", "Applying type override from the command line: +uvm_set_type_override=" +
+            ovr, UVM_NONE)
+        type_overrides.append((split_val[0], split_val[1], replace))
+
     def m_do_dump_args(self):
         dump_args = []
         all_args = []
@@ -507,6 +588,21 @@ class uvm_root(uvm_component):
             for i,arg in enumerate(all_args):
                 uvm_report_info("DUMPARGS", sformatf("idx=%0d arg=[%s]",i,arg), UVM_NONE)
 
+    # Function- m_get_option_plusarg
+    #
+    # Returns the value of the plusarg ~name~, given either alone or as
+    # ~name~=<value>. Returns "" when it is given alone and None when it is
+    # not given. Plusargs that only start with ~name~ do not match.
+    def m_get_option_plusarg(self, name):
+        values = []
+        self.clp.get_arg_values(name, values)
+        for value in values:
+            if value == "":
+                return ""
+            if value[0] == "=":
+                return value[1:]
+        return None
+
     # TODO:
 #     extern local function void m_process_config(string cfg, bit is_int);
 #     extern local function void m_process_default_sequence(string cfg);
@@ -581,6 +677,33 @@ class uvm_root(uvm_component):
 
     m_relnotes_done = False
 
+    def report_phase(self, phase):
+        factory = uvm_factory.get()
+
+        if factory.get_stats() is not None:
+            fmt = self.m_get_option_plusarg("+UVM_FACTORY_STATS")
+            if fmt is None or fmt == "":
+                fmt = "table"
+            uvm_report_info("UVM/FACTORY/STATS", factory.report_stats(fmt), UVM_NONE)
+
+    # Function- m_report_phase_profile
+    #
+    # Once all phases are done, reports the phase profile, if enabled, and
+    # writes it as a Chrome trace to the file given by
+    # +UVM_PHASE_PROFILE=<file> (uvm_phase_profile.json by default).
+    def m_report_phase_profile(self):
+        profiler = uvm_phase_profiler.get()
+        if profiler is None:
+            return
+
+        filename = self.m_get_option_plusarg("+UVM_PHASE_PROFILE")
+        if filename is None or filename == "":
+            filename = "uvm_phase_profile.json"
+
+        uvm_report_info("UVM/PHASE/PROFILE", profiler.convert2string(), UVM_NONE)
+        profiler.write(filename)
+        uvm_report_info("UVM/PHASE/PROFILE", "Phase profile written to " + filename, UVM_NONE)
+
     def end_of_elaboration_phase(self, phase):
         # TODO:
 #         uvm_component_proxy p = new("proxy");
@@ -588,7 +711,10 @@ class uvm_root(uvm_component):
 #         uvm_coreservice_t cs = uvm_coreservice_t::get();
 #         uvm_visitor#(uvm_component) v = cs.get_component_visitor();
 #         adapter.accept(this, v, p);
-        pass
+
+        # Overrides are not expected to change after elaboration, so let the
+        # factory compile its lookups. A later override transparently thaws it.
+        uvm_coreservice_t.get().get_factory().freeze()
 
 # TODO:
 #-----------------------------------------------------------------------------
@@ -720,76 +846,6 @@ class uvm_root(uvm_component):
 # endfunction
 # 
 # 
-# # m_do_factory_settings
-# # ---------------------
-# 
-# function void uvm_root::m_do_factory_settings();
-#     string args[$];
-# 
-#     void'(clp.get_arg_matches("/^\\+(UVM_SET_INST_OVERRIDE|uvm_set_inst_override)=/",args));
-#     foreach(args[i]) begin
-#         m_process_inst_override(args[i].substr(23, args[i].len()-1));
-#     end
-#     void'(clp.get_arg_matches("/^\\+(UVM_SET_TYPE_OVERRIDE|uvm_set_type_override)=/",args));
-#     foreach(args[i]) begin
-#         m_process_type_override(args[i].substr(23, args[i].len()-1));
-#     end
-# endfunction
-# 
-# 
-# # m_process_inst_override
-# # -----------------------
-# 
-# function void uvm_root::m_process_inst_override(string ovr);
-#     string split_val[$];
-#     uvm_coreservice_t cs = uvm_coreservice_t::get();
-#     uvm_factory factory=cs.get_factory();
-# 
-#     uvm_split_string(ovr, ",", split_val);
-# 
-#     if(split_val.size() != 3 ) begin
-#         uvm_report_error("UVM_CMDLINE_PROC", {"Invalid setting for +uvm_set_inst_override=", ovr,
-#                 ", setting must specify <requested_type>,<override_type>,<instance_path>"}, UVM_NONE);
-#         return;
-#     end
-# 
-#     uvm_report_info("INSTOVR", {"Applying instance override from the command line: +uvm_set_inst_override=", ovr}, UVM_NONE);
-#     factory.set_inst_override_by_name(split_val[0], split_val[1], split_val[2]);
-# endfunction
-# 
-# 
-# # m_process_type_override
-# # -----------------------
-# 
-# function void uvm_root::m_process_type_override(string ovr);
-#     string split_val[$];
-#     int replace=1;
-#     uvm_coreservice_t cs = uvm_coreservice_t::get();
-#     uvm_factory factory=cs.get_factory();
-# 
-#     uvm_split_string(ovr, ",", split_val);
-# 
-#     if(split_val.size() > 3  or  split_val.size() < 2) begin
-#         uvm_report_error("UVM_CMDLINE_PROC", {"Invalid setting for +uvm_set_type_override=", ovr,
-#                 ", setting must specify <requested_type>,<override_type>[,<replace>]"}, UVM_NONE);
-#         return;
-#     end
-# 
-#     # Replace arg is optional. If set, must be 0 or 1
-#     if(split_val.size() == 3) begin
-#         if(split_val[2]=="0") replace =  0;
-#         else if (split_val[2] == "1") replace = 1;
-#         else begin
-#             uvm_report_error("UVM_CMDLINE_PROC", {"Invalid replace arg for +uvm_set_type_override=", ovr ," value must be 0 or 1"}, UVM_NONE);
-#             return;
-#         end
-#     end
-# 
-#     uvm_report_info("UVM_CMDLINE_PROC", {"Applying type override from the command line: +uvm_set_type_override=", ovr}, UVM_NONE);
-#     factory.set_type_override_by_name(split_val[0], split_val[1], replace);
-# endfunction
-# 
-# 
 # # m_process_config
 # # ----------------
 # 
@@ -23,7 +23,6 @@
 #   permissions and limitations under the License.
 #----------------------------------------------------------------------
 from uvm.base.task_phase import uvm_task_phase
-import cocotb
 
 # Title -- NODOCS -- UVM Run-Time Phases
 # 
@@ -52,10 +51,10 @@ import cocotb
 # @uvm-ieee 1800.2-2017 auto 9.8.2.1
 class uvm_pre_reset_phase (uvm_task_phase):
     
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.pre_reset_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.pre_reset_phase(phase)
 
+    m_phase_method = "pre_reset_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_pre_reset_phase")
 
@@ -72,10 +71,10 @@ class uvm_pre_reset_phase (uvm_task_phase):
 
 # @uvm-ieee 1800.2-2017 auto 9.8.2.2
 class uvm_reset_phase (uvm_task_phase):
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.reset_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.reset_phase(phase)
 
+    m_phase_method = "reset_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_reset_phase")
 
@@ -93,10 +92,10 @@ class uvm_reset_phase (uvm_task_phase):
 
 # @uvm-ieee 1800.2-2017 auto 9.8.2.3
 class uvm_post_reset_phase (uvm_task_phase):
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.post_reset_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.post_reset_phase(phase)
 
+    m_phase_method = "post_reset_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_post_reset_phase")
 
@@ -113,10 +112,10 @@ class uvm_post_reset_phase (uvm_task_phase):
 
 # @uvm-ieee 1800.2-2017 auto 9.8.2.4
 class uvm_pre_configure_phase (uvm_task_phase):
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.pre_configure_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.pre_configure_phase(phase)
 
+    m_phase_method = "pre_configure_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_pre_configure_phase")
 
@@ -133,10 +132,10 @@ class uvm_pre_configure_phase (uvm_task_phase):
 
 # @uvm-ieee 1800.2-2017 auto 9.8.2.5
 class uvm_configure_phase(uvm_task_phase):
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.configure_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.configure_phase(phase)
 
+    m_phase_method = "configure_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_configure_phase")
 
@@ -154,10 +153,10 @@ class uvm_configure_phase(uvm_task_phase):
 
 # @uvm-ieee 1800.2-2017 auto 9.8.2.6
 class uvm_post_configure_phase (uvm_task_phase):
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.post_configure_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.post_configure_phase(phase)
 
+    m_phase_method = "post_configure_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_post_configure_phase")
 
@@ -174,10 +173,10 @@ class uvm_post_configure_phase (uvm_task_phase):
 
 # @uvm-ieee 1800.2-2017 auto 9.8.2.7
 class uvm_pre_main_phase (uvm_task_phase):
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.pre_main_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.pre_main_phase(phase)
 
+    m_phase_method = "pre_main_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_pre_main_phase")
 
@@ -195,10 +194,10 @@ class uvm_pre_main_phase (uvm_task_phase):
 
 # @uvm-ieee 1800.2-2017 auto 9.8.2.8
 class uvm_main_phase (uvm_task_phase):
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.main_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.main_phase(phase)
 
+    m_phase_method = "main_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_main_phase")
 
@@ -215,10 +214,10 @@ class uvm_main_phase (uvm_task_phase):
 
 # @uvm-ieee 1800.2-2017 auto 9.8.2.9
 class uvm_post_main_phase (uvm_task_phase):
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.post_main_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.post_main_phase(phase)
 
+    m_phase_method = "post_main_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_post_main_phase")
 
@@ -235,10 +234,10 @@ class uvm_post_main_phase (uvm_task_phase):
 
 # @uvm-ieee 1800.2-2017 auto 9.8.2.10
 class uvm_pre_shutdown_phase (uvm_task_phase):
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.pre_shutdown_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.pre_shutdown_phase(phase)
 
+    m_phase_method = "pre_shutdown_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_pre_shutdown_phase")
 
@@ -255,10 +254,10 @@ class uvm_pre_shutdown_phase (uvm_task_phase):
 
 # @uvm-ieee 1800.2-2017 auto 9.8.2.11
 class uvm_shutdown_phase (uvm_task_phase):
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.shutdown_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.shutdown_phase(phase)
 
+    m_phase_method = "shutdown_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_shutdown_phase")
 
@@ -276,10 +275,10 @@ class uvm_shutdown_phase (uvm_task_phase):
 
 # @uvm-ieee 1800.2-2017 auto 9.8.2.12
 class uvm_post_shutdown_phase (uvm_task_phase):
-    @cocotb.coroutine
-    def exec_task(self, comp, phase):
-        yield comp.post_shutdown_phase(phase)
+    async def exec_task(self, comp, phase):
+        await comp.post_shutdown_phase(phase)
 
+    m_phase_method = "post_shutdown_phase"
     m_inst = None
 #   `uvm_type_name_decl("uvm_post_shutdown_phase")
 
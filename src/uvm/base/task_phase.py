@@ -21,9 +21,10 @@
 #   the License for the specific language governing
 #   permissions and limitations under the License.
 #----------------------------------------------------------------------
+from time import perf_counter_ns
 from uvm.base.object_globals import uvm_phase_type, uvm_phase_state
 from uvm.base.phase import uvm_phase
-import cocotb
+from cocotb.utils import get_sim_time
 
 #------------------------------------------------------------------------------
 #
@@ -68,17 +69,17 @@ class uvm_task_phase (uvm_phase):
 
     # @uvm-ieee 1800.2-2017 auto 9.6.2.2
     def traverse(self, comp, phase, state):
-        phase.m_num_procs_not_yet_returned = 0
         self.m_traverse(comp, phase, state)
 
     def m_traverse(self, comp, phase, state):
+        for c in comp.m_get_postorder():
+            self.m_traverse_comp(c, phase, state)
+
+    def m_traverse_comp(self, comp, phase, state):
         from uvm.base.domain import uvm_domain
         phase_domain = phase.get_domain()
         comp_domain = comp.get_domain()
         seqr = None
-
-        for cn in comp.m_children.keys():
-            self.m_traverse(comp.m_children[cn], phase, state)    
     
         if self.m_phase_trace:
             print("TODO: `uvm_info")
@@ -90,7 +91,8 @@ class uvm_task_phase (uvm_phase):
             if state == uvm_phase_state.UVM_PHASE_STARTED: 
                 comp.m_current_phase = phase
                 comp.m_apply_verbosity_settings(phase)
-                comp.phase_started(phase)
+                if not comp.m_is_noop_phase_method("phase_started"):
+                    comp.phase_started(phase)
     
                 print("TODO: check if component is a sequencer")
     #            if ($cast(seqr, comp))
@@ -99,34 +101,49 @@ class uvm_task_phase (uvm_phase):
                 ph = self
                 if self in comp.m_phase_imps.keys():
                     ph = comp.m_phase_imps[self]
-                ph.execute(comp, phase)
+                # Task phases fork a process only for real implementations
+                if not comp.m_is_noop_phase_method(ph.m_phase_method):
+                    ph.execute(comp, phase)
             elif state == uvm_phase_state.UVM_PHASE_READY_TO_END: 
-                comp.phase_ready_to_end(phase)
+                if not comp.m_is_noop_phase_method("phase_ready_to_end"):
+                    comp.phase_ready_to_end(phase)
             elif state == uvm_phase_state.UVM_PHASE_ENDED: 
                 print("TODO: check if component is a sequencer")
     #          if ($cast(seqr, comp))
     #            seqr.stop_phase_sequence(phase);
-                comp.phase_ended(phase)
+                if not comp.m_is_noop_phase_method("phase_ended"):
+                    comp.phase_ended(phase)
                 comp.m_current_phase = None
             else:
                 print("TODO: uvm_fatal")
     #          `uvm_fatal("PH_BADEXEC","task phase traverse internal error")
 
-    @cocotb.coroutine
-    def forked_task(self, comp, phase):
+    # The phase method is awaited rather than yielded, so that it runs
+    # in the process forked by <execute> and is stopped when that process
+    # is killed.
+    async def forked_task(self, comp, phase):
         # reseed this process for random stability
         # TODO: reseed
 #        proc = process::self();
 #        proc.srandom(uvm_create_random_seed(phase.get_type_name(), comp.get_full_name()));
 
-        phase.m_num_procs_not_yet_returned += 1
-
-        yield self.exec_task(comp,phase)
-
-        phase.m_num_procs_not_yet_returned -= 1
+        profiler = uvm_phase.m_profiler
+        if profiler is None:
+            await self.exec_task(comp,phase)
+        else:
+            start = perf_counter_ns()
+            sim_start = get_sim_time("ns")
+            try:
+                await self.exec_task(comp,phase)
+            finally:
+                # Also record processes killed at the end of the phase
+                profiler.record_task(phase, comp, start, perf_counter_ns(),
+                    sim_start, get_sim_time("ns"))
 
 
     # @uvm-ieee 1800.2-2017 auto 9.6.2.3
     def execute(self, comp, phase):
-        cocotb.fork(self.forked_task(comp, phase))
+        # The phase node counts the process until it returns, and kills
+        # it if the phase ends first
+        phase.m_task_procs.fork(self.forked_task(comp, phase))
 
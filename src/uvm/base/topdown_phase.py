@@ -20,6 +20,7 @@
 #   the License for the specific language governing
 #   permissions and limitations under the License.
 #----------------------------------------------------------------------
+from time import perf_counter_ns
 from uvm.base.phase import uvm_phase
 from uvm.base.object_globals import uvm_phase_type, uvm_phase_state
 
@@ -47,41 +48,68 @@ class uvm_topdown_phase(uvm_phase):
 
     # @uvm-ieee 1800.2-2017 auto 9.7.2.2
     def traverse(self, comp, phase, state):
+        from uvm.base.component import uvm_component
+
+        # Walk the cached preorder list instead of recursing. Once a
+        # build_phase changes the hierarchy, the list is stale: finish with
+        # a walk that reads m_children as it goes, as a recursive walk would.
+        order = comp.m_get_preorder()
+        version = uvm_component.m_hier_version
+        for i,c in enumerate(order):
+            self.m_traverse_comp(c, phase, state)
+            if uvm_component.m_hier_version != version:
+                self.m_traverse_rest(c, order[i+1:], phase, state)
+                return
+
+    # Visits the children of ~comp~, just visited, and then the components of
+    # ~rest~ (the unvisited part of a preorder list), reading the current
+    # children of each component when it is visited
+    def m_traverse_rest(self, comp, rest, phase, state):
+        # Only the roots of the unvisited subtrees are needed; their
+        # descendants are found again through m_children
+        pending = set(rest)
+        pending.add(comp)
+        stack = [c for c in reversed(rest) if c.m_parent not in pending]
+        stack.extend(reversed(list(comp.m_children.values())))
+
+        while len(stack) > 0:
+            c = stack.pop()
+            self.m_traverse_comp(c, phase, state)
+            stack.extend(reversed(list(c.m_children.values())))
+
+    def m_traverse_comp(self, comp, phase, state):
         from uvm.base.domain import uvm_domain
         
-#        string name;
         phase_domain = phase.get_domain()
         comp_domain = comp.get_domain()
 
         if self.m_phase_trace:
             print("TODO: `uvm_info")
-#    `uvm_info("PH_TRACE",$sformatf("topdown-phase phase=%s state=%s comp=%s comp.domain=%s phase.domain=%s",
-#          phase.get_name(), state.name(), comp.get_full_name(),comp_domain.get_name(),phase_domain.get_name()),
-#          UVM_DEBUG)
 
         if phase_domain == uvm_domain.get_common_domain() or phase_domain == comp_domain:
             if state == uvm_phase_state.UVM_PHASE_STARTED:
                 comp.m_current_phase = phase
                 comp.m_apply_verbosity_settings(phase)
-                comp.phase_started(phase)
+                if not comp.m_is_noop_phase_method("phase_started"):
+                    comp.phase_started(phase)
             elif state == uvm_phase_state.UVM_PHASE_EXECUTING:
                 if phase.get_name() != "build" or not comp.m_build_done:
                     ph = self
-                    comp.m_phasing_active += 1
                     if self in comp.m_phase_imps.keys():
                         ph = comp.m_phase_imps[self]
-                    ph.execute(comp, phase)
-                    comp.m_phasing_active -= 1
+                    if not comp.m_is_noop_phase_method(ph.m_phase_method):
+                        comp.m_phasing_active += 1
+                        ph.execute(comp, phase)
+                        comp.m_phasing_active -= 1
             elif state == uvm_phase_state.UVM_PHASE_READY_TO_END:
-                comp.phase_ready_to_end(phase)
+                if not comp.m_is_noop_phase_method("phase_ready_to_end"):
+                    comp.phase_ready_to_end(phase)
             elif state == uvm_phase_state.UVM_PHASE_ENDED:
-                comp.phase_ended(phase)
+                if not comp.m_is_noop_phase_method("phase_ended"):
+                    comp.phase_ended(phase)
                 comp.m_current_phase = None
             else:
                 print("TODO: `uvm_fatal")
-#            `uvm_fatal("PH_BADEXEC","topdown phase traverse internal error")
-        for cn in comp.m_children.keys():
-            self.traverse(comp.m_children[cn], phase, state)
 
 
     # @uvm-ieee 1800.2-2017 auto 9.7.2.3
@@ -92,5 +120,11 @@ class uvm_topdown_phase(uvm_phase):
 #        proc.srandom(uvm_create_random_seed(phase.get_type_name(), comp.get_full_name()));
 
         comp.m_current_phase = phase
-        self.exec_func(comp,phase)
+        profiler = uvm_phase.m_profiler
+        if profiler is None:
+            self.exec_func(comp,phase)
+        else:
+            start = perf_counter_ns()
+            self.exec_func(comp,phase)
+            profiler.record_func(phase, comp, start, perf_counter_ns())
 
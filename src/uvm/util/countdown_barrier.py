@@ -0,0 +1,77 @@
+'''
+Created on Oct 16, 2026
+
+Countdown barrier over a set of forked coroutines
+'''
+import cocotb
+
+
+class CountdownBarrier():
+    """Counts the processes forked through it and fires a single trigger
+    when the last of them returns. Outstanding processes can be killed,
+    which also releases any waiters.
+    """
+
+    def __init__(self):
+        self.m_procs = {} # map<int,Task> processes not yet returned
+        self.m_next_id = 0
+        self.m_ev = None
+
+    def fork(self, coro):
+        """Forks ~coro~ and counts it until it returns. The forked process
+        runs ~coro~ itself, so that kill() stops it."""
+        proc = cocotb.fork(coro)
+        # The coroutine may already have returned
+        if not proc.done():
+            pid = self.m_enter()
+            self.m_procs[pid] = proc
+            cocotb.fork(self.m_watch(pid, proc))
+        return proc
+
+    @cocotb.coroutine
+    def m_watch(self, pid, proc):
+        try:
+            yield proc.join()
+        finally:
+            self.m_exit(pid)
+
+    def m_enter(self):
+        pid = self.m_next_id
+        self.m_next_id += 1
+        self.m_procs[pid] = None
+        return pid
+
+    def m_exit(self, pid):
+        # Processes forgotten by kill() are no longer counted
+        if self.m_procs.pop(pid, False) is not False and len(self.m_procs) == 0:
+            self.m_fire()
+
+    def m_fire(self):
+        ev = self.m_ev
+        if ev is not None:
+            self.m_ev = None
+            ev.set()
+
+    def get_count(self):
+        """Returns the number of processes that have not yet returned"""
+        return len(self.m_procs)
+
+    @cocotb.coroutine
+    def wait(self):
+        """Returns once no counted process remains"""
+        if len(self.m_procs) > 0:
+            if self.m_ev is None:
+                self.m_ev = cocotb.triggers.Event()
+            yield self.m_ev.wait()
+
+    def kill(self):
+        """Kills all processes that have not yet returned"""
+        procs = list(self.m_procs.values())
+        self.m_procs = {}
+        self.m_fire()
+        for proc in procs:
+            if proc is not None:
+                proc.kill()
+                # Run the finally blocks of the killed coroutine now
+                # rather than when it is collected
+                proc.close()
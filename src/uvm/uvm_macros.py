@@ -5,11 +5,23 @@ Created on Oct 7, 2019
 '''
 from uvm.base.component_registry import uvm_component_registry
 from uvm.base.object_registry import uvm_object_registry
-from uvm.base.object_wrapper import uvm_object_wrapper
 from uvm.base.globals import uvm_report_enabled, uvm_report_info,\
     uvm_report_fatal, uvm_report_error, uvm_report_warning
 from uvm.base.object_globals import UVM_INFO, UVM_WARNING, UVM_NONE, UVM_FATAL,\
-    UVM_ERROR
+    UVM_ERROR, uvm_deferred_init
+
+def m_uvm_register_type(type_id):
+    '''
+    Registers a type_id wrapper with the factory. Before the core services
+    exist, the wrapper is queued on uvm_deferred_init instead, so importing
+    decorated classes does not trigger uvm_init. The queue is flushed by
+    uvm_init and run_test.
+    '''
+    from uvm.base.coreservice import uvm_coreservice_t
+    if uvm_coreservice_t.inst is None:
+        uvm_deferred_init.append(type_id)
+    else:
+        uvm_coreservice_t.inst.get_factory().register(type_id)
 
 def uvm_component_utils(T):
     '''
@@ -17,34 +29,35 @@ def uvm_component_utils(T):
     '''
     
     def uvm_component_get_type():
-        pass
+        return T.type_id
     
-    def uvm_component_get_object_type():
-        pass
+    def uvm_component_get_object_type(self):
+        return T.type_id
 
     T.type_id = uvm_component_registry(T)
-    T.get_type = uvm_component_get_type
+    T.get_type = staticmethod(uvm_component_get_type)
     T.get_object_type = uvm_component_get_object_type
+    T.m_register_phase_methods(T)
     
-    from uvm.base.coreservice import uvm_coreservice_t
-    cs = uvm_coreservice_t.get()
-    cs.get_factory().register(uvm_object_wrapper(T))
+    m_uvm_register_type(T.type_id)
     
     return T 
 
 def uvm_object_utils(T):
     
     def uvm_object_get_type():
-        pass
+        return T.type_id
     
-    def uvm_object_get_object_type():
-        pass
+    def uvm_object_get_object_type(self):
+        return T.type_id
     
     T.type_id = uvm_object_registry(T)
-    T.get_type = uvm_object_get_type
+    T.get_type = staticmethod(uvm_object_get_type)
     T.get_object_type = uvm_object_get_object_type
     # TODO: virtual create() method
     
+    m_uvm_register_type(T.type_id)
+    
     return T
 
 def uvm_fatal(id, msg):
@@ -69,7 +82,7 @@ def uvm_warning(id, msg):
         uvm_report_warning(id, msg, UVM_NONE, file, line, "", True)
         
     
-def uvm_info(name, msg, verbosity):
+def uvm_info(id, msg, verbosity):
     if uvm_report_enabled(verbosity, UVM_INFO, id):
         # TODO: find calling context using inspect
         file = "<unknown>"
@@ -0,0 +1,660 @@
+'''
+Created on Oct 16, 2026
+
+Unit tests for uvm_default_factory override resolution
+'''
+import json
+import os
+import sys
+import tempfile
+import threading
+from unittest.case import TestCase
+
+from uvm.base.component import uvm_component
+from uvm.base.coreservice import uvm_coreservice_t
+from uvm.base.default_factory import uvm_default_factory
+from uvm.base.globals import uvm_is_match, m_uvm_glob_re, m_uvm_flush_deferred_init
+from uvm.base.inst_path_matcher import uvm_inst_path_matcher
+from uvm.base.object import uvm_object
+from uvm.base.object_globals import uvm_deferred_init
+from uvm.base.object_wrapper import uvm_object_wrapper
+from uvm.base.root import uvm_root
+from uvm.uvm_macros import uvm_object_utils, uvm_component_utils
+
+
+class base_obj(uvm_object):
+
+    def __init__(self, name="base_obj"):
+        super().__init__(name)
+
+
+class ext_obj(base_obj):
+
+    def __init__(self, name="ext_obj"):
+        super().__init__(name)
+
+
+class inst_obj(base_obj):
+
+    def __init__(self, name="inst_obj"):
+        super().__init__(name)
+
+
+class base_comp(uvm_component):
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+
+
+class ext_comp(base_comp):
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+
+
+@uvm_object_utils
+class reg_obj(uvm_object):
+
+    def __init__(self, name="reg_obj"):
+        super().__init__(name)
+
+
+@uvm_object_utils
+class reg_ext_obj(reg_obj):
+
+    def __init__(self, name="reg_ext_obj"):
+        super().__init__(name)
+
+
+@uvm_component_utils
+class reg_comp(uvm_component):
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+
+
+@uvm_component_utils
+class reg_ext_comp(reg_comp):
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+
+
+class TestFactory(TestCase):
+
+    def setUp(self):
+        # Tests that go through type_id use the global factory
+        self.global_factory = uvm_coreservice_t.get().get_factory()
+        self.global_snap = self.global_factory.snapshot()
+        self.factory = uvm_default_factory()
+        self.base_w = uvm_object_wrapper(base_obj)
+        self.ext_w = uvm_object_wrapper(ext_obj)
+        self.inst_w = uvm_object_wrapper(inst_obj)
+        for w in (self.base_w, self.ext_w, self.inst_w):
+            self.factory.register(w)
+
+    def tearDown(self):
+        self.global_factory.restore(self.global_snap)
+
+    def test_create_no_override(self):
+        o = self.factory.create_object_by_type(self.base_w, "", "o")
+        self.assertEqual(type(o), base_obj)
+        self.assertEqual(o.get_name(), "o")
+
+    def test_type_override(self):
+        self.factory.set_type_override_by_type(self.base_w, self.ext_w)
+        o = self.factory.create_object_by_type(self.base_w, "top", "o")
+        self.assertEqual(type(o), ext_obj)
+
+    def test_type_override_by_name(self):
+        self.factory.set_type_override_by_name("base_obj", "ext_obj")
+        o = self.factory.create_object_by_name("base_obj", "top", "o")
+        self.assertEqual(type(o), ext_obj)
+
+    def test_inst_override(self):
+        self.factory.set_type_override_by_type(self.base_w, self.ext_w)
+        self.factory.set_inst_override_by_type(self.base_w, self.inst_w, "top.o")
+        self.assertEqual(type(self.factory.create_object_by_type(self.base_w, "top", "o")), inst_obj)
+        self.assertEqual(type(self.factory.create_object_by_type(self.base_w, "top", "p")), ext_obj)
+
+    def test_cache_invalidated_by_override(self):
+        o = self.factory.create_object_by_type(self.base_w, "top", "o")
+        self.assertEqual(type(o), base_obj)
+        self.assertIn(self.base_w, self.factory.m_resolve_cache)
+
+        gen = self.factory.m_generation
+        self.factory.set_type_override_by_type(self.base_w, self.ext_w)
+        self.assertGreater(self.factory.m_generation, gen)
+        self.assertEqual(len(self.factory.m_resolve_cache), 0)
+
+        o = self.factory.create_object_by_type(self.base_w, "top", "o")
+        self.assertEqual(type(o), ext_obj)
+
+    def test_resolve_cache_size(self):
+        # Unique instance names share one entry per distinct override match
+        self.factory.set_type_override_by_type(self.base_w, self.ext_w)
+        for i in range(100):
+            self.factory.create_object_by_type(self.base_w, "top", "o%d" % i)
+        self.assertEqual(len(self.factory.m_resolve_cache), 1)
+
+        self.factory.set_inst_override_by_type(self.base_w, self.inst_w, "top.o1*")
+        types = [type(self.factory.create_object_by_type(self.base_w, "top", "o%d" % i))
+            for i in range(100)]
+        self.assertEqual(types.count(inst_obj), 11)
+        self.assertEqual(types.count(ext_obj), 89)
+        self.assertEqual(len(self.factory.m_resolve_cache), 2)
+
+    def test_override_index_priority(self):
+        self.factory.set_type_override_by_type(self.base_w, self.inst_w)
+        self.factory.set_type_override_by_name("base_obj", "ext_obj")
+        # Newest type override wins
+        o = self.factory.create_object_by_type(self.base_w, "top", "o")
+        self.assertEqual(type(o), ext_obj)
+
+        (inst_c, type_c) = self.factory.m_get_override_candidates(
+            self.factory.get_type_id(self.base_w), self.factory.m_name_ids["base_obj"])
+        self.assertEqual(len(inst_c), 0)
+        self.assertEqual([ov.ovrd.m_type_name for ov in type_c], ["ext_obj"])
+
+        # Unrelated types see no candidates
+        (inst_c, type_c) = self.factory.m_get_override_candidates(
+            self.factory.get_type_id(self.ext_w), self.factory.m_name_ids["ext_obj"])
+        self.assertEqual(len(inst_c) + len(type_c), 0)
+
+    def test_wildcard_inst_override(self):
+        self.factory.set_inst_override_by_type(self.base_w, self.inst_w, "top.env.agent*.drv")
+        self.factory.set_inst_override_by_type(self.base_w, self.ext_w, "top.*")
+        self.assertEqual(type(self.factory.create_object_by_type(
+            self.base_w, "top.env.agent12", "drv")), inst_obj)
+        self.assertEqual(type(self.factory.create_object_by_type(
+            self.base_w, "top.env.agent12", "mon")), ext_obj)
+        self.assertEqual(type(self.factory.create_object_by_type(
+            self.base_w, "other", "drv")), base_obj)
+
+    def test_inst_path_matcher(self):
+        m = uvm_inst_path_matcher()
+        m.add("top.*.drv", "a", 2)
+        m.add("top.env?.drv", "b", 1)
+        m.add("top.env1.drv", "c", 3)
+        m.add("/^top\\.env[0-9]+\\.drv$/", "d", 0)
+        m.add("*", "e", 4)
+        self.assertEqual(m.match("top.env1.drv"), ["d", "b", "a", "c", "e"])
+        self.assertEqual(m.match("top.env10.drv"), ["d", "a", "e"])
+        self.assertEqual(m.match("top.drv"), ["e"])
+        self.assertTrue(uvm_is_match("top.*", "top.a.b"))
+        self.assertFalse(uvm_is_match("top.?", "top.ab"))
+
+        # The compiled globs are bounded
+        for i in range(m_uvm_glob_re.cache_info().maxsize + 10):
+            uvm_is_match("top.env%d.*" % i, "top.env1.drv")
+        self.assertEqual(m_uvm_glob_re.cache_info().currsize,
+                m_uvm_glob_re.cache_info().maxsize)
+
+        # Adding leaves earlier snapshots, and their cached results, intact
+        snap = m.m_snap
+        m.add("top.env?.*", "f", 5)
+        self.assertEqual(m.match("top.env1.drv"), ["d", "b", "a", "c", "e", "f"])
+        self.assertEqual(m.m_match(snap, "top.env1.drv"), ["d", "b", "a", "c", "e"])
+
+    def test_inst_path_matcher_add_during_match(self):
+        # Runs an add at a fixed point of the next match
+        class interleaved_matcher(uvm_inst_path_matcher):
+
+            def __init__(self):
+                super().__init__()
+                self.writer = None
+
+            def m_closure(self, nodes):
+                if self.writer is not None:
+                    (writer, self.writer) = (self.writer, None)
+                    writer()
+                return super().m_closure(nodes)
+
+        m = interleaved_matcher()
+        m.add("top.b", "b")
+        m.writer = lambda: m.add("top.a", "a")
+        # The match in progress sees the patterns it started with...
+        self.assertEqual(m.match("top.a"), [])
+        # ...but its result is not kept for later matches
+        self.assertEqual(m.match("top.a"), ["a"])
+        self.assertEqual(m.match_set("top.a"), frozenset(["a"]))
+
+    def test_inst_path_matcher_concurrent_add(self):
+        m = uvm_inst_path_matcher()
+        paths = ["top.u%d.drv" % i for i in range(200)]
+        done = threading.Event()
+        errors = []
+
+        def read():
+            while not done.is_set():
+                for i,path in enumerate(paths):
+                    ret = m.match(path)
+                    if ret not in ([], [i], [i, "*"]):
+                        errors.append((path, ret))
+                    ret = m.match_set(path)
+                    if ret not in (frozenset(), frozenset([i]), frozenset([i, "*"])):
+                        errors.append((path, ret))
+
+        # Switch threads often, to interleave readers with the adds
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        readers = [threading.Thread(target=read) for _ in range(3)]
+        try:
+            for t in readers:
+                t.start()
+            for i,path in enumerate(paths):
+                m.add(path if i % 2 == 0 else "top.u%d.*" % i, i, i)
+            m.add("*.drv", "*", 1000)
+        finally:
+            done.set()
+            for t in readers:
+                t.join()
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(errors, [])
+        # No result computed against older patterns survives the last add
+        for i,path in enumerate(paths):
+            self.assertEqual(m.match(path), [i, "*"])
+            self.assertEqual(m.match_set(path), frozenset([i, "*"]))
+
+    def test_freeze(self):
+        self.factory.set_type_override_by_type(self.base_w, self.ext_w)
+        self.factory.set_inst_override_by_type(self.ext_w, self.inst_w, "top.o")
+        self.factory.freeze()
+        self.assertTrue(self.factory.is_frozen())
+        # Compiling the tables does not count as using the overrides
+        for override in self.factory.m_type_overrides + self.factory.m_inst_overrides:
+            self.assertEqual(override.used, 0)
+        # base_obj resolves to ext_obj, which has an instance override
+        self.assertNotIn(self.base_w, self.factory.m_frozen_types)
+        self.assertIs(self.factory.m_frozen_types[self.inst_w][0], self.inst_w)
+        self.assertEqual(type(self.factory.create_object_by_type(self.base_w, "top", "o")), inst_obj)
+        self.assertEqual(type(self.factory.create_object_by_type(self.base_w, "top", "p")), ext_obj)
+        self.assertEqual(type(self.factory.create_object_by_name("inst_obj", "top", "o")), inst_obj)
+
+        # Mutation thaws the factory
+        self.factory.set_type_override_by_type(self.inst_w, self.base_w)
+        self.assertFalse(self.factory.is_frozen())
+        self.assertEqual(type(self.factory.create_object_by_type(self.inst_w, "x", "o")), ext_obj)
+
+    def test_object_pool(self):
+        self.factory.set_type_override_by_type(self.base_w, self.ext_w)
+        o1 = self.factory.acquire_object_by_type(self.base_w, "", "a")
+        self.assertEqual(type(o1), ext_obj)
+        pool = self.factory.get_pool(self.ext_w)
+        self.assertEqual((pool.get_hits(), pool.get_misses()), (0, 1))
+
+        self.factory.release_object(o1)
+        o2 = self.factory.acquire_object_by_type(self.base_w, "", "b")
+        self.assertIs(o1, o2)
+        self.assertEqual(o2.get_name(), "b")
+        self.assertEqual((pool.get_hits(), pool.get_misses()), (1, 1))
+
+        self.factory.set_pool_max_size(0, self.ext_w)
+        self.factory.release_object(o2)
+        self.assertEqual(pool.get_size(), 0)
+        self.assertEqual(pool.get_drops(), 1)
+
+    def test_create_components_batch(self):
+        base_cw = uvm_object_wrapper(base_comp)
+        ext_cw = uvm_object_wrapper(ext_comp)
+        self.factory.register(base_cw)
+        self.factory.register(ext_cw)
+        self.factory.set_inst_override_by_type(base_cw, ext_cw, "batch_env.agent2")
+
+        env = uvm_component("batch_env", None)
+        names = ["agent%0d" % i for i in range(4)]
+        comps = self.factory.create_components_by_type(base_cw, "batch_env", names, env)
+        self.assertEqual([type(c) for c in comps],
+            [base_comp, base_comp, ext_comp, base_comp])
+        self.assertEqual([c.get_name() for c in comps], names)
+        self.assertEqual(env.get_child("agent3"), comps[3])
+
+        comps = self.factory.create_components_by_name("base_comp", "batch_env",
+            ["agent4", "agent2"], None)
+        self.assertEqual([type(c) for c in comps], [base_comp, ext_comp])
+
+        # A type that does not resolve for one of the names creates none
+        self.factory.set_inst_alias("agent_alias", base_cw, "batch_env.agent5")
+        comps = self.factory.create_components_by_name("agent_alias", "batch_env",
+            ["agent5", "agent6"], env)
+        self.assertEqual(comps, [])
+        self.assertFalse(env.has_child("agent5"))
+        comps = self.factory.create_components_by_name("agent_alias", "batch_env", ["agent5"], env)
+        self.assertEqual([type(c) for c in comps], [base_comp])
+
+    def test_wrapper_constructors(self):
+        self.assertEqual(self.base_w.create_object().get_name(), "base_obj")
+        self.assertEqual(self.base_w.create_object("x").get_name(), "x")
+        self.assertIs(uvm_object_wrapper(base_comp).create_component, base_comp)
+
+    def test_type_id_create_uses_overrides(self):
+        self.assertIs(reg_obj.get_type(), reg_obj.type_id)
+        self.assertEqual(type(reg_obj.type_id.create("a")), reg_obj)
+
+        reg_obj.type_id.set_type_override(reg_ext_obj.get_type())
+        o = reg_obj.type_id.create("a")
+        self.assertEqual(type(o), reg_ext_obj)
+        self.assertEqual(o.get_name(), "a")
+
+        reg_comp.type_id.set_inst_override(reg_ext_comp.get_type(), "reg_top.c1")
+        top = reg_comp.type_id.create("reg_top", None)
+        self.assertEqual(type(top), reg_comp)
+        self.assertEqual(type(reg_comp.type_id.create("c1", None, "reg_top")), reg_ext_comp)
+        self.assertEqual(type(reg_comp.type_id.create("c2", None, "reg_top")), reg_comp)
+
+    def test_deferred_registration(self):
+        inst = uvm_coreservice_t.inst
+        uvm_coreservice_t.inst = None
+        try:
+            @uvm_object_utils
+            class deferred_obj(uvm_object):
+
+                def __init__(self, name="deferred_obj"):
+                    super().__init__(name)
+
+            # Decorating the class neither initializes the library nor
+            # registers the type
+            self.assertIsNone(uvm_coreservice_t.inst)
+            self.assertIn(deferred_obj.type_id, uvm_deferred_init)
+        finally:
+            uvm_coreservice_t.inst = inst
+
+        # As done by uvm_init and run_test
+        m_uvm_flush_deferred_init()
+        factory = uvm_coreservice_t.get().get_factory()
+        self.assertEqual(len(uvm_deferred_init), 0)
+        self.assertTrue(factory.is_type_registered(deferred_obj.get_type()))
+        self.assertTrue(factory.is_type_registered(reg_obj.get_type()))
+        self.assertTrue(factory.is_type_name_registered("reg_comp"))
+        self.assertEqual(type(factory.create_object_by_name("reg_obj", "", "o")),
+            type(reg_obj.type_id.create("o")))
+
+
+    def test_stats(self):
+        self.assertIsNone(self.factory.get_stats())
+        self.factory.set_stats_enabled(True)
+        self.factory.set_type_override_by_type(self.base_w, self.ext_w)
+
+        for i in range(4):
+            self.factory.create_object_by_type(self.base_w, "", "o%d" % i)
+        self.factory.create_object_by_name("inst_obj", "", "i")
+
+        stats = self.factory.get_stats()
+        self.assertEqual(stats.get_type_stats(self.ext_w).count, 4)
+        self.assertEqual(stats.get_type_stats(self.inst_w).count, 1)
+        self.assertEqual(stats.get_override_count(self.base_w, self.ext_w), 4)
+
+        # Types that share a name are kept apart
+        dup_w = uvm_object_wrapper(type("ext_obj", (base_obj,), {}))
+        self.factory.create_object_by_type(dup_w, "", "d")
+        self.assertEqual(stats.get_type_stats(self.ext_w).count, 4)
+        self.assertEqual(stats.get_type_stats(dup_w).count, 1)
+
+        data = json.loads(self.factory.report_stats("json"))
+        self.assertEqual([t["type"] for t in data["types"]].count("ext_obj"), 2)
+        self.assertTrue(all(t["p50_ns"] <= t["p99_ns"] <= t["max_ns"] for t in data["types"]))
+        # Later creates reuse the memoized resolution
+        self.assertEqual(data["override_resolutions"][0]["used"], 1)
+        self.assertIn("ext_obj", self.factory.report_stats())
+
+        # Batch creates and pooled acquires are recorded as well
+        parent = uvm_component("stats_top", None)
+        comp_w = uvm_object_wrapper(base_comp)
+        self.factory.register(comp_w)
+        self.factory.create_components_by_type(comp_w, "stats_top", ["c0", "c1"], parent)
+        self.factory.create_components_by_name("base_comp", "stats_top", ["c2"], parent)
+        self.factory.acquire_object_by_type(self.inst_w, "", "a")
+        self.assertEqual(stats.get_type_stats(comp_w).count, 3)
+        self.assertEqual(stats.get_type_stats(self.inst_w).count, 2)
+
+        self.factory.set_stats_enabled(False)
+        self.assertIsNone(self.factory.get_stats())
+        self.assertNotIn("create_object_by_type", self.factory.__dict__)
+
+    def test_stats_plusarg(self):
+        clp = uvm_root.get().clp
+        argv = clp.m_argv
+        try:
+            clp.m_argv = ["+UVM_FACTORY_STATS_X"]
+            self.assertIsNone(uvm_root.get().m_get_option_plusarg("+UVM_FACTORY_STATS"))
+            clp.m_argv = ["+UVM_FACTORY_STATS"]
+            self.assertEqual(uvm_root.get().m_get_option_plusarg("+UVM_FACTORY_STATS"), "")
+            clp.m_argv = ["+UVM_FACTORY_STATS=json"]
+            self.assertEqual(uvm_root.get().m_get_option_plusarg("+UVM_FACTORY_STATS"), "json")
+        finally:
+            clp.m_argv = argv
+
+    def test_stats_subclass(self):
+        # Recording does not bypass create methods overridden by a subclass
+        class counting_factory(uvm_default_factory):
+
+            def __init__(self):
+                super().__init__()
+                self.creates = 0
+
+            def create_object_by_type(self, requested_type, parent_inst_path="", name=""):
+                self.creates += 1
+                return super().create_object_by_type(requested_type, parent_inst_path, name)
+
+        factory = counting_factory()
+        factory.register(self.base_w)
+        factory.set_stats_enabled(True)
+        factory.create_object_by_type(self.base_w, "", "o")
+        self.assertEqual(factory.creates, 1)
+        self.assertEqual(factory.get_stats().get_type_stats(self.base_w).count, 1)
+
+    def test_bulk_overrides(self):
+        def overrides(factory):
+            return ([(o.orig.m_type_name, o.ovrd.m_type_name, o.replace) for o in factory.m_type_overrides],
+                    [(o.orig.m_type_name, o.ovrd.m_type_name, o.full_inst_path) for o in factory.m_inst_overrides])
+
+        # Entries for registered types use the index, the rest the scan of
+        # set_type_override_by_name; both give the one-at-a-time result
+        batches = [
+            ([("ext_obj", "inst_obj", True)],
+             [("base_obj", "ext_obj", True), ("base_obj", "inst_obj", False),
+              ("ext_obj", "base_obj", True), ("base_obj", "inst_obj", True), ("ext_obj", "ext_obj", True)],
+             [("base_obj", "inst_obj", "top.a"), ("base_obj", "inst_obj", "top.a")]),
+            ([("alias_obj", "ext_obj", True), ("ext_obj", "inst_obj", True)],
+             [("base_obj", "ext_obj", True), ("alias_obj", "base_obj", False),
+              ("alias_obj", "inst_obj", True), ("base_obj", "inst_obj", True)],
+             [("base_obj", "inst_obj", "top.a"), ("base_obj", "inst_obj", "top.b")])]
+        for (setup, type_overrides, inst_overrides) in batches:
+            single = uvm_default_factory()
+            batch = uvm_default_factory()
+            for factory in (single, batch):
+                for w in (self.base_w, self.ext_w, self.inst_w):
+                    factory.register(w)
+                for entry in setup:
+                    factory.set_type_override_by_name(*entry)
+                factory.set_inst_override_by_name("base_obj", "inst_obj", "top.a")
+
+            for entry in type_overrides:
+                single.set_type_override_by_name(*entry)
+            for entry in inst_overrides:
+                single.set_inst_override_by_name(*entry)
+            batch.set_overrides_by_name(type_overrides, inst_overrides)
+
+            self.assertEqual(overrides(batch), overrides(single))
+            for (path, name) in (("top", "a"), ("top", "b"), ("top", "c"), ("", "x")):
+                for type_name in ("base_obj", "alias_obj", "ext_obj"):
+                    self.assertEqual(type(batch.create_object_by_name(type_name, path, name)),
+                        type(single.create_object_by_name(type_name, path, name)))
+
+        self.factory.set_overrides_by_name([("base_obj", "ext_obj", True)])
+        self.assertEqual(type(self.factory.create_object_by_name("base_obj", "", "o")), ext_obj)
+        self.factory.set_overrides_by_name(inst_overrides=[("base_obj", "inst_obj", "top.a")])
+        self.assertEqual(type(self.factory.create_object_by_name("base_obj", "top", "a")), inst_obj)
+
+    def test_load_overrides(self):
+        with tempfile.TemporaryDirectory() as d:
+            csv_file = os.path.join(d, "ovr.csv")
+            with open(csv_file, "w") as fp:
+                fp.write("# kind,original,override,path\n")
+                fp.write("type,base_obj,ext_obj\n\n")
+                fp.write("inst,base_obj,inst_obj,top.*\n")
+            self.assertEqual(self.factory.load_overrides(csv_file), 2)
+            self.assertEqual(type(self.factory.create_object_by_name("base_obj", "top", "x")), inst_obj)
+            self.assertEqual(type(self.factory.create_object_by_name("base_obj", "", "x")), ext_obj)
+
+            json_file = os.path.join(d, "ovr.json")
+            with open(json_file, "w") as fp:
+                json.dump({"type_overrides": [{"original": "base_obj", "override": "inst_obj"}],
+                           "inst_overrides": [{"original": "ext_obj", "override": "base_obj",
+                                               "path": "top.*"}]}, fp)
+            self.assertEqual(self.factory.load_overrides(json_file), 2)
+            self.assertEqual(type(self.factory.create_object_by_name("base_obj", "", "x")), inst_obj)
+            self.assertEqual(len(self.factory.m_type_overrides), 1)
+
+    def test_inst_alias(self):
+        self.factory.set_inst_alias("variant", self.ext_w, "top.a")
+        self.factory.set_inst_alias("variant", self.inst_w, "top.*")
+        self.factory.set_inst_alias("base_obj", self.inst_w, "top.c")
+        base_comp_w = uvm_object_wrapper(base_comp)
+        ext_comp_w = uvm_object_wrapper(ext_comp)
+        self.factory.register(base_comp_w)
+        self.factory.register(ext_comp_w)
+        self.factory.set_inst_alias("base_comp", ext_comp_w, "top.c")
+
+        self.assertEqual(type(self.factory.create_object_by_name("variant", "top", "a")), ext_obj)
+        self.assertEqual(type(self.factory.create_object_by_name("variant", "top", "b")), inst_obj)
+        self.assertIsNone(self.factory.find_wrapper_by_name("variant"))
+        self.assertEqual(type(self.factory.create_object_by_name("base_obj", "top", "c")), inst_obj)
+        self.assertEqual(type(self.factory.create_object_by_name("base_obj", "top", "d")), base_obj)
+
+        self.factory.freeze()
+        self.assertNotIn("base_obj", self.factory.m_frozen_names.keys())
+        self.assertEqual(type(self.factory.create_object_by_name("base_obj", "top", "c")), inst_obj)
+        comps = self.factory.create_components_by_name("base_comp", "top", ["c", "d"], None)
+        self.assertEqual([type(c) for c in comps], [ext_comp, base_comp])
+
+        # overrides by alias name apply only where the alias resolves
+        self.factory.set_type_override_by_name("variant", "base_obj")
+        self.assertEqual(type(self.factory.create_object_by_type(self.ext_w, "top", "a")), base_obj)
+        self.assertEqual(type(self.factory.create_object_by_type(self.ext_w, "top", "b")), ext_obj)
+        self.assertEqual(type(self.factory.create_object_by_type(self.inst_w, "top", "b")), base_obj)
+
+    def test_type_ids(self):
+        self.assertEqual([self.factory.get_type_id(w) for w in (self.base_w, self.ext_w, self.inst_w)],
+            [0, 1, 2])
+        self.assertEqual(self.factory.get_type_id(uvm_object_wrapper(base_comp)), -1)
+
+        # Overrides naming a type before it is registered pick it up on registration
+        self.factory.set_type_override_by_name("base_obj", "late_comp")
+        override = self.factory.m_type_overrides[0]
+        self.assertIsNone(override.ovrd.m_type)
+        self.assertEqual(override.ovrd.m_name_id, self.factory.m_name_ids["late_comp"])
+
+        class late_comp(base_obj):
+            pass
+        late_w = uvm_object_wrapper(late_comp)
+        self.factory.register(late_w)
+        self.assertIs(override.ovrd.m_type, late_w)
+        self.assertEqual(self.factory.get_type_id(late_w), 3)
+        self.assertEqual(type(self.factory.create_object_by_type(self.base_w, "", "o")), late_comp)
+
+    def test_snapshot_restore(self):
+        self.factory.set_type_override_by_type(self.base_w, self.ext_w)
+        snap = self.factory.snapshot()
+        base_overrides = self.factory.m_type_overrides
+
+        self.factory.set_type_override_by_type(self.base_w, self.inst_w)
+        self.factory.set_inst_override_by_type(self.ext_w, self.base_w, "top.a")
+        self.factory.set_inst_alias("variant", self.inst_w, "top.*")
+        self.assertIsNot(self.factory.m_type_overrides, base_overrides)
+        self.assertEqual(base_overrides[0].ovrd.m_type, self.ext_w)
+        self.assertEqual(type(self.factory.create_object_by_type(self.base_w, "top", "b")), inst_obj)
+        self.assertEqual(type(self.factory.create_object_by_name("variant", "top", "b")), inst_obj)
+
+        self.factory.restore(snap)
+        self.assertEqual(type(self.factory.create_object_by_type(self.base_w, "top", "b")), ext_obj)
+        self.assertEqual(type(self.factory.create_object_by_type(self.ext_w, "top", "a")), ext_obj)
+        self.assertIsNone(self.factory.create_object_by_name("variant", "top", "b"))
+
+        # A snapshot may be restored repeatedly
+        self.factory.set_inst_override_by_type(self.ext_w, self.inst_w, "top.a")
+        self.assertEqual(type(self.factory.create_object_by_type(self.ext_w, "top", "a")), inst_obj)
+        self.factory.restore(snap)
+        self.assertEqual(type(self.factory.create_object_by_type(self.ext_w, "top", "a")), ext_obj)
+        self.assertEqual(len(self.factory.m_inst_overrides), 0)
+
+    def test_resolution_trace(self):
+        self.factory.set_type_override_by_type(self.base_w, self.ext_w)
+        self.factory.set_inst_override_by_type(self.ext_w, self.inst_w, "top.a")
+        self.factory.create_object_by_type(self.base_w, "top", "a")
+        self.factory.create_object_by_type(self.base_w, "top", "b")
+        self.factory.create_object_by_name("inst_obj", "", "i")
+
+        trace = self.factory.get_trace()
+        self.assertEqual(len(trace), 3)
+        (requested, path, override, chain_length, produced) = trace[0]
+        self.assertEqual((requested, path, chain_length, produced), ("base_obj", "top.a", 2, "inst_obj"))
+        self.assertIs(override.ovrd.m_type, self.ext_w)
+        self.assertEqual(trace[1][1:], ("top.b", override, 1, "ext_obj"))
+        self.assertEqual(trace[2], ("inst_obj", "i", None, 0, "inst_obj"))
+
+        # Frozen creates are traced too
+        self.factory.freeze()
+        self.factory.create_object_by_type(self.inst_w, "", "j")
+        self.assertEqual(self.factory.get_trace()[-1], ("inst_obj", "j", None, 0, "inst_obj"))
+
+        self.factory.set_trace_depth(2)
+        self.assertEqual(len(self.factory.get_trace()), 2)
+        self.factory.set_trace_depth(0)
+        self.factory.create_object_by_type(self.inst_w, "", "k")
+        self.assertEqual(len(self.factory.get_trace()), 0)
+
+    def test_concurrent_overrides(self):
+        # A writer adds instance overrides while readers create
+        done = threading.Event()
+        errors = []
+
+        def create():
+            while not done.is_set():
+                for i in range(50):
+                    o = self.factory.create_object_by_type(self.base_w, "top.u%d" % i, "o")
+                    if type(o) not in (base_obj, inst_obj):
+                        errors.append((i, type(o)))
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        readers = [threading.Thread(target=create) for _ in range(3)]
+        try:
+            for t in readers:
+                t.start()
+            for i in range(50):
+                self.factory.set_inst_override_by_type(self.base_w, self.inst_w, "top.u%d.*" % i)
+        finally:
+            done.set()
+            for t in readers:
+                t.join()
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(errors, [])
+        for i in range(50):
+            self.assertEqual(type(self.factory.create_object_by_type(
+                self.base_w, "top.u%d" % i, "o")), inst_obj)
+
+    def test_concurrent_creates(self):
+        self.factory.set_type_override_by_type(self.base_w, self.ext_w)
+        self.factory.set_inst_override_by_type(self.ext_w, self.inst_w, "top.t0.*")
+        errors = []
+
+        def build(idx):
+            for i in range(200):
+                o = self.factory.create_object_by_type(self.base_w, "top.t%d" % idx, "o%d" % i)
+                expected = inst_obj if idx == 0 else ext_obj
+                if type(o) != expected:
+                    errors.append((idx, i, type(o)))
+                if self.factory.find_override_by_name("base_obj", "top.t%d.x" % idx) is not \
+                        (self.inst_w if idx == 0 else self.ext_w):
+                    errors.append((idx, i, "by name"))
+
+        threads = [threading.Thread(target=build, args=(idx,)) for idx in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(errors, [])
@@ -0,0 +1,712 @@
+'''
+Created on Oct 16, 2026
+
+Unit tests for component hierarchy traversal used by the phase imps
+'''
+import json
+import sys
+import cocotb
+from contextlib import contextmanager
+from cocotb.scheduler import Scheduler
+from cocotb.task import Task
+from cocotb.triggers import Event
+from unittest import mock
+from unittest.case import TestCase
+
+from uvm.base.component import uvm_component
+from uvm.base.common_phases import uvm_connect_phase, uvm_build_phase,\
+    uvm_run_phase, uvm_extract_phase, uvm_check_phase
+from uvm.base.coreservice import uvm_coreservice_t
+from uvm.base.domain import uvm_domain
+from uvm.base.object_globals import uvm_phase_state, uvm_phase_type
+from uvm.base.phase import uvm_phase
+from uvm.base.phase_profiler import uvm_phase_profiler
+from uvm.base.runtime_phases import uvm_reset_phase, uvm_main_phase,\
+    uvm_shutdown_phase
+from uvm.base.task_phase import uvm_task_phase
+from uvm.base.topdown_phase import uvm_topdown_phase
+from uvm.uvm_macros import uvm_component_utils
+from uvm.util.countdown_barrier import CountdownBarrier
+from uvm.util.mailbox import Mailbox
+
+
+class build_recorder_phase(uvm_topdown_phase):
+    """Topdown phase that records visits and creates children on the fly"""
+
+    def __init__(self, name, fanout):
+        super().__init__(name)
+        self.fanout = fanout
+        self.visited = []
+
+    def m_traverse_comp(self, comp, phase, state):
+        self.visited.append(comp.get_full_name())
+        for name in self.fanout.get(comp.get_full_name(), []):
+            # Either a child name or a (parent, child name) pair
+            if isinstance(name, tuple):
+                uvm_component(name[1], name[0])
+            else:
+                uvm_component(name, comp)
+
+
+class fork_recorder_phase(uvm_task_phase):
+    """Task phase that records the components it would fork a process for"""
+
+    m_phase_method = "run_phase"
+
+    def __init__(self, name):
+        super().__init__(name)
+        self.forked = []
+
+    def execute(self, comp, phase):
+        self.forked.append(comp.get_name())
+
+
+class stub_phase():
+    """Stands in for a scheduled phase node of the common domain"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def get_name(self):
+        return self.name
+
+    def get_full_name(self):
+        return "common." + self.name
+
+    def get_domain(self):
+        return uvm_domain.get_common_domain()
+
+
+@contextmanager
+def running_scheduler(start=None):
+    """Installs a cocotb scheduler with a test that calls ~start~ and then
+    waits forever. Without a simulator the scheduler only runs pure-Python
+    triggers; setting an event from the test runs everything it releases
+    before returning."""
+
+    async def run():
+        if start is not None:
+            start()
+        await Event().wait()
+
+    scheduler = cocotb.scheduler
+    cocotb.scheduler = Scheduler(lambda result: None)
+    try:
+        cocotb.scheduler._add_test(Task(run()))
+        yield cocotb.scheduler
+    finally:
+        cocotb.scheduler = scheduler
+
+
+class connect_comp(uvm_component):
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.calls = []
+
+    def connect_phase(self, phase):
+        self.calls.append("connect")
+
+    def phase_started(self, phase):
+        self.calls.append("started")
+
+
+@uvm_component_utils
+class run_comp(uvm_component):
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+
+    async def run_phase(self, phase):
+        pass
+
+
+@uvm_component_utils
+class sched_comp(uvm_component):
+    """Runtime phase tasks that wait for the test to release them"""
+
+    def __init__(self, name, parent):
+        super().__init__(name, parent)
+        self.calls = []
+        self.hold_reset = None
+        self.release_main = Event()
+        self.after_jump = Event()
+        self.jumps = 0
+
+    async def reset_phase(self, phase):
+        self.calls.append("reset")
+        if self.hold_reset is not None:
+            await self.hold_reset.wait()
+            self.hold_reset = None
+
+    async def main_phase(self, phase):
+        self.calls.append("main")
+        await self.release_main.wait()
+        self.release_main.clear()
+        if self.jumps > 0:
+            self.jumps -= 1
+            phase.jump(uvm_reset_phase.get())
+            # Only the end of the phase stops the process
+            await self.after_jump.wait()
+            self.calls.append("not killed")
+
+
+class TestPhasing(TestCase):
+
+    def test_full_name(self):
+        env = uvm_component("fn_env", None)
+        agent = uvm_component("agent", env)
+        drv = uvm_component("drv", agent)
+
+        self.assertIs(drv.get_parent(), agent)
+        self.assertEqual(drv.get_full_name(), "fn_env.agent.drv")
+        self.assertEqual(env.get_full_name(), "fn_env")
+        self.assertEqual(env.get_num_children(), 1)
+
+    def test_traversal_orders(self):
+        env = uvm_component("ord_env", None)
+        a = uvm_component("a", env)
+        a1 = uvm_component("a1", a)
+        a2 = uvm_component("a2", a)
+        b = uvm_component("b", env)
+
+        self.assertEqual(env.m_get_preorder(), [env, a, a1, a2, b])
+        self.assertEqual(env.m_get_postorder(), [a1, a2, a, b, env])
+
+        # Cached until the hierarchy changes
+        self.assertIs(env.m_get_preorder(), env.m_get_preorder())
+        cached = env.m_get_postorder()
+        b1 = uvm_component("b1", b)
+        self.assertIsNot(env.m_get_postorder(), cached)
+        self.assertEqual(env.m_get_postorder(), [a1, a2, a, b1, b, env])
+
+    def test_topdown_creates_children(self):
+        env = uvm_component("td_env", None)
+        uvm_component("x", env)
+        fanout = {
+            "td_env" : ["a", "b"],
+            "td_env.a" : ["a1"],
+            "td_env.b" : ["b1", "b2"]}
+        ph = build_recorder_phase("td_build", fanout)
+
+        ph.traverse(env, None, None)
+
+        self.assertEqual(ph.visited, [
+            "td_env", "td_env.x", "td_env.a", "td_env.a.a1",
+            "td_env.b", "td_env.b.b1", "td_env.b.b2"])
+        self.assertEqual(len(env.m_get_preorder()), 7)
+
+        # Children created under a component not yet visited are visited
+        env = uvm_component("td_env2", None)
+        uvm_component("a", env)
+        b = uvm_component("b", env)
+        uvm_component("b1", b)
+        ph = build_recorder_phase("td_build2", {
+            "td_env2.a" : [(b, "late"), "a1"],
+            "td_env2.b.late" : ["l1"]})
+
+        ph.traverse(env, None, None)
+
+        self.assertEqual(ph.visited, [
+            "td_env2", "td_env2.a", "td_env2.a.a1",
+            "td_env2.b", "td_env2.b.b1", "td_env2.b.late", "td_env2.b.late.l1"])
+
+    def test_deep_hierarchy(self):
+        depth = sys.getrecursionlimit() + 100
+        top = uvm_component("deep_env", None)
+        comp = top
+        for i in range(depth):
+            comp = uvm_component("l%d" % i, comp)
+
+        self.assertEqual(len(top.m_get_preorder()), depth+1)
+        self.assertIs(top.m_get_preorder()[-1], comp)
+        self.assertIs(top.m_get_postorder()[0], comp)
+        self.assertTrue(comp.get_full_name().startswith("deep_env.l0.l1."))
+
+        ph = build_recorder_phase("deep_build", {})
+        ph.traverse(top, None, None)
+        self.assertEqual(len(ph.visited), depth+1)
+
+    def test_find_all(self):
+        top = uvm_coreservice_t.get().get_root()
+        env = uvm_component("fa_env", None)
+        a = uvm_component("a", env)
+        a_drv = uvm_component("drv", a)
+        b = uvm_component("b", env)
+        b_drv = uvm_component("drv", b)
+
+        comps = []
+        top.find_all("fa_env.*drv", comps)
+        self.assertEqual(comps, [a_drv, b_drv])
+
+        comps = []
+        top.find_all("*", comps, env)
+        self.assertEqual(comps, [a_drv, a, b_drv, b, env])
+
+    def test_noop_phase_methods(self):
+        self.assertIn("m_uvm_noop_phases", run_comp.__dict__)
+        comp = run_comp("noop_run", None)
+        self.assertFalse(comp.m_is_noop_phase_method("run_phase"))
+        self.assertTrue(comp.m_is_noop_phase_method("main_phase"))
+        self.assertTrue(comp.m_is_noop_phase_method("phase_started"))
+
+        # Not registered: examined on first use
+        comp = connect_comp("noop_connect", None)
+        self.assertFalse(comp.m_is_noop_phase_method("connect_phase"))
+        self.assertFalse(comp.m_is_noop_phase_method("phase_started"))
+        self.assertTrue(comp.m_is_noop_phase_method("check_phase"))
+
+        # build_phase and custom phase methods are never skipped
+        self.assertFalse(comp.m_is_noop_phase_method("build_phase"))
+        self.assertFalse(comp.m_is_noop_phase_method(None))
+
+    def test_skip_noop_callbacks(self):
+        env = uvm_component("skip_env", None)
+        a = connect_comp("a", env)
+        uvm_component("b", env)
+        phase = stub_phase("connect")
+
+        for state in (uvm_phase_state.UVM_PHASE_STARTED,
+                uvm_phase_state.UVM_PHASE_EXECUTING,
+                uvm_phase_state.UVM_PHASE_READY_TO_END,
+                uvm_phase_state.UVM_PHASE_ENDED):
+            uvm_connect_phase.get().traverse(env, phase, state)
+
+        self.assertEqual(a.calls, ["started", "connect"])
+        self.assertIsNone(a.m_current_phase)
+
+    def test_fork_only_real_tasks(self):
+        env = uvm_component("fork_env", None)
+        run_comp("a", env)
+        uvm_component("b", env)
+        connect_comp("c", env)
+        ph = fork_recorder_phase("fork_run")
+
+        ph.traverse(env, stub_phase("run"), uvm_phase_state.UVM_PHASE_EXECUTING)
+
+        self.assertEqual(ph.forked, ["a"])
+
+    def test_phase_topology(self):
+        domain = uvm_domain("topo_dom")
+        domain.add(uvm_build_phase.get())
+        domain.add(uvm_run_phase.get())
+        domain.add(uvm_extract_phase.get())
+        build = domain.find(uvm_build_phase.get())
+        run = domain.find(uvm_run_phase.get())
+        self.assertEqual(build.get_full_name(), "topo_dom.build")
+        self.assertTrue(build.is_before(uvm_run_phase.get()))
+        self.assertFalse(build.is_before(uvm_build_phase.get()))
+
+        # The compiled topology is shared until the graph changes
+        topo = build.m_get_topology()
+        self.assertIs(run.m_get_topology(), topo)
+
+        sched = uvm_phase("topo_sched", uvm_phase_type.UVM_PHASE_SCHEDULE)
+        sched.add(uvm_reset_phase.get())
+        sched.add(uvm_main_phase.get())
+        sched.add(uvm_shutdown_phase.get())
+        domain.add(sched, with_phase=uvm_run_phase.get())
+        self.assertIsNot(build.m_get_topology(), topo)
+
+        other = uvm_domain("topo_dom_other")
+        other.add(uvm_main_phase.get())
+        domain.add(other, with_phase=uvm_run_phase.get())
+
+        reset = sched.find(uvm_reset_phase.get())
+        main = sched.find(uvm_main_phase.get())
+        other_main = other.find(uvm_main_phase.get())
+        self.assertEqual(main.get_full_name(), "topo_dom.topo_sched.main")
+        self.assertIs(main.get_schedule(), sched)
+        self.assertIs(main.get_domain(), domain)
+        self.assertEqual(other_main.get_full_name(), "topo_dom_other.main")
+
+        self.assertTrue(reset.is_before(uvm_main_phase.get()))
+        self.assertTrue(main.is_after(uvm_build_phase.get()))
+        self.assertTrue(main.is_before(uvm_extract_phase.get()))
+        self.assertFalse(main.is_before(uvm_reset_phase.get()))
+        self.assertFalse(run.is_before(uvm_main_phase.get()))
+
+        # Scoped lookups stay within the schedule or domain of the origin
+        self.assertIs(reset.find(uvm_main_phase.get()), main)
+        self.assertIs(main.find_by_name("reset"), reset)
+        self.assertIs(main.find_by_name("build"), build)
+        self.assertIsNone(main.find_by_name("no_such_phase"))
+        self.assertIsNone(other_main.find(uvm_reset_phase.get()))
+
+        succ = []
+        build.get_adjacent_successor_nodes(succ)
+        self.assertEqual(set(succ), set([run, reset, other_main]))
+
+    def test_pred_latch(self):
+        top = uvm_coreservice_t.get().get_root()
+        done = uvm_phase_state.UVM_PHASE_DONE
+        domain = uvm_domain("latch_dom")
+        domain.add(uvm_build_phase.get())
+        domain.add(uvm_run_phase.get())
+        sched = uvm_phase("latch_sched", uvm_phase_type.UVM_PHASE_SCHEDULE)
+        sched.add(uvm_main_phase.get())
+        domain.add(sched, with_phase=uvm_run_phase.get())
+        domain.add(uvm_extract_phase.get())
+
+        build = domain.find(uvm_build_phase.get())
+        run = domain.find(uvm_run_phase.get())
+        extract = domain.find(uvm_extract_phase.get())
+        sched_end = sched.m_end_node
+
+        queue = domain.m_ready_queue
+
+        # build fans out to run and the schedule, both released at once
+        build.m_set_state(done)
+        build.m_schedule_successors(top)
+        self.assertEqual(set(queue.data), set([run, sched]))
+        self.assertEqual(run.get_state(), uvm_phase_state.UVM_PHASE_SCHEDULED)
+
+        # extract joins run and the schedule; only the last one releases it
+        queue.data.clear()
+        run.m_set_state(done)
+        run.m_schedule_successors(top)
+        self.assertEqual(queue.data, [])
+        self.assertEqual(extract.m_pred_latch, 1)
+        sched_end.m_set_state(done)
+        sched_end.m_schedule_successors(top)
+        self.assertEqual(queue.data, [extract])
+        self.assertEqual(extract.m_pred_latch, -1)
+
+        # Predecessors already DONE (e.g. jumped over) are not waited for
+        extract.m_set_state(uvm_phase_state.UVM_PHASE_DORMANT)
+        self.assertTrue(extract.m_pred_done())
+
+    def test_pred_barrier(self):
+        state = uvm_phase_state
+        domain = uvm_domain("rte_dom")
+        domain.add(uvm_build_phase.get())
+        domain.add(uvm_connect_phase.get(), with_phase=uvm_build_phase.get())
+        domain.add(uvm_check_phase.get(), with_phase=uvm_build_phase.get())
+        domain.add(uvm_extract_phase.get())
+        (build, connect, check) = [domain.find(imp) for imp in (uvm_build_phase.get(),
+            uvm_connect_phase.get(), uvm_check_phase.get())]
+
+        # One barrier over the siblings not yet READY_TO_END
+        check.m_set_state(state.UVM_PHASE_ENDED)
+        connect.m_set_state(state.UVM_PHASE_EXECUTING)
+        barrier = build.m_get_pred_barrier()
+        self.assertEqual(barrier.get_count(), 1)
+        self.assertIsNone(check.m_rte_waiters)
+
+        connect.m_set_state(state.UVM_PHASE_READY_TO_END)
+        self.assertEqual(barrier.get_count(), 0)
+        self.assertIsNone(connect.m_rte_waiters)
+        self.assertIsNone(build.m_get_pred_barrier())
+
+    def test_countdown_barrier(self):
+        barrier = CountdownBarrier()
+        a = barrier.m_enter()
+        b = barrier.m_enter()
+        self.assertEqual(barrier.get_count(), 2)
+
+        # A single trigger, fired by the last process to return
+        barrier.m_ev = ev = cocotb.triggers.Event()
+        barrier.m_exit(a)
+        self.assertFalse(ev.is_set())
+        barrier.m_exit(b)
+        self.assertTrue(ev.is_set())
+        self.assertEqual(barrier.get_count(), 0)
+
+    def test_countdown_barrier_kill(self):
+        barrier = CountdownBarrier()
+        resumed = []
+        release = Event()
+        procs = []
+
+        async def body(name):
+            await release.wait()
+            resumed.append(name)
+
+        async def done():
+            pass
+
+        def start():
+            procs.append(barrier.fork(body("a")))
+            procs.append(barrier.fork(body("b")))
+            procs.append(barrier.fork(done()))
+
+        with running_scheduler(start):
+            # Processes that have already returned are not counted
+            self.assertEqual(barrier.get_count(), 2)
+            self.assertTrue(procs[2].done())
+
+            # kill() releases waiters and stops the processes themselves
+            barrier.m_ev = ev = cocotb.triggers.Event()
+            procs[0].kill()
+            self.assertEqual(barrier.get_count(), 1)
+            self.assertFalse(ev.is_set())
+            barrier.kill()
+            self.assertTrue(ev.is_set())
+            self.assertEqual(barrier.get_count(), 0)
+            self.assertTrue(procs[1].done())
+
+            release.set()
+            self.assertEqual(resumed, [])
+            release.clear()
+
+            # Returning processes count down the barrier
+            procs.append(barrier.fork(body("c")))
+            self.assertEqual(barrier.get_count(), 1)
+            release.set()
+            self.assertEqual(resumed, ["c"])
+            self.assertEqual(barrier.get_count(), 0)
+
+    def test_phase_profiler(self):
+        env = uvm_component("prof_env", None)
+        connect_comp("a", env)
+        uvm_component("b", env)
+        self.assertIsNone(uvm_phase_profiler.get())
+
+        profiler = uvm_phase_profiler.enable()
+        try:
+            self.assertIs(uvm_phase_profiler.enable(), profiler)
+            uvm_connect_phase.get().traverse(env, stub_phase("connect"),
+                uvm_phase_state.UVM_PHASE_EXECUTING)
+            profiler.record_task(stub_phase("run"), env, 0, 10**12, 100, 600)
+
+            data = profiler.to_dict()
+            self.assertEqual([(c["phase"], c["component"]) for c in data["components"]],
+                [("common.run", "prof_env"), ("common.connect", "prof_env.a")])
+            run = data["phases"][0]
+            self.assertEqual((run["phase"], run["task"], run["sim_ns"]), ("common.run", True, 500))
+
+            trace = json.loads(json.dumps(profiler.get_trace()))
+            spans = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+            self.assertEqual(len(spans), 2)
+            self.assertEqual(spans[1]["ts"], 0.1)
+            self.assertIn("prof_env.a", profiler.convert2string())
+        finally:
+            uvm_phase_profiler.disable()
+        self.assertIsNone(uvm_phase_profiler.get())
+
+    def test_sync_barrier(self):
+        syncing = uvm_phase_state.UVM_PHASE_SYNCING
+        domains = []
+        for name in ("sync_a", "sync_b", "sync_c"):
+            domain = uvm_domain(name)
+            domain.add(uvm_reset_phase.get())
+            domain.add(uvm_main_phase.get())
+            domains.append(domain)
+        (a, b, c) = domains
+        a.sync(b)
+        a.sync(c, uvm_main_phase.get())
+
+        a_reset = a.find(uvm_reset_phase.get())
+        b_reset = b.find(uvm_reset_phase.get())
+        mains = [d.find(uvm_main_phase.get()) for d in domains]
+        self.assertEqual(a_reset.m_sync, [b_reset])
+        self.assertIs(a_reset.m_sync_barrier, b_reset.m_sync_barrier)
+        self.assertIsNot(a_reset.m_sync_barrier, mains[0].m_sync_barrier)
+
+        # One shared barrier per group, released by its last member
+        barrier = mains[0].m_sync_barrier
+        self.assertEqual(len(barrier.m_members), 3)
+        for main in mains:
+            self.assertIs(main.m_sync_barrier, barrier)
+            self.assertFalse(barrier.is_released())
+            main.m_set_state(syncing)
+        self.assertTrue(barrier.is_released())
+        mains[1].m_set_state(uvm_phase_state.UVM_PHASE_DORMANT)
+        self.assertFalse(barrier.is_released())
+
+        # Breaking a group rebuilds the barriers of what is left
+        a.unsync(c, uvm_main_phase.get())
+        self.assertIsNone(mains[2].m_sync_barrier)
+        self.assertIsNot(mains[0].m_sync_barrier, barrier)
+        self.assertEqual(mains[0].m_sync_barrier.m_members, [mains[0], mains[1]])
+        mains[1].m_set_state(syncing)
+        self.assertTrue(mains[0].m_sync_barrier.is_released())
+
+        a.unsync(b)
+        self.assertIsNone(a_reset.m_sync_barrier)
+        self.assertIsNone(mains[1].m_sync_barrier)
+
+    def test_jump(self):
+        state = uvm_phase_state
+        domain = uvm_domain("jump_dom")
+        sched = uvm_phase("jump_sched", uvm_phase_type.UVM_PHASE_SCHEDULE)
+        sched.add(uvm_reset_phase.get())
+        sched.add(uvm_main_phase.get())
+        sched.add(uvm_shutdown_phase.get())
+        domain.add(sched)
+        (reset, main, shutdown) = [sched.find(imp) for imp in (uvm_reset_phase.get(),
+            uvm_main_phase.get(), uvm_shutdown_phase.get())]
+
+        # Precomputed clear sets stop at the end node of a forward jump
+        topo = main.m_get_topology()
+        self.assertEqual(topo.get_clear_set(reset, main), [reset])
+        self.assertIs(topo.get_clear_set(reset, main), topo.get_clear_set(reset, main))
+        self.assertEqual(topo.get_clear_set(main, None)[:2], [main, shutdown])
+        self.assertEqual(topo.get_successors(domain)[-1], domain.m_end_node)
+
+        for node in (sched, reset, main):
+            node.m_set_state(state.UVM_PHASE_DONE)
+        shutdown.m_set_state(state.UVM_PHASE_EXECUTING)
+        shutdown.m_pred_latch = 0
+
+        # Only active nodes of the domain take part in a domain jump
+        domain.jump(uvm_reset_phase.get())
+        self.assertIs(shutdown.get_jump_target(), reset)
+        self.assertTrue(shutdown.m_jump_bkwd)
+        self.assertTrue(shutdown.m_premature_end)
+        self.assertIsNone(main.get_jump_target())
+
+        uvm_phase.clear_jump_trace()
+        shutdown.m_finish_jump(10)
+        self.assertEqual(domain.m_ready_queue.data, [reset])
+
+        self.assertEqual(reset.get_state(), state.UVM_PHASE_SCHEDULED)
+        self.assertEqual(main.get_state(), state.UVM_PHASE_DORMANT)
+        self.assertEqual(shutdown.m_pred_latch, -1)
+        self.assertIsNone(shutdown.get_jump_target())
+        trace = uvm_phase.get_jump_trace()
+        self.assertEqual(len(trace), 1)
+        self.assertEqual(trace[0][:4], (10, "jump_dom.jump_sched.shutdown",
+            "jump_dom.jump_sched.reset", "backward"))
+
+        # Forward jumps mark the skipped nodes DONE
+        reset.m_set_state(state.UVM_PHASE_EXECUTING)
+        reset.set_jump_phase(uvm_shutdown_phase.get())
+        self.assertTrue(reset.m_jump_fwd)
+        reset.m_finish_jump(20)
+        self.assertEqual(reset.get_state(), state.UVM_PHASE_DONE)
+        self.assertEqual(main.get_state(), state.UVM_PHASE_DONE)
+        self.assertEqual(shutdown.get_state(), state.UVM_PHASE_SCHEDULED)
+        self.assertEqual(uvm_phase.get_jump_trace()[-1][3], "forward")
+
+    def test_jump_waits_for_predecessors(self):
+        state = uvm_phase_state
+        top = uvm_coreservice_t.get().get_root()
+        domain = uvm_domain("jump_pred_dom")
+        domain.add(uvm_build_phase.get())
+        domain.add(uvm_run_phase.get())
+        sched = uvm_phase("jump_pred_sched", uvm_phase_type.UVM_PHASE_SCHEDULE)
+        sched.add(uvm_reset_phase.get())
+        sched.add(uvm_main_phase.get())
+        domain.add(sched, with_phase=uvm_run_phase.get())
+        domain.add(uvm_extract_phase.get())
+        (build, run, reset, extract) = [domain.find(imp) for imp in (uvm_build_phase.get(),
+            uvm_run_phase.get(), uvm_reset_phase.get(), uvm_extract_phase.get())]
+
+        build.m_set_state(state.UVM_PHASE_DONE)
+        sched.m_set_state(state.UVM_PHASE_DONE)
+        run.m_set_state(state.UVM_PHASE_EXECUTING)
+        reset.m_set_state(state.UVM_PHASE_EXECUTING)
+
+        # The schedule is skipped, but run, in parallel with it, still holds
+        # back the jump target
+        queue = domain.m_ready_queue
+        reset.set_jump_phase(uvm_extract_phase.get())
+        reset.m_finish_jump(0)
+        self.assertEqual(sched.m_end_node.get_state(), state.UVM_PHASE_DONE)
+        self.assertEqual(queue.data, [])
+        self.assertEqual(extract.get_state(), state.UVM_PHASE_DORMANT)
+        self.assertEqual(extract.m_pred_latch, 1)
+
+        run.m_set_state(state.UVM_PHASE_DONE)
+        run.m_schedule_successors(top)
+        self.assertEqual(queue.data, [extract])
+        self.assertEqual(extract.get_state(), state.UVM_PHASE_SCHEDULED)
+
+    def test_domain_ready_queues(self):
+        a = uvm_domain("queue_a")
+        a.add(uvm_main_phase.get())
+        b = uvm_domain("queue_b")
+        b.add(uvm_main_phase.get())
+        self.assertIsNot(a.m_ready_queue, b.m_ready_queue)
+
+        # Nodes go to the queue of their own domain; drivers only start
+        # once phasing runs
+        a_main = a.find(uvm_main_phase.get())
+        uvm_phase.m_schedule(a_main)
+        self.assertEqual(a.m_ready_queue.data, [a_main])
+        self.assertEqual(b.m_ready_queue.data, [])
+        self.assertIsNone(a.m_driver)
+        self.assertEqual(a_main.get_state(), uvm_phase_state.UVM_PHASE_SCHEDULED)
+
+        # Nodes outside of any domain share the hopper
+        sched = uvm_phase("queue_sched", uvm_phase_type.UVM_PHASE_SCHEDULE)
+        sched.add(uvm_main_phase.get())
+        hopper = uvm_phase.m_phase_hopper
+        uvm_phase.m_phase_hopper = Mailbox()
+        try:
+            uvm_phase.m_schedule(sched)
+            self.assertEqual(uvm_phase.m_phase_hopper.data, [sched])
+        finally:
+            uvm_phase.m_phase_hopper = hopper
+
+    def test_run_domains(self):
+        state = uvm_phase_state
+        domains = []
+        for name in ("run_a", "run_b"):
+            domain = uvm_domain(name)
+            domain.add(uvm_reset_phase.get())
+            domain.add(uvm_main_phase.get())
+            domains.append(domain)
+        (a, b) = domains
+        a.sync(b, uvm_main_phase.get())
+        (a_reset, a_main) = [a.find(imp) for imp in (uvm_reset_phase.get(), uvm_main_phase.get())]
+        b_main = b.find(uvm_main_phase.get())
+
+        ca = sched_comp("run_ca", None)
+        ca.m_domain = a
+        ca.jumps = 1
+        cb = sched_comp("run_cb", None)
+        cb.m_domain = b
+        cb.hold_reset = Event()
+
+        def start():
+            uvm_phase.m_running = True
+            uvm_phase.m_schedule(a)
+            uvm_phase.m_schedule(b)
+
+        # The phases are driven by pure-Python triggers only. The jump
+        # trace is stamped with simulation time, which stays 0.
+        uvm_phase.clear_jump_trace()
+        with mock.patch("uvm.base.phase.get_sim_time", return_value=0), \
+                running_scheduler(start):
+            try:
+                # a waits at the sync point until b has reset
+                self.assertEqual(a_reset.get_state(), state.UVM_PHASE_DONE)
+                self.assertEqual(a_main.get_state(), state.UVM_PHASE_SYNCING)
+                self.assertEqual(ca.calls, ["reset"])
+                self.assertEqual(cb.calls, ["reset"])
+
+                cb.hold_reset.set()
+                self.assertEqual(a_main.get_state(), state.UVM_PHASE_EXECUTING)
+                self.assertEqual(b_main.get_state(), state.UVM_PHASE_EXECUTING)
+                self.assertEqual(a_main.m_task_procs.get_count(), 1)
+                self.assertEqual(b_main.m_task_procs.get_count(), 1)
+
+                # The backward jump kills the process that requested it and
+                # runs reset and main of a again, while b stays in main
+                ca.release_main.set()
+                self.assertEqual(ca.calls, ["reset", "main", "reset", "main"])
+                self.assertEqual(a_reset.m_run_count, 2)
+                self.assertEqual(a_main.get_state(), state.UVM_PHASE_EXECUTING)
+                self.assertEqual(b_main.get_state(), state.UVM_PHASE_EXECUTING)
+                trace = uvm_phase.get_jump_trace()
+                self.assertEqual(len(trace), 1)
+                self.assertEqual(trace[0][1:4], ("run_a.main", "run_a.reset", "backward"))
+
+                # The process that requested the jump was killed with it
+                ca.after_jump.set()
+                self.assertEqual(ca.calls, ["reset", "main", "reset", "main"])
+
+                # Both domains end once their processes have returned
+                ca.release_main.set()
+                self.assertEqual(b_main.get_state(), state.UVM_PHASE_EXECUTING)
+                cb.release_main.set()
+                for domain in domains:
+                    self.assertEqual(domain.m_end_node.get_state(), state.UVM_PHASE_DONE)
+                self.assertEqual(a_main.m_run_count, 2)
+                self.assertEqual(b_main.m_run_count, 1)
+                self.assertEqual(a_main.m_task_procs.get_count(), 0)
+                self.assertEqual(cb.calls, ["reset", "main"])
+            finally:
+                uvm_phase.m_stop_drivers()